@@ -3,7 +3,6 @@
 # dependencies = [
 #     "marimo",
 #     "anytree",
-#     "beautifulsoup4",
 #     "networkx",
 #     "pydantic",
 #     "pyyaml",
@@ -71,10 +70,11 @@ async def _():
         ModuleScanConfig,
         ModulesCollectorConfig,
     )
-    from pda.models import module_pyvis_converter
+    from pda.models import CollapsePyramid, module_pyvis_converter
 
     root_module_name = "pda"
     return (
+        CollapsePyramid,
         MAX_COLLAPSE_LEVEL,
         MAX_DEPTH,
         ModuleImportsAnalyzer,
@@ -152,11 +152,11 @@ def _(MAX_COLLAPSE_LEVEL: "Final[int]", MAX_DEPTH: "Final[int]", is_restricted,
 
 @app.cell(hide_code=True)
 def _(
+    CollapsePyramid,
     ModuleImportsAnalyzer,
     ModuleImportsAnalyzerConfig,
     ModuleResolutionConfig,
     ModuleScanConfig,
-    import_collapse_level,
     import_external_depth,
     import_hide_private,
     import_hide_unavailable,
@@ -165,7 +165,6 @@ def _(
     import_unify_nodes,
     is_restricted,
     project_src,
-    render_graph,
     root_module_name,
 ):
     import_config = ModuleImportsAnalyzerConfig(
@@ -177,7 +176,6 @@ def _(
         ),
         unify_nodes=import_unify_nodes.value,
         qualified_names=import_qualified_names.value,
-        collapse_level=import_collapse_level.value,
         resolution=ModuleResolutionConfig(include_sys_path=not is_restricted),
     )
     import_analyzer = ModuleImportsAnalyzer(
@@ -185,7 +183,18 @@ def _(
         project_root=project_src,
         root_module_name=root_module_name,
     )
-    import_graph = import_analyzer(project_src / root_module_name)
+    import_pyramid = CollapsePyramid(
+        import_analyzer(project_src / root_module_name),
+        qualified_name=import_config.qualified_names,
+        sort_method=import_config.sort_method,
+    )
+    return (import_pyramid,)
+
+
+@app.cell(hide_code=True)
+def _(import_collapse_level, import_pyramid, render_graph):
+    import_graph = import_pyramid[import_collapse_level.value]
+    import_graph.annotate_cycles()
 
     render_graph(import_graph)
     return (import_graph,)
@@ -257,11 +266,11 @@ def _(collect_external_depth, collect_stdlib_depth, mo):
 
 @app.cell(hide_code=True)
 def _(
+    CollapsePyramid,
     ModuleScanConfig,
     ModuleResolutionConfig,
     ModulesCollector,
     ModulesCollectorConfig,
-    collect_collapse_level,
     collect_external_depth,
     collect_hide_private,
     collect_hide_unavailable,
@@ -269,7 +278,6 @@ def _(
     collect_stdlib_depth,
     is_restricted,
     project_src,
-    render_graph,
     root_module_name,
 ):
     collect_config = ModulesCollectorConfig(
@@ -280,7 +288,6 @@ def _(
             hide_unavailable=collect_hide_unavailable.value,
         ),
         qualified_names=collect_qualified_names.value,
-        collapse_level=collect_collapse_level.value,
         resolution=ModuleResolutionConfig(include_sys_path=not is_restricted),
     )
     collector = ModulesCollector(
@@ -288,9 +295,17 @@ def _(
         project_root=project_src,
         root_module_name=root_module_name,
     )
-    modules_graph = collector()
+    modules_pyramid = CollapsePyramid(
+        collector(),
+        qualified_name=collect_config.qualified_names,
+        sort_method="auto",
+    )
+    return (modules_pyramid,)
 
-    render_graph(modules_graph)
+
+@app.cell(hide_code=True)
+def _(collect_collapse_level, modules_pyramid, render_graph):
+    render_graph(modules_pyramid[collect_collapse_level.value])
     return
 
 
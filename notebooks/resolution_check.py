@@ -2,7 +2,6 @@
 # requires-python = ">=3.13"
 # dependencies = [
 #     "anytree",
-#     "beautifulsoup4",
 #     "marimo",
 #     "networkx",
 #     "pydantic",
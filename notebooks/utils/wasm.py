@@ -6,7 +6,7 @@ import zipfile
 from pathlib import Path
 from typing import Dict, Mapping
 
-WASM_DEPENDENCIES = ("anytree", "beautifulsoup4", "networkx", "pydantic", "pyyaml", "pyvis")
+WASM_DEPENDENCIES = ("anytree", "networkx", "pydantic", "pyyaml", "pyvis")
 BUNDLE_NAME = "pda-bundle.zip"
 BUNDLE_ROOT = Path("/app")
 
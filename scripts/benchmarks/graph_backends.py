@@ -0,0 +1,74 @@
+"""
+Compare the time and peak memory of the graph backends over the whole pipeline an
+analysis goes through: building a synthetic module graph, sorting it, annotating its
+cycles and exporting it.
+
+    python scripts/benchmarks/graph_backends.py --nodes 100000 --edges 400000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+from pda.config import GraphBackendType
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+
+def _nodes(count: int) -> List[ModuleNode]:
+    nodes = []
+    for index in range(count):
+        name = f"pkg{index % 100}.module{index}"
+        module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+        nodes.append(ModuleNode(module, qualified_name=True))
+
+    return nodes
+
+
+def _edges(count: int, edges: int, seed: int) -> List[Tuple[int, int]]:
+    generator = random.Random(seed)
+    return [(generator.randrange(count), generator.randrange(count)) for _ in range(edges)]
+
+
+def _measure(
+    backend: GraphBackendType,
+    nodes: List[ModuleNode],
+    edges: List[Tuple[int, int]],
+    output: Path,
+) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = ModuleGraph(backend=backend)
+    for source, target in edges:
+        graph.add_edge(nodes[source], nodes[target])
+
+    graph.sort(method="auto")
+    graph.annotate_cycles()
+    graph.save(output, indent=None)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    nodes = _nodes(args.nodes)
+    edges = _edges(args.nodes, args.edges, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in ("networkx", "compact"):
+            elapsed, peak = _measure(backend, nodes, edges, Path(directory) / f"{backend}.json")
+            print(f"{backend:>8}: {elapsed:7.2f} s, peak {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compare the frontier-based longest path leveling with the per-node predecessor scan it
+replaced, on a generated DAG.
+
+    python scripts/benchmarks/leveling.py --nodes 100000 --edges 400000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+import networkx as nx
+
+from pda.structures.graph.leveling import graph_levels
+
+
+def _dag(nodes: int, edges: int, seed: int) -> nx.DiGraph:
+    generator = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(nodes))
+    for _ in range(edges):
+        source, target = sorted(generator.sample(range(nodes), 2))
+        graph.add_edge(source, target)
+
+    return graph
+
+
+def _predecessor_scan(graph: nx.DiGraph) -> Dict[int, int]:
+    levels: Dict[int, int] = {}
+    roots: List[int] = []
+    for node in graph.nodes():
+        levels[node] = 0
+        if graph.in_degree(node) == 0:
+            roots.append(node)
+
+    for node in nx.topological_sort(graph):
+        if node in roots:
+            continue
+
+        levels[node] = max(levels[predecessor] for predecessor in graph.predecessors(node)) + 1
+
+    return levels
+
+
+def _measure(function: Callable[[nx.DiGraph], Dict[int, int]], graph: nx.DiGraph) -> float:
+    start = time.perf_counter()
+    function(graph)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = _dag(args.nodes, args.edges, args.seed)
+    assert graph_levels(graph) == _predecessor_scan(graph)
+    for name, function in (("networkx", _predecessor_scan), ("frontier", graph_levels)):
+        print(f"{name:>8}: {_measure(function, graph):7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
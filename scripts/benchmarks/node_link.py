@@ -0,0 +1,74 @@
+"""
+Compare writing a synthetic module graph through ``to_dict`` and ``json.dump`` with the
+streaming ``Graph.save``, indented and compact.
+
+    python scripts/benchmarks/node_link.py --nodes 100000 --edges 400000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+
+def _graph(count: int, edges: int, seed: int) -> ModuleGraph:
+    generator = random.Random(seed)
+    nodes = []
+    for index in range(count):
+        name = f"pkg{index % 100}.module{index}"
+        module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+        nodes.append(ModuleNode(module, qualified_name=True))
+
+    graph = ModuleGraph()
+    for _ in range(edges):
+        graph.add_edge(nodes[generator.randrange(count)], nodes[generator.randrange(count)])
+
+    return graph
+
+
+def _dump(graph: ModuleGraph, filepath: Path) -> None:
+    with open(filepath, "w", encoding="utf-8") as file:
+        json.dump(graph.to_dict(), file, indent=2)
+
+
+def _measure(write: Callable[[ModuleGraph, Path], None], graph: ModuleGraph, filepath: Path) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    write(graph, filepath)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = _graph(args.nodes, args.edges, args.seed)
+    writers = (
+        ("json.dump", "dump.json", _dump),
+        ("indented", "indented.json", lambda graph, filepath: graph.save(filepath)),
+        ("compact", "compact.json", lambda graph, filepath: graph.save(filepath, indent=None)),
+        ("gzip", "compact.json.gz", lambda graph, filepath: graph.save(filepath, indent=None)),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for name, filename, write in writers:
+            filepath = Path(directory) / filename
+            elapsed, peak = _measure(write, graph, filepath)
+            size = filepath.stat().st_size
+            print(f"{name:>9}: {elapsed:7.2f} s, peak {peak / 2**20:8.1f} MiB, {size / 2**20:8.1f} MiB on disk")
+
+
+if __name__ == "__main__":
+    main()
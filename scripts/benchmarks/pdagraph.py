@@ -0,0 +1,70 @@
+"""
+Compare saving and reopening a synthetic module graph as compact node-link JSON and in the
+memory-mapped pdagraph format: the time to open it, to look up one node and its edges,
+and to visit every edge.
+
+    python scripts/benchmarks/pdagraph.py --nodes 500000 --edges 2000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Tuple, TypeVar
+
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+T = TypeVar("T")
+
+
+def _graph(count: int, edges: int, seed: int) -> ModuleGraph:
+    generator = random.Random(seed)
+    nodes = []
+    for index in range(count):
+        name = f"pkg{index % 100}.module{index}"
+        module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+        nodes.append(ModuleNode(module, qualified_name=True))
+
+    graph = ModuleGraph(backend="compact")
+    for _ in range(edges):
+        graph.add_edge(nodes[generator.randrange(count)], nodes[generator.randrange(count)])
+
+    return graph
+
+
+def _timed(function: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = _graph(args.nodes, args.edges, args.seed)
+    probe = next(iter(graph))
+    with tempfile.TemporaryDirectory() as directory:
+        formats = (
+            ("json", Path(directory) / "graph.json", lambda filepath: graph.save(filepath, indent=None)),
+            ("pdagraph", Path(directory) / "graph.pdagraph", graph.save_binary),
+        )
+        for name, filepath, save in formats:
+            _, saved = _timed(lambda: save(filepath))
+            loaded, opened = _timed(lambda: ModuleGraph.load(filepath))
+            _, lookup = _timed(lambda: (loaded.has_node(probe), loaded.has_edge(probe, probe)))
+            _, visited = _timed(lambda: sum(1 for _ in loaded._backend.edges()))
+            size = filepath.stat().st_size
+            print(
+                f"{name:>8}: save {saved:6.2f} s, open {opened:8.4f} s, lookup {lookup:8.4f} s, "
+                f"all edges {visited:6.2f} s, {size / 2**20:8.1f} MiB on disk"
+            )
+
+
+if __name__ == "__main__":
+    main()
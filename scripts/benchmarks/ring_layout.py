@@ -0,0 +1,66 @@
+"""
+Time the package-ring layout of a synthetic module graph whose modules are spread over a
+few levels of nested packages, with and without the repulsion pass, and the layout of the
+same graph again from a snapshot of the first.
+
+    python scripts/benchmarks/ring_layout.py --nodes 5000 --edges 15000 --repulsion 1.0
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Tuple, TypeVar
+
+from pda.config import LayoutConfig, RingConfig
+from pda.models import ModuleGraph, ModuleNode, PackageRingLayout, RingLayoutSnapshot
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+T = TypeVar("T")
+
+
+def _graph(count: int, edges: int, seed: int) -> ModuleGraph:
+    generator = random.Random(seed)
+    nodes = []
+    for index in range(count):
+        name = f"pkg.sub{index % 20}.part{index % 7}.module{index}"
+        module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+        node = ModuleNode(module, qualified_name=True)
+        node.level = generator.randrange(8)
+        nodes.append(node)
+
+    graph = ModuleGraph()
+    for node in nodes:
+        graph.add_node(node)
+
+    for _ in range(edges):
+        graph.add_edge(nodes[generator.randrange(count)], nodes[generator.randrange(count)])
+
+    return graph
+
+
+def _timed(function: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=5_000)
+    parser.add_argument("--edges", type=int, default=15_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repulsion", type=float, default=1.0)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    graph = _graph(args.nodes, args.edges, args.seed)
+    for repulsion in (0.0, args.repulsion):
+        ring = RingConfig(repulsion=repulsion, repulsion_iterations=args.iterations)
+        layout = PackageRingLayout(LayoutConfig(mode="package_ring", ring=ring), snapshot=RingLayoutSnapshot())
+        _, elapsed = _timed(lambda: layout.compute(graph))
+        _, reused = _timed(lambda: layout.compute(graph))
+        print(f"repulsion {repulsion:4.2f}: {elapsed:6.2f} s for {len(graph)} modules, {reused:6.2f} s from a snapshot")
+
+
+if __name__ == "__main__":
+    main()
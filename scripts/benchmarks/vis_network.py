@@ -0,0 +1,68 @@
+"""
+Time the HTML export of a synthetic module graph: building the vis-network node and edge
+arrays, rendering the page from them, and the same page produced through pyvis.
+
+    python scripts/benchmarks/vis_network.py --nodes 20000 --edges 50000
+"""
+
+import argparse
+import random
+import time
+import warnings
+from typing import Callable, Tuple, TypeVar, get_args
+
+from pda.config import LayoutMode
+from pda.models import ModuleGraph, ModuleNode, module_pyvis_converter
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+T = TypeVar("T")
+
+
+def _graph(count: int, edges: int, seed: int) -> ModuleGraph:
+    generator = random.Random(seed)
+    nodes = []
+    for index in range(count):
+        name = f"pkg{index % 100}.module{index}"
+        module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+        nodes.append(ModuleNode(module, qualified_name=True))
+
+    graph = ModuleGraph()
+    for _ in range(edges):
+        graph.add_edge(nodes[generator.randrange(count)], nodes[generator.randrange(count)])
+
+    graph.sort()
+    return graph
+
+
+def _timed(function: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--layout", choices=get_args(LayoutMode), default="hierarchical")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    graph = _graph(args.nodes, args.edges, args.seed)
+    converter = module_pyvis_converter(layout=args.layout)
+    layout = converter.layout
+    result, placed = _timed(lambda: layout.compute(graph) if layout is not None else None)
+
+    data, arrays = _timed(lambda: converter.network_data(graph, result))
+    html, rendered = _timed(lambda: converter.render_html(data))
+    _, pyvis = _timed(lambda: converter.to_html(converter(graph)))
+    print(f"{len(data.nodes)} nodes, {len(data.edges)} edges, {len(html) / 2**20:.1f} MiB of HTML")
+    print(f"  layout: {placed:6.2f} s")
+    print(f"  arrays: {arrays:6.2f} s ({arrays / (len(data.nodes) + len(data.edges)) * 1e6:.2f} us per element)")
+    print(f"    page: {rendered:6.2f} s")
+    print(f"   pyvis: {pyvis:6.2f} s (layout, arrays and page)")
+
+
+if __name__ == "__main__":
+    main()
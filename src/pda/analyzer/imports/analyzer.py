@@ -4,6 +4,7 @@ from collections import deque
 from pathlib import Path
 from typing import (
     Deque,
+    Dict,
     FrozenSet,
     Iterable,
     List,
@@ -18,14 +19,14 @@ from typing import (
 
 from pda.analyzer.base import BaseAnalyzer
 from pda.analyzer.depth import CategoryContext, CategoryDepthPolicy
-from pda.analyzer.imports.parser import ImportStatementParser
+from pda.analyzer.imports.parser import BytecodeImportParser, ImportStatementParser
 from pda.analyzer.imports.report import build_cycle_report, format_cycle_report
 from pda.analyzer.imports.resolver import ImportResolver
 from pda.analyzer.lazy import lazy_execution
 from pda.analyzer.target import AnalysisTarget
 from pda.config import ModuleImportsAnalyzerConfig
 from pda.exceptions import PDADependencyCycleError
-from pda.models import ModuleGraph, ModuleNode, gather_python_files
+from pda.models import ModuleGraph, ModuleNode, ModuleTree, gather_python_files
 from pda.resolution import ProjectResolutionContext
 from pda.specification import (
     CategorizedModule,
@@ -39,6 +40,7 @@ from pda.specification import (
     OriginType,
 )
 from pda.structures import OrderedSet
+from pda.structures.graph.incremental import IncrementalCycleDetector
 from pda.tools.logger import logger
 from pda.types import Pathlike
 
@@ -49,6 +51,7 @@ class PendingNode(NamedTuple):
     node: ModuleNode
     depth: int
     context: CategoryContext
+    parent: Optional[ModuleNode] = None
 
 
 class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGraph]):
@@ -80,8 +83,11 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
         self._files: Optional[List[Path]] = None
         self._root_origins: FrozenSet[Optional[Path]] = frozenset()
         self._collection: ModulesCollection = ModulesCollection(allow_unavailable=True)
-        self._graph: ModuleGraph = ModuleGraph()
-        self._parser: ImportStatementParser = ImportStatementParser()
+        self._graph: ModuleGraph = ModuleGraph(backend=config.graph_backend)
+        self._nodes: Dict[str, ModuleNode] = {}
+        self._tree: Optional[ModuleTree] = self._create_tree(config)
+        self._cycle_detector: Optional[IncrementalCycleDetector[ModuleNode]] = self._create_cycle_detector(config)
+        self._parser: Union[ImportStatementParser, BytecodeImportParser] = self._create_parser(config)
         self._resolver: ImportResolver = ImportResolver(
             project_context=self._project_context,
             analysis_target=analysis_target,
@@ -92,8 +98,6 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
             self.config.external_depth,
         )
 
-        self._counter = 0
-
     def __bool__(self) -> bool:
         return not self._graph.empty
 
@@ -122,7 +126,9 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
         self._root_origins = frozenset()
         self._collection.clear()
         self._graph.clear()
-        self._counter = 0
+        self._nodes.clear()
+        self._tree = self._create_tree(self.config)
+        self._cycle_detector = self._create_cycle_detector(self.config)
 
     @property
     def filepaths(self) -> List[Path]:
@@ -140,7 +146,13 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
     @property
     @lazy_execution
     def graph(self) -> ModuleGraph:
-        return self._graph.copy()
+        return self._graph.view()
+
+    @property
+    @lazy_execution
+    def tree(self) -> Optional[ModuleTree]:
+        """The unfolded import tree when nodes are not unified, to materialize at other budgets."""
+        return self._tree
 
     def _analyze_if_needed(
         self,
@@ -171,7 +183,7 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
             new_nodes.append(PendingNode(root, 0, CategoryContext.root()))
 
         while new_nodes:
-            node, depth, context = new_nodes.pop()
+            node, depth, context, parent = new_nodes.pop()
             is_root = node.module.origin in self._root_origins
             module = node.module
             if self._check_if_should_process_module(
@@ -179,6 +191,9 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
                 processed=processed,
                 depth=depth,
             ):
+                if self._tree is not None:
+                    self._tree.expand(node, parent)
+
                 self._collect_new_modules(
                     node,
                     new_nodes,
@@ -188,7 +203,15 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
                     context=context,
                 )
 
-        if self.config.collapse_level is not None:
+        if self._tree is not None:
+            self._graph = self._tree.materialize(
+                max_nodes=self.config.tree_node_budget,
+                backend=self.config.graph_backend,
+            )
+
+        if self.config.collapse_distributions:
+            self._graph = self._graph.collapse_distributions(sort_method=self.config.sort_method)
+        elif self.config.collapse_level is not None:
             self._graph = self._graph.simplify(
                 self.config.collapse_level,
                 qualified_name=self.config.qualified_names,
@@ -211,6 +234,7 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
             self._graph,
             length_bound=self.config.cycle_length_bound,
             max_examples=self.config.cycle_examples,
+            time_budget=self.config.cycle_time_budget,
         )
         summary = format_cycle_report(report)
         if self.config.fail_on_cycle:
@@ -219,10 +243,32 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
         logger.warning("%s", summary)
 
     def _add(self, node: ModuleNode, parent: Optional[ModuleNode] = None) -> None:
-        self._graph.add_node(node)
+        self._nodes.setdefault(node.module.qualified_name, node)
         self._collection.add(node.module)
+        if self._tree is not None:
+            if parent is None:
+                self._tree.add_root(node)
+            else:
+                self._tree.add_child(parent, node)
+
+            return
+
+        self._graph.add_node(node)
         if parent is not None:
             self._graph.add_edge(parent, node)
+            self._detect_cycle(parent, node)
+
+    def _detect_cycle(self, parent: ModuleNode, node: ModuleNode) -> None:
+        if self._cycle_detector is None or parent == node:
+            return
+
+        if parent.module.category != ModuleCategory.LOCAL or node.module.category != ModuleCategory.LOCAL:
+            return
+
+        cycle = self._cycle_detector.add_edge(parent, node)
+        if cycle is not None:
+            loop = " -> ".join(member.identifier for member in cycle + cycle[:1])
+            raise PDADependencyCycleError(f"Import cycle detected: {loop}")
 
     def analyze_file(
         self,
@@ -289,7 +335,7 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
         processed: Optional[Set[Optional[Path]]] = None,
         context: Optional[CategoryContext] = None,
     ) -> bool:
-        if module.origin_type != OriginType.PYTHON:
+        if module.origin_type != OriginType.PYTHON and not self._is_readable_bytecode(module):
             return False
 
         if not module.available:
@@ -309,6 +355,40 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
 
         return True
 
+    def _is_readable_bytecode(self, module: CategorizedModule) -> bool:
+        if not isinstance(self._parser, BytecodeImportParser) or module.origin is None:
+            return False
+
+        return module.origin_type == OriginType.NO_PYTHON and self._parser.supports(module.origin)
+
+    @staticmethod
+    def _create_parser(config: ModuleImportsAnalyzerConfig) -> Union[ImportStatementParser, BytecodeImportParser]:
+        if config.read_bytecode:
+            return BytecodeImportParser(ImportStatementParser())
+
+        return ImportStatementParser()
+
+    @staticmethod
+    def _create_tree(config: ModuleImportsAnalyzerConfig) -> Optional[ModuleTree]:
+        if config.unify_nodes:
+            return None
+
+        return ModuleTree(qualified_name=config.qualified_names)
+
+    @staticmethod
+    def _create_cycle_detector(
+        config: ModuleImportsAnalyzerConfig,
+    ) -> Optional[IncrementalCycleDetector[ModuleNode]]:
+        """
+        Cycles are only detected while traversing when they are bound to survive into the
+        final graph: collapsing may merge a whole cycle into a single node.
+        """
+        collapsed = config.collapse_distributions or config.collapse_level is not None
+        if not config.fail_on_cycle or not config.unify_nodes or collapsed:
+            return None
+
+        return IncrementalCycleDetector()
+
     def _collect_imports(
         self,
         module_source: ModuleSource,
@@ -383,15 +463,10 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
                 continue
 
             level = depth + 1
-            child = ModuleNode(
-                imported_module,
-                level=level,
-                ordinal=self._ordinal(),
-                qualified_name=self.config.qualified_names,
-            )
+            child = self._node(imported_module, level)
             self._add(child, parent=node)
 
-            if self.config.unify_nodes and imported_module.origin in processed:
+            if imported_module.origin in processed:
                 continue
 
             new_nodes.append(
@@ -399,6 +474,7 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
                     child,
                     level,
                     child_context,
+                    node,
                 )
             )
 
@@ -413,12 +489,20 @@ class ModuleImportsAnalyzer(BaseAnalyzer[ModuleImportsAnalyzerConfig, ModuleGrap
             if (path := self._resolver.resolve_import_path(module_source, import_path)) is not None
         ]
 
-    def _ordinal(self) -> int:
-        if self.config.unify_nodes:
-            return 0
-
-        self._counter += 1
-        return self._counter
+    def _node(self, module: CategorizedModule, level: int) -> ModuleNode:
+        """
+        The node of ``module``. A module already reached keeps its node, so repeated imports
+        of it do not allocate a new one; the tree view numbers its paths separately.
+        """
+        existing = self._nodes.get(module.qualified_name)
+        if existing is not None:
+            return existing
+
+        return ModuleNode(
+            module,
+            level=level,
+            qualified_name=self.config.qualified_names,
+        )
 
     @classmethod
     def default_config(cls) -> ModuleImportsAnalyzerConfig:
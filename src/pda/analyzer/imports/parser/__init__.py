@@ -1,3 +1,4 @@
+from .bytecode import BytecodeImportParser
 from .statements import ImportStatementParser
 
-__all__ = ["ImportStatementParser"]
+__all__ = ["BytecodeImportParser", "ImportStatementParser"]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import dis
+import inspect
+import marshal
+from collections import deque
+from importlib.machinery import BYTECODE_SUFFIXES, SOURCE_SUFFIXES
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
+from pathlib import Path
+from types import CodeType
+from typing import Callable, Deque, Final, Iterator, List, Optional, Sequence, Tuple
+
+from pda.specification import ImportPath, ImportScope, ImportStatement, SourceSpan
+from pda.tools.paths import is_file
+
+ImportStatementSource = Callable[[Path], List[ImportStatement]]
+
+_HEADER_SIZE: Final[int] = 16
+_FLAG_HASH_BASED: Final[int] = 0b01
+_FLAG_CHECK_SOURCE: Final[int] = 0b10
+_SIZE_MASK: Final[int] = 0xFFFFFFFF
+
+_CONSTANT_LOADS: Final[frozenset[str]] = frozenset({"LOAD_CONST", "LOAD_SMALL_INT"})
+_GUARD_PREFIX_SKIP: Final[frozenset[str]] = frozenset({"TO_BOOL", "NOT_TAKEN", "CACHE", "EXTENDED_ARG"})
+_NAME_LOADS: Final[frozenset[str]] = frozenset({"LOAD_NAME", "LOAD_GLOBAL", "LOAD_ATTR", "LOAD_FAST", "LOAD_DEREF"})
+_TYPE_CHECKING: Final[str] = "TYPE_CHECKING"
+
+
+class BytecodeImportParser:
+    """
+    Extracts import statements from compiled bytecode instead of the source text.
+
+    A module's cached ``__pycache__`` file is used only when its header still matches the
+    source (timestamp and size, or the source hash for hash-based pycs); sourceless
+    ``.pyc`` modules are read directly once their magic number matches the running
+    interpreter. When no valid bytecode is available the ``fallback`` parser handles the
+    source file.
+
+    Bytecode carries no syntax tree, so scopes are approximate: definitions come from
+    nested code objects, error handling from the exception table, and ``TYPE_CHECKING`` /
+    ``__main__`` guards from the conditional jumps that skip them. Decorated functions are
+    not distinguished from plain ones.
+    """
+
+    def __init__(self, fallback: ImportStatementSource) -> None:
+        self._fallback = fallback
+
+    def __call__(self, origin: Path) -> List[ImportStatement]:
+        code = self.load(origin)
+        if code is None:
+            return self._fallback(origin)
+
+        return list(self._statements(origin, code, ()))
+
+    @staticmethod
+    def supports(origin: Path) -> bool:
+        return origin.suffix in (*SOURCE_SUFFIXES, *BYTECODE_SUFFIXES)
+
+    def load(self, origin: Path) -> Optional[CodeType]:
+        """The module's code object, or ``None`` if there is no valid bytecode for it."""
+        if origin.suffix in BYTECODE_SUFFIXES:
+            return self._unmarshal(origin, source=None)
+
+        try:
+            cache = Path(cache_from_source(str(origin)))
+        except NotImplementedError:
+            return None
+
+        if not is_file(cache):
+            return None
+
+        return self._unmarshal(cache, source=origin)
+
+    @staticmethod
+    def _unmarshal(filepath: Path, *, source: Optional[Path]) -> Optional[CodeType]:
+        data = filepath.read_bytes()
+        if len(data) < _HEADER_SIZE or data[:4] != MAGIC_NUMBER:
+            return None
+
+        if source is not None and not _is_fresh(data, source):
+            return None
+
+        try:
+            code = marshal.loads(data[_HEADER_SIZE:])
+        except (ValueError, EOFError, TypeError):
+            return None
+
+        return code if isinstance(code, CodeType) else None
+
+    def _statements(
+        self,
+        origin: Path,
+        code: CodeType,
+        outer_scopes: Tuple[ImportScope, ...],
+    ) -> Iterator[ImportStatement]:
+        instructions = list(dis.get_instructions(code))
+        guards = _guarded_ranges(code, instructions)
+        for index, instruction in enumerate(instructions):
+            scope = _instruction_scope(instruction.offset, guards)
+            scopes = (scope, *outer_scopes) if scope else outer_scopes
+            if instruction.opname == "IMPORT_NAME":
+                yield from self._import_statements(origin, instruction, instructions[max(0, index - 2) : index], scopes)
+            elif isinstance(instruction.argval, CodeType):
+                nested = instruction.argval
+                yield from self._statements(origin, nested, (_definition_scope(nested), *scopes))
+
+    @staticmethod
+    def _import_statements(
+        origin: Path,
+        instruction: dis.Instruction,
+        arguments: Sequence[dis.Instruction],
+        scopes: Tuple[ImportScope, ...],
+    ) -> Iterator[ImportStatement]:
+        level, fromlist = 0, None
+        if len(arguments) == 2 and all(argument.opname in _CONSTANT_LOADS for argument in arguments):
+            level, fromlist = arguments[0].argval, arguments[1].argval
+
+        span = _span(instruction)
+        module = instruction.argval or None
+        if fromlist is None:
+            yield ImportStatement(origin=origin, span=span, path=ImportPath(module=module), scopes=list(scopes))
+            return
+
+        for name in fromlist:
+            yield ImportStatement(
+                origin=origin,
+                span=span,
+                path=ImportPath(module=module, level=level, name=name),
+                scopes=list(scopes),
+            )
+
+
+def _is_fresh(data: bytes, source: Path) -> bool:
+    flags = int.from_bytes(data[4:8], "little")
+    if flags & _FLAG_HASH_BASED:
+        if not flags & _FLAG_CHECK_SOURCE:
+            return True
+
+        return data[8:16] == source_hash(source.read_bytes())
+
+    stat = source.stat()
+    mtime = int.from_bytes(data[8:12], "little")
+    size = int.from_bytes(data[12:16], "little")
+    return mtime == int(stat.st_mtime) & _SIZE_MASK and size == stat.st_size & _SIZE_MASK
+
+
+def _definition_scope(code: CodeType) -> ImportScope:
+    return ImportScope.FUNCTION if code.co_flags & inspect.CO_OPTIMIZED else ImportScope.CLASS
+
+
+def _span(instruction: dis.Instruction) -> SourceSpan:
+    positions = instruction.positions
+    if positions is None or positions.lineno is None:
+        return SourceSpan(lineno=1, col_offset=0, end_lineno=None, end_col_offset=None)
+
+    return SourceSpan(
+        lineno=positions.lineno,
+        col_offset=positions.col_offset or 0,
+        end_lineno=positions.end_lineno,
+        end_col_offset=positions.end_col_offset,
+    )
+
+
+def _instruction_scope(offset: int, guards: Sequence[Tuple[int, int, ImportScope]]) -> ImportScope:
+    scope = ImportScope.NONE
+    for start, end, guard in guards:
+        if start <= offset < end:
+            scope |= guard
+
+    return scope
+
+
+def _guarded_ranges(code: CodeType, instructions: Sequence[dis.Instruction]) -> List[Tuple[int, int, ImportScope]]:
+    by_offset = {instruction.offset: index for index, instruction in enumerate(instructions)}
+    ranges: List[Tuple[int, int, ImportScope]] = []
+    for entry in dis.Bytecode(code).exception_entries:  # type: ignore[attr-defined]
+        if not _is_with_handler(instructions, by_offset.get(entry.target)):
+            ranges.append((entry.start, entry.end, ImportScope.TRY))
+
+    preceding: Deque[dis.Instruction] = deque(maxlen=3)
+    for instruction in instructions:
+        if instruction.opname in _GUARD_PREFIX_SKIP:
+            continue
+
+        if instruction.opname == "POP_JUMP_IF_FALSE" and instruction.argval > instruction.offset:
+            guard = _condition_guard(preceding)
+            if guard:
+                ranges.append((instruction.offset, instruction.argval, guard))
+
+        preceding.append(instruction)
+
+    return ranges
+
+
+def _is_with_handler(instructions: Sequence[dis.Instruction], index: Optional[int]) -> bool:
+    if index is None or index + 1 >= len(instructions):
+        return False
+
+    return instructions[index].opname == "PUSH_EXC_INFO" and instructions[index + 1].opname == "WITH_EXCEPT_START"
+
+
+def _condition_guard(preceding: Sequence[dis.Instruction]) -> ImportScope:
+    if preceding and preceding[-1].opname in _NAME_LOADS and preceding[-1].argval == _TYPE_CHECKING:
+        return ImportScope.IF | ImportScope.TYPE_CHECKING
+
+    if len(preceding) >= 3 and preceding[-1].opname == "COMPARE_OP" and preceding[-1].argval == "==":
+        operands = {preceding[-2].argval, preceding[-3].argval}
+        if operands == {"__name__", "__main__"}:
+            return ImportScope.IF | ImportScope.MAIN
+
+    return ImportScope.NONE
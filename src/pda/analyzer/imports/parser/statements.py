@@ -1,4 +1,5 @@
 import ast
+from importlib.machinery import SOURCE_SUFFIXES
 from pathlib import Path
 from typing import List, Union
 
@@ -18,6 +19,10 @@ class ImportStatementParser:
         import_nodes = self._find_import_nodes(tree)
         return self._retrieve_all_import_statements(origin, import_nodes)
 
+    @staticmethod
+    def supports(origin: Path) -> bool:
+        return origin.suffix in SOURCE_SUFFIXES
+
     def _find_import_nodes(
         self,
         tree: ASTForest,
@@ -1,11 +1,21 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pda.structures import Graph
 
 
-def build_cycle_report(graph: Graph[Any], *, length_bound: int, max_examples: int) -> Dict[str, Any]:
-    components = graph.cycle_components(length_bound=length_bound, max_examples=max_examples)
-    return {"cycle_count": len(components), "components": components}
+def build_cycle_report(
+    graph: Graph[Any],
+    *,
+    length_bound: int,
+    max_examples: int,
+    time_budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    components = graph.cycle_components(length_bound=length_bound, max_examples=max_examples, time_budget=time_budget)
+    return {
+        "cycle_count": len(components),
+        "feedback_arc_count": sum(len(component["feedback_arcs"]) for component in components),
+        "components": components,
+    }
 
 
 def format_cycle_report(report: Dict[str, Any]) -> str:
@@ -21,4 +31,10 @@ def format_cycle_report(report: Dict[str, Any]) -> str:
             loop = " -> ".join(example + example[:1])
             lines.append(f"      {loop}")
 
+        if component["truncated"]:
+            lines.append("      (example search ran out of time)")
+
+        cuts = ", ".join(f"{source} -> {target}" for source, target in component["feedback_arcs"])
+        lines.append(f"    to break: {cuts}")
+
     return "\n".join(lines)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Collection, DefaultDict, Dict, Final, List, Mapping, Set
+
+from pda.tools.serialization import load_json
+from pda.types import Pathlike
+
+FINGERPRINTS_ATTRIBUTE: Final[str] = "fingerprints"
+
+
+@dataclass(frozen=True)
+class InventoryBaseline:
+    """
+    A previous ``pda collect`` node-link document used as the starting point of an
+    incremental collection.
+
+    Nodes and links are kept exactly as they were exported, so packages whose fingerprint
+    did not change are carried over without being resolved again.
+    """
+
+    nodes: Dict[str, Dict[str, Any]]
+    links: List[Dict[str, str]]
+    fingerprints: Dict[str, str]
+
+    @classmethod
+    def load(cls, filepath: Pathlike) -> InventoryBaseline:
+        return cls.from_dict(load_json(filepath))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> InventoryBaseline:
+        attributes: Mapping[str, Any] = data.get("graph", {})
+        return cls(
+            nodes={node["id"]: node for node in data["nodes"]},
+            links=list(data["links"]),
+            fingerprints=dict(attributes.get(FINGERPRINTS_ATTRIBUTE, {})),
+        )
+
+    def merge(self, document: Mapping[str, Any], reused_packages: Collection[str]) -> Dict[str, Any]:
+        """
+        Combine a freshly collected document with the baseline subtrees of the reused
+        top-level packages. Collected links express containment, so a package subtree is
+        everything reachable from its top-level node. Freshly collected nodes take
+        precedence over baseline nodes with the same identifier.
+        """
+        reused = self._subtrees(reused_packages)
+        nodes: Dict[str, Dict[str, Any]] = {node["id"]: node for node in document["nodes"]}
+        for identifier in reused:
+            nodes.setdefault(identifier, self.nodes[identifier])
+
+        links = list(document["links"])
+        links.extend(link for link in self.links if link["source"] in reused)
+
+        merged: Dict[str, Any] = {"directed": True}
+        if "graph" in document:
+            merged["graph"] = document["graph"]
+
+        merged["nodes"] = sorted(nodes.values(), key=lambda node: (node["level"], node["id"]))
+        merged["links"] = links
+        return merged
+
+    def _subtrees(self, roots: Collection[str]) -> Set[str]:
+        children: DefaultDict[str, List[str]] = defaultdict(list)
+        for link in self.links:
+            children[link["source"]].append(link["target"])
+
+        reached: Set[str] = set()
+        pending = [root for root in roots if root in self.nodes]
+        while pending:
+            identifier = pending.pop()
+            if identifier in reached:
+                continue
+
+            reached.add(identifier)
+            pending.extend(children[identifier])
+
+        return reached
+
+
+@dataclass(frozen=True)
+class InventoryDelta:
+    """Compact difference between two collected module inventories."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    packages: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def between(cls, baseline: InventoryBaseline, document: Mapping[str, Any]) -> InventoryDelta:
+        current: Dict[str, Dict[str, Any]] = {node["id"]: node for node in document["nodes"]}
+        fingerprints: Mapping[str, str] = document.get("graph", {}).get(FINGERPRINTS_ATTRIBUTE, {})
+        previous = baseline.fingerprints
+        return cls(
+            added=sorted(current.keys() - baseline.nodes.keys()),
+            removed=sorted(baseline.nodes.keys() - current.keys()),
+            changed=sorted(
+                identifier
+                for identifier in current.keys() & baseline.nodes.keys()
+                if current[identifier] != baseline.nodes[identifier]
+            ),
+            packages={
+                "added": sorted(fingerprints.keys() - previous.keys()),
+                "removed": sorted(previous.keys() - fingerprints.keys()),
+                "changed": sorted(
+                    name for name in fingerprints.keys() & previous.keys() if fingerprints[name] != previous[name]
+                ),
+            },
+        )
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "packages": self.packages,
+        }
@@ -1,10 +1,13 @@
 import warnings
 from pathlib import Path
-from typing import Optional, Tuple, Union, overload
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Set, Tuple, Union, overload
 
 from pda.analyzer.base import BaseAnalyzer
 from pda.analyzer.depth import CategoryContext, CategoryDepthPolicy
 from pda.analyzer.lazy import lazy_execution
+from pda.analyzer.modules.baseline import FINGERPRINTS_ATTRIBUTE
+from pda.analyzer.modules.fingerprint import PackageFingerprinter
 from pda.analyzer.modules.lookup import (
     ModuleLookup,
     ProjectModuleLookup,
@@ -12,6 +15,7 @@ from pda.analyzer.modules.lookup import (
 )
 from pda.analyzer.modules.pkg import PkgModuleScanner
 from pda.analyzer.modules.scanner import FileSystemScanner
+from pda.analyzer.modules.sink import GraphModuleSink, ModuleSink, StreamingModuleSink
 from pda.analyzer.target import AnalysisTarget, AnalysisTargetResolver
 from pda.config import ModulesCollectorConfig
 from pda.exceptions import PDACategoryDisabledWarning
@@ -25,6 +29,7 @@ from pda.specification import (
     Module,
     ModuleCategory,
     ModulesCollection,
+    PKGModuleInfo,
 )
 from pda.tools.logger import logger
 from pda.tools.paths import resolve_path
@@ -39,13 +44,28 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
         config: ModulesCollectorConfig,
         project_root: Optional[Pathlike] = None,
         root_module_name: Optional[str] = None,
+        *,
+        known_fingerprints: Optional[Mapping[str, str]] = None,
     ) -> None:
+        """
+        ``known_fingerprints`` maps top-level package names to the fingerprints recorded by
+        a previous collection. Discovered packages whose fingerprint is unchanged are not
+        rescanned; they are reported through ``reused_packages`` instead. Packages are only
+        fingerprinted when a baseline is given or ``fingerprint_packages`` is set.
+        """
         analysis_target = AnalysisTarget(root_module_name=root_module_name) if root_module_name is not None else None
         super().__init__(config=config, project_root=project_root, analysis_target=analysis_target)
 
         self._collection: ModulesCollection = ModulesCollection(allow_unavailable=False)
-        self._graph: ModuleGraph = ModuleGraph()
+        self._graph: ModuleGraph = ModuleGraph(backend=self.config.graph_backend)
+        self._sink: ModuleSink = GraphModuleSink(self._graph, self._collection)
         self._project_context: Optional[ProjectResolutionContext] = None
+        self._known_fingerprints: Mapping[str, str] = MappingProxyType(dict(known_fingerprints or {}))
+        self._fingerprinter: Optional[PackageFingerprinter] = (
+            PackageFingerprinter() if self.config.fingerprint_packages or known_fingerprints is not None else None
+        )
+        self._fingerprints: Dict[str, str] = {}
+        self._reused_packages: Set[str] = set()
 
         self._source_roots, self._module_lookup = self._create_source_roots_and_lookup()
         self._pkg_scanner: PkgModuleScanner = PkgModuleScanner(
@@ -142,7 +162,17 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
     @property
     @lazy_execution
     def graph(self) -> ModuleGraph:
-        return self._graph.copy()
+        return self._graph.view()
+
+    @property
+    @lazy_execution
+    def fingerprints(self) -> Dict[str, str]:
+        return dict(self._fingerprints)
+
+    @property
+    @lazy_execution
+    def reused_packages(self) -> FrozenSet[str]:
+        return frozenset(self._reused_packages)
 
     @property
     @lazy_execution
@@ -180,6 +210,37 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
     def clear(self) -> None:
         self._graph.clear()
         self._collection.clear()
+        self._fingerprints.clear()
+        self._reused_packages.clear()
+        self._sink = GraphModuleSink(self._graph, self._collection)
+
+    def stream(self, filepath: Pathlike, *, indent: Optional[int] = None) -> StreamingModuleSink:
+        """
+        Collect modules straight into a node-link JSON file instead of building the graph.
+
+        Each top-level package is written out as soon as its subtree has been collected, so
+        memory stays bounded by the largest package rather than by the whole environment.
+        The collector itself is left empty; collapsing requires the full graph and is not
+        supported in this mode. Nodes are written compactly unless an ``indent`` is given.
+        """
+        if self.config.collapse_level is not None or self.config.collapse_distributions:
+            raise ValueError("Streaming collection cannot be combined with collapse_level or collapse_distributions")
+
+        self.clear()
+        with StreamingModuleSink(filepath, indent=indent) as sink:
+            self._sink = sink
+            try:
+                self._collect_local_modules()
+                self._collect_external_modules()
+                if self._fingerprints:
+                    sink.attributes[FINGERPRINTS_ATTRIBUTE] = dict(sorted(self._fingerprints.items()))
+            finally:
+                self._sink = GraphModuleSink(self._graph, self._collection)
+
+        if not sink.node_count:
+            logger.warning("No modules collected. Check your configuration and project structure")
+
+        return sink
 
     def get_category(
         self,
@@ -200,7 +261,12 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
         self.clear()
         self._collect_local_modules()
         self._collect_external_modules()
-        if self.config.collapse_level is not None:
+        if self._fingerprints:
+            self._graph.attributes[FINGERPRINTS_ATTRIBUTE] = dict(sorted(self._fingerprints.items()))
+
+        if self.config.collapse_distributions:
+            self._graph = self._graph.collapse_distributions(sort_method="auto")
+        elif self.config.collapse_level is not None:
             self._graph = self._graph.simplify(
                 self.config.collapse_level,
                 qualified_name=self.config.qualified_names,
@@ -212,12 +278,31 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
     def _collect_external_modules(self) -> None:
         discovered_modules = self._pkg_scanner.discover()
         for module_info in discovered_modules:
+            if self._reuse_package(module_info):
+                continue
+
             self._add_module(
                 name=module_info.name,
                 base_path=module_info.base_path,
                 containing_package=module_info.containing_package,
                 parent_context=CategoryContext.root(),
             )
+            self._sink.flush()
+
+    def _reuse_package(self, module_info: PKGModuleInfo) -> bool:
+        if self._fingerprinter is None:
+            return False
+
+        fingerprint = self._fingerprinter.fingerprint(module_info)
+        if fingerprint is None:
+            return False
+
+        self._fingerprints[module_info.name] = fingerprint
+        if self._known_fingerprints.get(module_info.name) != fingerprint:
+            return False
+
+        self._reused_packages.add(module_info.name)
+        return True
 
     def _collect_local_modules(self) -> None:
         if not self._source_roots:
@@ -232,6 +317,7 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
             containing_package=None,
             parent_context=CategoryContext.root(),
         )
+        self._sink.flush()
 
     def _add_submodules_from_files(
         self,
@@ -324,10 +410,7 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
         node: ModuleNode,
         parent: Optional[ModuleNode] = None,
     ) -> None:
-        self._graph.add_node(node)
-        self._collection.add(node.module)
-        if parent is not None:
-            self._graph.add_edge(parent, node)
+        self._sink.add(node, parent)
 
     def _add_submodules(
         self,
@@ -362,7 +445,7 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
         containing_package: Optional[str] = None,
         origin: Optional[Pathlike] = None,
     ) -> Optional[CategorizedModule]:
-        if name in self._collection:
+        if name in self._sink:
             return None
 
         if origin is not None:
@@ -373,10 +456,6 @@ class ModulesCollector(BaseAnalyzer[ModulesCollectorConfig, ModuleGraph]):
                 containing_package=containing_package,
             )
 
-        category = module.category
-        if name in self._collection[category]:
-            return None
-
         return module
 
     def _should_scan_package_location(
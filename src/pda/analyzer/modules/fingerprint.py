@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+from importlib.machinery import all_suffixes
+from pathlib import Path
+from typing import Dict, Final, Iterator, List, Optional, Tuple
+
+from pda.specification import PKGModuleInfo
+from pda.tools.paths import does_skip_path, glob
+
+_RECORD: Final[str] = "RECORD"
+_MODULE_SUFFIXES: Final[Tuple[str, ...]] = tuple(sorted(all_suffixes(), key=len, reverse=True))
+
+
+class PackageFingerprinter:
+    """
+    Computes a cheap change fingerprint for a discovered top-level package.
+
+    A package installed from a distribution is fingerprinted by the ``RECORD`` file of its
+    ``.dist-info`` directory, which installers rewrite on every install or upgrade, so a
+    single read covers the whole package. Other packages hash the relative path, size and
+    modification time of every file that belongs to them, so editing them changes the
+    value while an untouched package keeps it across runs. Bytecode caches are ignored
+    because merely importing a package rewrites them.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[Path, Dict[str, Path]] = {}
+
+    def fingerprint(self, info: PKGModuleInfo) -> Optional[str]:
+        """
+        Return the package fingerprint, or ``None`` when the package has no files on disk
+        (for example when it lives inside an archive) and therefore cannot be compared.
+        """
+        record = self._records_in(info.base_path).get(info.name)
+        if record is not None:
+            return self._record_fingerprint(record)
+
+        entries = self._package_entries(info.base_path, info.name)
+        if not entries:
+            return None
+
+        digest = hashlib.sha256()
+        for path in entries:
+            for filepath in self._files(path):
+                stat = filepath.stat()
+                relative = filepath.relative_to(info.base_path).as_posix()
+                digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _record_fingerprint(record: Path) -> str:
+        digest = hashlib.sha256(f"{record.parent.name}\n".encode())
+        digest.update(record.read_bytes())
+        return digest.hexdigest()
+
+    def _records_in(self, base_path: Path) -> Dict[str, Path]:
+        """Map the top-level names installed in ``base_path`` to the ``RECORD`` listing them."""
+        records = self._records.get(base_path)
+        if records is None:
+            records = {}
+            for record in glob(base_path, f"*.dist-info/{_RECORD}"):
+                for name in self._record_top_levels(record):
+                    records.setdefault(name, record)
+
+            self._records[base_path] = records
+
+        return records
+
+    @staticmethod
+    def _record_top_levels(record: Path) -> Iterator[str]:
+        try:
+            lines = record.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+
+        for line in lines:
+            head, _, rest = line.partition(",")[0].partition("/")
+            if not rest:
+                head = next((head.removesuffix(suffix) for suffix in _MODULE_SUFFIXES if head.endswith(suffix)), "")
+
+            if head.isidentifier():
+                yield head
+
+    @staticmethod
+    def _package_entries(base_path: Path, name: str) -> List[Path]:
+        package = base_path / name
+        entries = glob(base_path, f"{name}.*")
+        if package.is_dir():
+            entries.insert(0, package)
+
+        return entries
+
+    @staticmethod
+    def _files(path: Path) -> Iterator[Path]:
+        if not path.is_dir():
+            yield path
+            return
+
+        for directory, directories, files in path.walk():
+            directories[:] = sorted(name for name in directories if not does_skip_path(directory / name))
+            for name in sorted(files):
+                yield directory / name
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Dict, List, Optional, Self, Type
+
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import ModulesCollection
+from pda.structures.graph import NodeLinkWriter
+from pda.tools.serialization import COMPACT_SEPARATORS, open_text
+from pda.types import Pathlike
+
+
+class ModuleSink(ABC):
+    """
+    Destination of the nodes and edges discovered by the modules collector.
+    """
+
+    @abstractmethod
+    def __contains__(self, name: str) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def add(self, node: ModuleNode, parent: Optional[ModuleNode] = None) -> None: ...
+
+    def flush(self) -> None:
+        """Called once the subtree of a top-level package has been collected."""
+
+
+class GraphModuleSink(ModuleSink):
+    """
+    Keeps every collected module in memory, in a graph and a modules collection.
+    """
+
+    def __init__(self, graph: ModuleGraph, collection: ModulesCollection) -> None:
+        self._graph = graph
+        self._collection = collection
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._collection
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+    def add(self, node: ModuleNode, parent: Optional[ModuleNode] = None) -> None:
+        self._graph.add_node(node)
+        self._collection.add(node.module)
+        if parent is not None:
+            self._graph.add_edge(parent, node)
+
+
+class StreamingModuleSink(ModuleSink):
+    """
+    Writes collected modules to a node-link JSON file as they are discovered.
+
+    Only the serialized nodes and links of the package subtree being collected are held
+    in memory, together with a table mapping module names to node identifiers. Nodes are
+    written in discovery order; links are spooled to a temporary file, one per line, and
+    appended once the collection is closed, followed by the graph-level attributes. The
+    file is compressed when its suffix asks for it (see ``open_text``).
+
+    The document is written to a hidden ``.partial-`` file next to ``filepath`` and only
+    renamed into place when the sink is closed, so a collection aborted by an exception
+    leaves no output that could be mistaken for a finished one.
+    """
+
+    def __init__(self, filepath: Pathlike, *, indent: Optional[int] = None) -> None:
+        self._filepath = Path(filepath)
+        self._identifiers: Dict[str, str] = {}
+        self._nodes: List[Dict[str, Any]] = []
+        self._links: List[Dict[str, str]] = []
+        self._node_count = 0
+        self._link_count = 0
+        self.attributes: Dict[str, Any] = {}
+
+        self._partial = self._filepath.with_name(f".partial-{self._filepath.name}")
+        self._file: IO[str] = open_text(self._partial, "w")
+        self._spool: IO[str] = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._writer = NodeLinkWriter(self._file, indent=indent)
+        self._writer.begin("nodes")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._identifiers
+
+    def __len__(self) -> int:
+        return len(self._identifiers)
+
+    @property
+    def filepath(self) -> Path:
+        return self._filepath
+
+    @property
+    def node_count(self) -> int:
+        return self._node_count
+
+    @property
+    def link_count(self) -> int:
+        return self._link_count
+
+    def add(self, node: ModuleNode, parent: Optional[ModuleNode] = None) -> None:
+        name = node.module.name
+        if name not in self._identifiers:
+            self._identifiers[name] = node.identifier
+            self._nodes.append(node.serialize())
+
+        if parent is not None and parent != node:
+            self._links.append({"source": parent.identifier, "target": self._identifiers[name]})
+
+    def flush(self) -> None:
+        for item in self._nodes:
+            self._writer.item(item)
+
+        self._writer.flush()
+        for link in self._links:
+            self._spool.write(json.dumps(link, separators=COMPACT_SEPARATORS))
+            self._spool.write("\n")
+
+        self._node_count += len(self._nodes)
+        self._link_count += len(self._links)
+        self._nodes.clear()
+        self._links.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+
+        self.flush()
+        self._writer.end()
+        self._spool.seek(0)
+        self._writer.array("links", map(json.loads, self._spool))
+        if self.attributes:
+            self._writer.field("graph", self.attributes)
+
+        self._writer.close()
+        self._spool.close()
+        self._file.close()
+        os.replace(self._partial, self._filepath)
+
+    def abort(self) -> None:
+        """Discard the partially written document, leaving ``filepath`` untouched."""
+        if self._file.closed:
+            return
+
+        self._spool.close()
+        self._file.close()
+        self._partial.unlink(missing_ok=True)
@@ -2,18 +2,27 @@ import argparse
 from pathlib import Path
 from typing import Final, List, Optional, Tuple, TypeVar
 
+import networkx as nx
+
 from pda.analyzer import ModuleImportsAnalyzer, ModulesCollector
-from pda.analyzer.imports.report import build_cycle_report
+from pda.analyzer.imports.report import build_cycle_report, format_cycle_report
+from pda.analyzer.modules.baseline import InventoryBaseline, InventoryDelta
 from pda.analyzer.target import AnalysisTarget, AnalysisTargetResolver
 from pda.cli.flags import build_config
 from pda.cli.output import export, resolve_output
 from pda.config import ModuleAnalyzerConfig, ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModulesCollectorConfig
+from pda.models import ModuleGraph, PDAGraphFile
+from pda.models.module.binary import is_pdagraph
 from pda.resolution import ProjectResolutionContext
+from pda.structures.graph import ReachabilityIndex
+from pda.structures.graph.node_link import read_node_link
 from pda.tools.logger import logger
-from pda.tools.serialization import save_json
+from pda.tools.serialization import open_text, save_json, strip_compression
 
 SUFFIX_IMPORTS: Final = "imports"
 SUFFIX_MODULES: Final = "modules"
+SUFFIX_DELTA: Final = "delta"
+CYCLE_FIELDS: Final = ("cycle_length_bound", "cycle_examples", "cycle_time_budget")
 _ConfigT = TypeVar("_ConfigT", bound=ModuleAnalyzerConfig)
 
 
@@ -47,6 +56,10 @@ def _build_analyzer_config(config_cls: type[_ConfigT], args: argparse.Namespace)
     return config_cls(**data)
 
 
+def _indent(args: argparse.Namespace) -> Optional[int]:
+    return None if args.compact else 2
+
+
 def _append_suffix(name: Optional[str], suffix: str) -> str:
     return suffix if name is None else f"{name}-{suffix}"
 
@@ -101,6 +114,7 @@ def run_analyze(args: argparse.Namespace) -> int:
             graph,
             length_bound=config.cycle_length_bound,
             max_examples=config.cycle_examples,
+            time_budget=config.cycle_time_budget,
         )
         save_json(report, args.cycles_output)
 
@@ -110,6 +124,8 @@ def run_analyze(args: argparse.Namespace) -> int:
         fmt,
         theme=args.theme or "light",
         layout=args.layout,
+        indent=_indent(args),
+        layout_cache=args.layout_cache,
     )
 
 
@@ -130,6 +146,11 @@ def run_collect(args: argparse.Namespace) -> int:
 
     stem = _append_suffix(root_module_name, SUFFIX_MODULES)
     output, fmt = resolve_output(args.output, args.format, stem)
+    if args.baseline is not None:
+        return _run_incremental_collect(args, config, output, fmt)
+
+    if args.stream:
+        return _run_streaming_collect(args, config, output, fmt)
 
     collector = ModulesCollector(
         config=config,
@@ -142,4 +163,142 @@ def run_collect(args: argparse.Namespace) -> int:
         fmt,
         theme=args.theme or "light",
         layout=args.layout,
+        indent=_indent(args),
+        layout_cache=args.layout_cache,
+    )
+
+
+def _run_streaming_collect(
+    args: argparse.Namespace,
+    config: ModulesCollectorConfig,
+    output: Path,
+    fmt: str,
+) -> int:
+    if fmt != "json":
+        raise ValueError("--stream requires JSON output.")
+
+    collector = ModulesCollector(
+        config=config,
+        project_root=args.project_root,
+        root_module_name=args.root_module,
     )
+    sink = collector.stream(output, indent=_indent(args))
+    logger.info("Wrote %d nodes and %d edges to %s", sink.node_count, sink.link_count, output)
+    return 0
+
+
+def _run_incremental_collect(
+    args: argparse.Namespace,
+    config: ModulesCollectorConfig,
+    output: Path,
+    fmt: str,
+) -> int:
+    if fmt != "json":
+        raise ValueError("--baseline requires JSON output.")
+
+    if args.stream:
+        raise ValueError("--baseline cannot be combined with --stream.")
+
+    if config.collapse_level is not None or config.collapse_distributions:
+        raise ValueError("--baseline cannot be combined with --collapse-level or --collapse-distributions.")
+
+    baseline = InventoryBaseline.load(args.baseline)
+    collector = ModulesCollector(
+        config=config,
+        project_root=args.project_root,
+        root_module_name=args.root_module,
+        known_fingerprints=baseline.fingerprints,
+    )
+    document = baseline.merge(collector().to_dict(), collector.reused_packages)
+    delta = InventoryDelta.between(baseline, document)
+    delta_output: Path = args.delta_output or output.with_name(f"{strip_compression(output).stem}-{SUFFIX_DELTA}.json")
+
+    save_json(document, output, indent=_indent(args))
+    save_json(delta.to_dict(), delta_output, indent=2)
+    logger.info(
+        "Rescanned %d package(s), reused %d; %d added, %d removed, %d changed module(s)",
+        len(collector.fingerprints) - len(collector.reused_packages),
+        len(collector.reused_packages),
+        len(delta.added),
+        len(delta.removed),
+        len(delta.changed),
+    )
+    logger.info("Wrote %d nodes and %d edges to %s", len(document["nodes"]), len(document["links"]), output)
+    return 0
+
+
+def run_query(args: argparse.Namespace) -> int:
+    index: ReachabilityIndex[str] = ReachabilityIndex(_load_node_link_graph(args.graph))
+    for module in args.modules:
+        if module not in index:
+            raise ValueError(f"Module '{module}' is not in the graph {args.graph}")
+
+    match args.query:
+        case "reach":
+            source, target = args.modules
+            reachable = index.reaches(source, target)
+            print(f"{source} {'imports' if reachable else 'does not import'} {target}")
+            return 0 if reachable else 1
+        case _:
+            (module,) = args.modules
+            print(index.closure_size(module))
+            if args.list:
+                for dependency in sorted(index.closure(module)):
+                    print(dependency)
+
+            return 0
+
+
+def _load_node_link_graph(filepath: Path) -> nx.DiGraph:
+    graph = nx.DiGraph()
+    if is_pdagraph(filepath):
+        with PDAGraphFile(filepath) as binary:
+            identifiers = [binary.identifier(index) for index in range(len(binary))]
+            graph.add_nodes_from(identifiers)
+            graph.add_edges_from((identifiers[source], identifiers[target]) for source, target in binary.edges())
+
+        return graph
+
+    with open_text(filepath, "r") as file:
+        for key, value in read_node_link(file):
+            match key:
+                case "nodes":
+                    graph.add_node(value["id"])
+                case "links":
+                    graph.add_edge(value["source"], value["target"])
+
+    return graph
+
+
+def run_render(args: argparse.Namespace) -> int:
+    graph = ModuleGraph.load(args.graph)
+    output, fmt = resolve_output(
+        args.output,
+        args.format if args.format is not None or args.output is not None else "html",
+        strip_compression(args.graph).stem,
+    )
+    return export(
+        graph,
+        output,
+        fmt,
+        theme=args.theme or "light",
+        layout=args.layout,
+        indent=_indent(args),
+        layout_cache=args.layout_cache,
+    )
+
+
+def run_cycles(args: argparse.Namespace) -> int:
+    overrides = {field: getattr(args, field) for field in CYCLE_FIELDS if getattr(args, field) is not None}
+    config = ModuleImportsAnalyzerConfig(**overrides)
+    report = build_cycle_report(
+        ModuleGraph.load(args.graph),
+        length_bound=config.cycle_length_bound,
+        max_examples=config.cycle_examples,
+        time_budget=config.cycle_time_budget,
+    )
+    if args.output is not None:
+        save_json(report, args.output)
+
+    print(format_cycle_report(report))
+    return 1 if args.fail_on_cycle and report["cycle_count"] else 0
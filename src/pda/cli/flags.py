@@ -65,6 +65,9 @@ def _classify(annotation: Any) -> Tuple[Optional[str], Optional[Tuple[Any, ...]]
     if inner is int:
         return "int", None
 
+    if inner is float:
+        return "float", None
+
     if inner is str:
         return "str", None
 
@@ -110,6 +113,8 @@ def add_flags(parser: argparse.ArgumentParser, flags: Sequence[_Flag]) -> None:
                 parser.add_argument(option, dest=flag.field, choices=flag.choices, default=None, help=flag.help)
             case "int":
                 parser.add_argument(option, dest=flag.field, type=int, default=None, help=flag.help)
+            case "float":
+                parser.add_argument(option, dest=flag.field, type=float, default=None, help=flag.help)
             case _:
                 parser.add_argument(option, dest=flag.field, default=None, help=flag.help)
 
@@ -2,18 +2,18 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 from pda.config import LayoutMode, Theme
-from pda.models import ModuleGraph, module_pyvis_converter
+from pda.models import ModuleGraph, PackageRingLayout, RingLayoutSnapshot, module_pyvis_converter
 from pda.tools.logger import logger
-from pda.tools.serialization import save_html
+from pda.tools.serialization import save_html, strip_compression
 
-_EXTENSIONS: Dict[str, str] = {".json": "json", ".html": "html", ".htm": "html"}
+_EXTENSIONS: Dict[str, str] = {".json": "json", ".html": "html", ".htm": "html", ".pdagraph": "pdagraph"}
 
 
 def resolve_format(output: Path, fmt: Optional[str]) -> str:
-    suffix = output.suffix.lower()
+    suffix = strip_compression(output).suffix.lower()
     extension_format = _EXTENSIONS.get(suffix) if suffix else None
     if suffix and extension_format is None:
-        raise ValueError(f"Unsupported output extension '{output.suffix}'; expected .json, .html or .htm.")
+        raise ValueError(f"Unsupported output extension '{suffix}'; expected .json, .html, .htm or .pdagraph.")
 
     if fmt is not None:
         if extension_format is not None and extension_format != fmt:
@@ -32,19 +32,48 @@ def resolve_output(output: Optional[Path], fmt: Optional[str], stem: str) -> Tup
     return Path(f"{stem}.{resolved}"), resolved
 
 
-def _render_html(graph: ModuleGraph, *, theme: Theme, layout: Optional[LayoutMode]) -> str:
+def _render_html(
+    graph: ModuleGraph,
+    *,
+    theme: Theme,
+    layout: Optional[LayoutMode],
+    layout_cache: Optional[Path] = None,
+) -> str:
     converter = module_pyvis_converter(theme=theme, layout=layout)
     network = {**(converter.config.network or {}), "cdn_resources": "in_line"}
     converter.config = converter.config.model_copy(update={"network": network})
-    return converter(graph, html=True)
+    ring_layout = converter.layout if isinstance(converter.layout, PackageRingLayout) else None
+    if layout_cache is not None and ring_layout is None:
+        logger.warning("--layout-cache applies to the package_ring layout only; ignoring it.")
 
+    if layout_cache is None or ring_layout is None:
+        return converter(graph, html=True)
 
-def export(graph: ModuleGraph, output: Path, fmt: str, *, theme: Theme, layout: Optional[LayoutMode]) -> int:
+    ring_layout.snapshot = RingLayoutSnapshot.load(layout_cache) if layout_cache.exists() else RingLayoutSnapshot()
+    html = converter(graph, html=True)
+    if ring_layout.snapshot is not None:
+        ring_layout.snapshot.save(layout_cache)
+
+    return html
+
+
+def export(
+    graph: ModuleGraph,
+    output: Path,
+    fmt: str,
+    *,
+    theme: Theme,
+    layout: Optional[LayoutMode],
+    indent: Optional[int] = 2,
+    layout_cache: Optional[Path] = None,
+) -> int:
     match fmt:
         case "html":
-            save_html(_render_html(graph, theme=theme, layout=layout), output)
+            save_html(_render_html(graph, theme=theme, layout=layout, layout_cache=layout_cache), output)
+        case "pdagraph":
+            graph.save_binary(output)
         case _:
-            graph.save(output)
+            graph.save(output, indent=indent)
 
     logger.info("Wrote %d nodes and %d edges to %s", len(graph), len(graph.edges), output)
     return 0
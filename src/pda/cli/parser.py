@@ -2,7 +2,7 @@ import argparse
 from pathlib import Path
 from typing import List, get_args
 
-from pda.cli.commands import run_analyze, run_collect
+from pda.cli.commands import CYCLE_FIELDS, run_analyze, run_collect, run_cycles, run_query, run_render
 from pda.cli.flags import add_flags, flags_for
 from pda.config import (
     LayoutMode,
@@ -19,10 +19,15 @@ def _split_paths(value: str) -> List[Path]:
 def _add_output_format_flags(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--format",
-        choices=("json", "html"),
+        choices=("json", "html", "pdagraph"),
         default=None,
         help="Output format. Inferred from the --output extension when omitted, otherwise 'json'.",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write JSON without indentation. Any JSON output ending in .gz, .xz or .lzma is compressed.",
+    )
     parser.add_argument(
         "--theme",
         choices=get_args(Theme),
@@ -35,6 +40,13 @@ def _add_output_format_flags(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Node layout for HTML output. Defaults to the bundled configuration.",
     )
+    parser.add_argument(
+        "--layout-cache",
+        type=Path,
+        default=None,
+        help="Positions file for the package_ring layout. Modules that still fit their place in it keep it and "
+        "only the others are laid out; the file is rewritten with the new positions.",
+    )
 
 
 def _add_resolution_environment_flags(parser: argparse.ArgumentParser) -> None:
@@ -145,8 +157,92 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Output path. Format follows the extension or --format; defaults to '<root-module>-modules.json'.",
     )
+    collect.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Previous JSON output of 'pda collect'. Only packages whose fingerprint changed are rescanned.",
+    )
+    collect.add_argument(
+        "--delta-output",
+        type=Path,
+        default=None,
+        help="Where to write the added/removed/changed module delta against --baseline. "
+        "Defaults to '<output-stem>-delta.json' next to the output.",
+    )
+    collect.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each package to the JSON output as soon as it is collected instead of building the "
+        "whole graph in memory. Nodes keep their discovery order.",
+    )
     _add_output_format_flags(collect)
     add_flags(collect, flags_for(ModulesCollectorConfig))
     collect.set_defaults(handler=run_collect)
 
+    render = subparsers.add_parser(
+        "render",
+        help="Convert a graph exported as node-link JSON to interactive HTML or JSON without analysing again.",
+    )
+    _add_graph_argument(render)
+    render.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Output path. Format follows the extension or --format; defaults to '<graph-stem>.html'.",
+    )
+    _add_output_format_flags(render)
+    render.set_defaults(handler=run_render)
+
+    cycles = subparsers.add_parser(
+        "cycles",
+        help="Report the import cycles of a graph exported as node-link JSON.",
+    )
+    _add_graph_argument(cycles)
+    cycles.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Also write the report as JSON to this path.",
+    )
+    cycles.add_argument(
+        "--fail-on-cycle",
+        action="store_true",
+        help="Exit with 1 when the graph contains import cycles.",
+    )
+    add_flags(cycles, [flag for flag in flags_for(ModuleImportsAnalyzerConfig) if flag.field in CYCLE_FIELDS])
+    cycles.set_defaults(handler=run_cycles)
+
+    query = subparsers.add_parser(
+        "query",
+        help="Answer transitive dependency questions about a graph exported as node-link JSON.",
+    )
+    queries = query.add_subparsers(dest="query", required=True)
+    reach = queries.add_parser(
+        "reach",
+        help="Check whether one module transitively imports another. Exits with 1 when it does not.",
+    )
+    _add_graph_argument(reach)
+    reach.add_argument("modules", nargs=2, metavar="MODULE", help="Source and target node ids.")
+    reach.set_defaults(handler=run_query)
+
+    closure = queries.add_parser(
+        "closure",
+        help="Count the modules a module transitively imports.",
+    )
+    _add_graph_argument(closure)
+    closure.add_argument("modules", nargs=1, metavar="MODULE", help="Node id of the module.")
+    closure.add_argument("--list", action="store_true", help="Also print the id of every module in the closure.")
+    closure.set_defaults(handler=run_query)
+
     return parser
+
+
+def _add_graph_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "graph",
+        type=Path,
+        help="Node-link JSON written by 'pda analyze' or 'pda collect'.",
+    )
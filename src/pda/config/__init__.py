@@ -7,13 +7,15 @@ from pda.config.analyzer.scope import ScopeAnalyzerConfig
 from pda.config.base import BaseConfig
 from pda.config.pyvis.config import PyVisConfig
 from pda.config.pyvis.layout import (
+    LayeredConfig,
+    LayeredDirection,
     LayoutConfig,
     LayoutMode,
     RelaxationConfig,
     RingConfig,
 )
 from pda.config.pyvis.theme import Theme
-from pda.config.structures.graph import GraphSortMethod
+from pda.config.structures.graph import GraphBackendKind, GraphBackendType, GraphSortMethod
 from pda.config.types import ConfigT
 
 __all__ = [
@@ -27,12 +29,16 @@ __all__ = [
     "ModuleImportsAnalyzerConfig",
     "ScopeAnalyzerConfig",
     # Graph
+    "GraphBackendKind",
+    "GraphBackendType",
     "GraphSortMethod",
     # pyvis
     "Theme",
     "PyVisConfig",
     "LayoutConfig",
     "LayoutMode",
+    "LayeredConfig",
+    "LayeredDirection",
     "RingConfig",
     "RelaxationConfig",
 ]
@@ -6,6 +6,7 @@ from pydantic import Field, field_validator, model_validator
 from pda.config.analyzer.resolution import ModuleResolutionConfig
 from pda.config.analyzer.scan import ModuleScanConfig
 from pda.config.base import BaseConfig
+from pda.config.structures.graph import GraphBackendType
 from pda.exceptions import PDAExternalResolutionWarning
 
 
@@ -35,10 +36,22 @@ class ModuleAnalyzerConfig(BaseConfig):
         components; None = no collapsing. Distinct from 'max_depth', which bounds scan recursion
         relative to the entry point.""",
     )
+    collapse_distributions: bool = Field(
+        default=False,
+        description="""Post-processing collapse of the graph to one node per installed distribution.
+        Modules that do not belong to a distribution are collapsed to their top-level package.
+        Cannot be combined with 'collapse_level'.""",
+    )
     max_depth: Optional[int] = Field(
         default=None,
         description="Maximum recursion depth relative to the entry point. None means no limit.",
     )
+    graph_backend: GraphBackendType = Field(
+        default="networkx",
+        description="""Storage of the dependency graph. 'compact' interns modules to integer ids and keeps
+        edges in packed arrays, using a fraction of the memory on large graphs; 'networkx' stores
+        a networkx.DiGraph directly.""",
+    )
 
     @field_validator("collapse_level")
     @classmethod
@@ -48,6 +61,13 @@ class ModuleAnalyzerConfig(BaseConfig):
 
         return value
 
+    @model_validator(mode="after")
+    def _validate_collapse_mode(self) -> Self:
+        if self.collapse_distributions and self.collapse_level is not None:
+            raise ValueError("collapse_distributions cannot be combined with collapse_level")
+
+        return self
+
     @model_validator(mode="after")
     def _warn_if_external_depth_has_no_external_search_roots(self) -> Self:
         external_depth = self.module_scan.external_depth
@@ -15,3 +15,8 @@ class ModulesCollectorConfig(ModuleAnalyzerConfig):
         ),
         description="Configuration for scanning modules during collection.",
     )
+    fingerprint_packages: bool = Field(
+        default=False,
+        description="""Record a fingerprint of every discovered top-level package in the output, so that it
+        can serve as the baseline of a later incremental collection. Always on when a baseline is read.""",
+    )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field, field_validator
 
 from pda.config.analyzer.base import ModuleAnalyzerConfig
@@ -26,9 +28,15 @@ class ModuleImportsAnalyzerConfig(ModuleAnalyzerConfig):
         default=True,
         description="Whether to unify nodes representing the same module across different import paths.",
     )
+    tree_node_budget: Optional[int] = Field(
+        default=None,
+        description="""Maximum number of nodes of the tree view built when nodes are not unified; the tree
+        is cut at the deepest level that fits. None means no limit.""",
+    )
     fail_on_cycle: bool = Field(
         default=False,
-        description="Raise an error instead of reporting when the dependency graph contains import cycles.",
+        description="""Raise an error instead of reporting when the dependency graph contains import cycles.
+        Unless the graph is collapsed, analysis stops at the first cycle between local modules.""",
     )
     cycle_length_bound: int = Field(
         default=8,
@@ -39,10 +47,20 @@ class ModuleImportsAnalyzerConfig(ModuleAnalyzerConfig):
         default=5,
         description="Maximum number of example cycles reported per strongly-connected component.",
     )
+    cycle_time_budget: float = Field(
+        default=2.0,
+        description="""Wall-clock budget in seconds for searching example cycles within each
+        strongly-connected component; the shortest cycles found in time are reported.""",
+    )
     follow_conditional: bool = Field(
         default=False,
         description="Analyze imports from try/except branches.",
     )
+    read_bytecode: bool = Field(
+        default=False,
+        description="""Extract imports from valid cached bytecode (__pycache__) instead of parsing the source,
+        and from sourceless .pyc modules. Import scopes recovered from bytecode are approximate.""",
+    )
 
     @field_validator("cycle_length_bound")
     @classmethod
@@ -59,3 +77,19 @@ class ModuleImportsAnalyzerConfig(ModuleAnalyzerConfig):
             raise ValueError("cycle_examples must be >= 0")
 
         return value
+
+    @field_validator("cycle_time_budget")
+    @classmethod
+    def _validate_cycle_time_budget(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("cycle_time_budget must be > 0")
+
+        return value
+
+    @field_validator("tree_node_budget")
+    @classmethod
+    def _validate_tree_node_budget(cls, value: Optional[int]) -> Optional[int]:
+        if value is not None and value < 1:
+            raise ValueError("tree_node_budget must be >= 1")
+
+        return value
@@ -1,5 +1,7 @@
 from pda.config.pyvis.config import PyVisConfig
 from pda.config.pyvis.layout import (
+    LayeredConfig,
+    LayeredDirection,
     LayoutConfig,
     LayoutMode,
     RelaxationConfig,
@@ -12,6 +14,8 @@ __all__ = [
     "PyVisConfig",
     "LayoutConfig",
     "LayoutMode",
+    "LayeredConfig",
+    "LayeredDirection",
     "RingConfig",
     "RelaxationConfig",
 ]
@@ -4,7 +4,8 @@ from pydantic import Field, field_validator
 
 from pda.config.base import BaseConfig
 
-LayoutMode: TypeAlias = Literal["hierarchical", "package_ring"]
+LayoutMode: TypeAlias = Literal["hierarchical", "layered", "package_ring"]
+LayeredDirection: TypeAlias = Literal["LR", "RL", "UD", "DU"]
 RelaxationSolver: TypeAlias = Literal["forceAtlas2Based", "barnesHut", "repulsion", "hierarchicalRepulsion"]
 
 
@@ -62,6 +63,11 @@ class RingConfig(BaseConfig):
         default=0,
         description="Fixed seed for the jitter RNG, so a given graph always lays out identically.",
     )
+    vectorized: bool = Field(
+        default=True,
+        description="Run the package ordering and nudge sweeps on NumPy arrays when NumPy is installed. "
+        "Positions match the pure-Python sweeps up to floating-point rounding.",
+    )
 
     @field_validator("node_spacing", "ring_spacing", "min_radius")
     @classmethod
@@ -96,6 +102,42 @@ class RingConfig(BaseConfig):
         return value
 
 
+class LayeredConfig(BaseConfig):
+    direction: LayeredDirection = Field(
+        default="LR",
+        description="Direction the levels run in: left to right, right to left, top down or bottom up.",
+    )
+    level_separation: float = Field(
+        default=250.0,
+        description="Distance between consecutive levels.",
+    )
+    node_spacing: float = Field(
+        default=50.0,
+        description="Distance between neighbouring nodes of one level.",
+    )
+    crossing_sweeps: int = Field(
+        default=8,
+        description="Number of barycentric sweeps, alternately down and up the levels, that reorder each level "
+        "to reduce edge crossings.",
+    )
+
+    @field_validator("level_separation", "node_spacing")
+    @classmethod
+    def _validate_spacing(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("Layer distances must be positive.")
+
+        return value
+
+    @field_validator("crossing_sweeps")
+    @classmethod
+    def _validate_sweeps(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("Iteration counts must be >= 0.")
+
+        return value
+
+
 class RelaxationConfig(BaseConfig):
     enabled: bool = Field(
         default=False,
@@ -146,7 +188,9 @@ class RelaxationConfig(BaseConfig):
 class LayoutConfig(BaseConfig):
     mode: LayoutMode = Field(
         default="hierarchical",
-        description="'hierarchical' delegates to vis.js (current tree); 'package_ring' computes positions in Python.",
+        description="'hierarchical' delegates to vis.js (current tree); 'layered' computes a layered drawing "
+        "in Python and turns browser physics off; 'package_ring' computes positions in Python.",
     )
+    layered: LayeredConfig = Field(default_factory=LayeredConfig)
     ring: RingConfig = Field(default_factory=RingConfig)
     relaxation: RelaxationConfig = Field(default_factory=RelaxationConfig)
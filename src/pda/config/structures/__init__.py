@@ -1,5 +1,7 @@
-from pda.config.structures.graph import GraphSortMethod
+from pda.config.structures.graph import GraphBackendKind, GraphBackendType, GraphSortMethod
 
 __all__ = [
+    "GraphBackendKind",
+    "GraphBackendType",
     "GraphSortMethod",
 ]
@@ -1,3 +1,5 @@
 from typing import Literal, TypeAlias
 
 GraphSortMethod: TypeAlias = Literal["levels", "topological", "condensation", "auto"]
+GraphBackendType: TypeAlias = Literal["networkx", "compact"]
+GraphBackendKind: TypeAlias = Literal["networkx", "compact", "mapped"]
@@ -1,3 +1,4 @@
+from pda.models.module.binary import MappedBackend, PDAGraphFile
 from pda.models.module.graph import ModuleGraph
 from pda.models.module.layout import (
     PackageRingLayout,
@@ -5,6 +6,9 @@ from pda.models.module.layout import (
     module_pyvis_converter,
 )
 from pda.models.module.node import ModuleNode
+from pda.models.module.placement import RingLayoutSnapshot, RingPlacement
+from pda.models.module.pyramid import CollapsePyramid
+from pda.models.module.tree import ModuleTree
 from pda.models.paths.builder import build_path_tree
 from pda.models.paths.forest import PathForest, gather_python_files
 from pda.models.paths.graph import PathGraph
@@ -41,7 +45,13 @@ __all__ = [
     # Module-related graphs
     "ModuleNode",
     "ModuleGraph",
+    "MappedBackend",
+    "PDAGraphFile",
+    "CollapsePyramid",
+    "ModuleTree",
     "PackageRingLayout",
+    "RingLayoutSnapshot",
+    "RingPlacement",
     "module_layout_from_config",
     "module_pyvis_converter",
 ]
@@ -1,3 +1,4 @@
+from pda.models.module.binary import MappedBackend, PDAGraphFile
 from pda.models.module.graph import ModuleGraph
 from pda.models.module.layout import (
     PackageRingLayout,
@@ -5,11 +6,20 @@ from pda.models.module.layout import (
     module_pyvis_converter,
 )
 from pda.models.module.node import ModuleNode
+from pda.models.module.placement import RingLayoutSnapshot, RingPlacement
+from pda.models.module.pyramid import CollapsePyramid
+from pda.models.module.tree import ModuleTree
 
 __all__ = [
     "ModuleNode",
     "ModuleGraph",
+    "MappedBackend",
+    "PDAGraphFile",
+    "CollapsePyramid",
+    "ModuleTree",
     "PackageRingLayout",
+    "RingLayoutSnapshot",
+    "RingPlacement",
     "module_layout_from_config",
     "module_pyvis_converter",
 ]
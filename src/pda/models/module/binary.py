@@ -0,0 +1,465 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate, chain
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, Iterator, List, Literal, Mapping, Optional, Self, Sequence, Tuple
+
+import networkx as nx
+
+from pda.models.module.node import ModuleNode
+from pda.specification import ModuleCategory
+from pda.structures.graph.backend import GraphBackend
+from pda.structures.graph.compact import CompactBackend
+from pda.tools.serialization import strip_compression
+from pda.types import Pathlike
+
+PDAGRAPH_MAGIC: Final[bytes] = b"PDAGRAPH"
+PDAGRAPH_VERSION: Final[int] = 1
+
+# magic, version, node count, edge count, string count, then the offsets of the string
+# index, the string data, the node records, the edge offsets, the edge targets and the
+# graph attributes
+_HEADER: Final = struct.Struct("<8sIIII6Q")
+
+# id, label, origin, distribution, diagnostic and reason (string indices), level,
+# component, category and flags
+_RECORD: Final = struct.Struct("<6Iii2B2x")
+_STRING_FIELDS: Final[Tuple[str, ...]] = ("id", "label", "origin", "distribution", "diagnostic", "reason")
+
+_NONE: Final[int] = 0xFFFFFFFF
+_NO_COMPONENT: Final[int] = -1
+_UNAVAILABLE: Final[int] = 1
+_IN_CYCLE: Final[int] = 2
+
+_OFFSET_TYPECODE: Final = "Q"
+_INDEX_TYPECODE: Final = "I"
+_ALIGNMENT: Final[int] = 8
+
+_CATEGORIES: Final[List[ModuleCategory]] = list(ModuleCategory)
+_CATEGORY_CODES: Final[Dict[str, int]] = {category.value: code for code, category in enumerate(_CATEGORIES)}
+
+
+def write_pdagraph(
+    filepath: Pathlike,
+    nodes: Iterable[ModuleNode],
+    edges: Iterable[Tuple[ModuleNode, ModuleNode]],
+    *,
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """
+    Write a graph in the ``pdagraph`` binary format: a header, a table of the distinct
+    strings, one fixed-width record per node in the order given, the edges as a
+    compressed sparse row layout, and the graph attributes as JSON.
+
+    Edges are read back grouped by source, in the order of ``nodes``, and otherwise in
+    the order they are given. Graph backends report their edges that way, so writing the
+    nodes in backend order preserves the edge order.
+    """
+    if strip_compression(filepath) != Path(filepath):
+        raise ValueError(f"A pdagraph file is memory-mapped and cannot be compressed: {filepath}")
+
+    strings = _StringTable()
+    indices: Dict[ModuleNode, int] = {}
+    records = bytearray()
+    for node in nodes:
+        indices[node] = len(indices)
+        records += _encode_record(node.serialize(), strings)
+
+    successors: List[List[int]] = [[] for _ in range(len(indices))]
+    for source, target in edges:
+        successors[indices[source]].append(indices[target])
+
+    offsets = array(_OFFSET_TYPECODE, [0])
+    offsets.extend(accumulate(map(len, successors)))
+    targets = array(_INDEX_TYPECODE, chain.from_iterable(successors))
+    sections = [
+        _little_endian(strings.offsets),
+        strings.data,
+        bytes(records),
+        _little_endian(offsets),
+        _little_endian(targets),
+        json.dumps(dict(attributes or {})).encode("utf-8"),
+    ]
+
+    starts: List[int] = []
+    position = _HEADER.size
+    for section in sections:
+        position = _align(position)
+        starts.append(position)
+        position += len(section)
+
+    header = _HEADER.pack(PDAGRAPH_MAGIC, PDAGRAPH_VERSION, len(indices), len(targets), len(strings), *starts)
+    with open(filepath, "wb") as file:
+        file.write(header)
+        for start, section in zip(starts, sections):
+            file.write(bytes(start - file.tell()))
+            file.write(section)
+
+
+def is_pdagraph(filepath: Pathlike) -> bool:
+    """Whether ``filepath`` starts with the ``pdagraph`` magic bytes."""
+    with open(filepath, "rb") as file:
+        return file.read(len(PDAGRAPH_MAGIC)) == PDAGRAPH_MAGIC
+
+
+class PDAGraphFile:
+    """
+    A memory-mapped ``pdagraph`` file.
+
+    Opening one reads the header only. Strings, node records and edges are read from the
+    mapping when they are asked for, so the cost of a lookup does not depend on the size
+    of the graph and the operating system pages in only what is touched.
+
+    The mapping stays open until ``close`` is called or the file is used as a context
+    manager and the block exits; nothing can be read from the file afterwards.
+    """
+
+    def __init__(self, filepath: Pathlike) -> None:
+        self.filepath = Path(filepath)
+        with open(filepath, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer = memoryview(self._map)
+        self._views: List[memoryview] = [self._buffer]
+        try:
+            node_count, edge_count, string_count, starts = self._header()
+        except ValueError:
+            self.close()
+            raise
+
+        strings, data, records, offsets, targets, attributes = starts
+        self.node_count: int = node_count
+        self.edge_count: int = edge_count
+        self._string_offsets = self._integers(strings, _OFFSET_TYPECODE, string_count + 1)
+        self._strings = self._view(data, data + self._string_offsets[string_count])
+        self._records = self._view(records, records + node_count * _RECORD.size)
+        self._offsets = self._integers(offsets, _OFFSET_TYPECODE, node_count + 1)
+        self._targets = self._integers(targets, _INDEX_TYPECODE, edge_count)
+        self._attributes = self._view(attributes, len(self._buffer))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    def close(self) -> None:
+        """Release the views into the mapping and unmap the file. Closing twice does nothing."""
+        for view in reversed(self._views):
+            view.release()
+
+        self._views.clear()
+        self._map.close()
+
+    def attributes(self) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = json.loads(bytes(self._attributes))
+        return attributes
+
+    def string(self, index: int) -> Optional[str]:
+        if index == _NONE:
+            return None
+
+        return str(self._strings[self._string_offsets[index] : self._string_offsets[index + 1]], "utf-8")
+
+    def identifier(self, index: int) -> str:
+        (string,) = struct.unpack_from("<I", self._records, index * _RECORD.size)
+        identifier = self.string(string)
+        assert identifier is not None
+        return identifier
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """The node at ``index`` in the form of ``ModuleNode.serialize``."""
+        *strings, level, component, category, flags = _RECORD.unpack_from(self._records, index * _RECORD.size)
+        data: Dict[str, Any] = {"category": _CATEGORIES[category].value, "level": level}
+        for field, string in zip(_STRING_FIELDS, strings):
+            if string != _NONE:
+                data[field] = self.string(string)
+
+        if flags & _UNAVAILABLE:
+            data["available"] = False
+
+        if flags & _IN_CYCLE:
+            data["in_cycle"] = True
+            if component != _NO_COMPONENT:
+                data["component"] = component
+
+        return data
+
+    def successors(self, index: int) -> Sequence[int]:
+        return self._targets[self._offsets[index] : self._offsets[index + 1]]
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        offsets = self._offsets
+        targets = self._targets
+        for source in range(self.node_count):
+            for position in range(offsets[source], offsets[source + 1]):
+                yield source, targets[position]
+
+    def _header(self) -> Tuple[int, int, int, List[int]]:
+        """The node, edge and string counts and the section offsets, once the magic and version are checked."""
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError(f"Not a pdagraph file: {self.filepath}")
+
+        magic, version, node_count, edge_count, string_count, *starts = _HEADER.unpack_from(self._buffer)
+        if magic != PDAGRAPH_MAGIC:
+            raise ValueError(f"Not a pdagraph file: {self.filepath}")
+
+        if version != PDAGRAPH_VERSION:
+            raise ValueError(f"Unsupported pdagraph version {version} in {self.filepath}")
+
+        return node_count, edge_count, string_count, starts
+
+    def _view(self, start: int, stop: int) -> memoryview:
+        view = self._buffer[start:stop]
+        self._views.append(view)
+        return view
+
+    def _integers(self, start: int, typecode: Literal["I", "Q"], count: int) -> Sequence[int]:
+        """``count`` little-endian integers at ``start``, without copying them where possible."""
+        view = self._view(start, start + array(typecode).itemsize * count)
+        if sys.byteorder == "little":
+            integers = view.cast(typecode)
+            self._views.append(integers)
+            return integers
+
+        values = array(typecode)
+        values.frombytes(view)
+        values.byteswap()
+        return values
+
+
+class MappedBackend(GraphBackend[ModuleNode]):
+    """
+    A read-only view of a ``PDAGraphFile``.
+
+    Nodes are decoded on first access and kept; node lookups go through a table of
+    identifiers built the first time one is needed. The NetworkX graph is built for each
+    algorithm that needs one, like that of ``CompactBackend``, which is also what the
+    graph becomes on its first change: the file is copied into one and every call is passed on to it from then on.
+    Graphs derived from a mapped one use the compact backend too.
+    """
+
+    kind = "mapped"
+    derived = "compact"
+
+    def __init__(
+        self, file: Optional[PDAGraphFile] = None, *, delegate: Optional[GraphBackend[ModuleNode]] = None
+    ) -> None:
+        self._file = file
+        self._delegate = delegate
+        self._nodes: List[Optional[ModuleNode]] = [None] * len(file) if file is not None else []
+        self._indices: Optional[Dict[str, int]] = None
+        self._attributes: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def _sharing(
+        cls,
+        file: PDAGraphFile,
+        nodes: List[Optional[ModuleNode]],
+        indices: Optional[Dict[str, int]],
+        attributes: Optional[Dict[str, Any]],
+    ) -> Self:
+        """A backend over ``file`` that reuses the nodes and the identifier table decoded so far."""
+        backend = cls(file)
+        backend._nodes = nodes
+        backend._indices = indices
+        backend._attributes = attributes
+        return backend
+
+    @classmethod
+    def from_networkx(cls, graph: Optional[nx.DiGraph] = None) -> Self:
+        return cls(delegate=CompactBackend.from_networkx(graph))
+
+    def __iter__(self) -> Iterator[ModuleNode]:
+        if self._file is None:
+            return iter(self._storage)
+
+        return map(self._node, range(len(self._nodes)))
+
+    def __len__(self) -> int:
+        if self._file is None:
+            return len(self._storage)
+
+        return len(self._nodes)
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        if self._file is None:
+            return self._storage.attributes
+
+        if self._attributes is None:
+            self._attributes = self._file.attributes()
+
+        return self._attributes
+
+    def has_node(self, node: ModuleNode) -> bool:
+        if self._file is None:
+            return self._storage.has_node(node)
+
+        return self._index(node) is not None
+
+    def has_edge(self, source: ModuleNode, target: ModuleNode) -> bool:
+        if self._file is None:
+            return self._storage.has_edge(source, target)
+
+        source_index = self._index(source)
+        target_index = self._index(target)
+        if source_index is None or target_index is None:
+            return False
+
+        return target_index in self._file.successors(source_index)
+
+    def add_node(self, node: ModuleNode) -> None:
+        self._thaw().add_node(node)
+
+    def add_edge(self, source: ModuleNode, target: ModuleNode) -> None:
+        self._thaw().add_edge(source, target)
+
+    def update_node(self, node: ModuleNode, **attributes: Any) -> None:
+        self._thaw().update_node(node, **attributes)
+
+    def node_attributes(self, node: ModuleNode) -> Dict[str, Any]:
+        if self._file is None:
+            return self._storage.node_attributes(node)
+
+        if self._index(node) is None:
+            raise KeyError(node)
+
+        return {}
+
+    def edges(self) -> Iterator[Tuple[ModuleNode, ModuleNode]]:
+        if self._file is None:
+            return self._storage.edges()
+
+        return ((self._node(source), self._node(target)) for source, target in self._file.edges())
+
+    def number_of_edges(self) -> int:
+        if self._file is None:
+            return self._storage.number_of_edges()
+
+        return self._file.edge_count
+
+    def clear(self) -> None:
+        self._thaw().clear()
+
+    def copy(self) -> Self:
+        if self._file is None:
+            return self.__class__(delegate=self._storage.copy())
+
+        attributes = dict(self._attributes) if self._attributes is not None else None
+        return self._sharing(self._file, self._nodes, self._indices, attributes)
+
+    def networkx(self) -> nx.DiGraph:
+        if self._file is None:
+            return self._storage.networkx()
+
+        graph = nx.DiGraph()
+        graph.graph = self.attributes
+        graph.add_nodes_from(self)
+        graph.add_edges_from(self.edges())
+        return graph
+
+    @property
+    def _storage(self) -> GraphBackend[ModuleNode]:
+        assert self._delegate is not None
+        return self._delegate
+
+    def _thaw(self) -> GraphBackend[ModuleNode]:
+        if self._file is not None:
+            backend: CompactBackend[ModuleNode] = CompactBackend()
+            backend.attributes.update(self.attributes)
+            for node in self:
+                backend.add_node(node)
+
+            for source, target in self.edges():
+                backend.add_edge(source, target)
+
+            backend.freeze()
+            self._delegate = backend
+            self._file = None
+            self._nodes = []
+            self._indices = None
+            self._attributes = None
+
+        return self._storage
+
+    def _node(self, index: int) -> ModuleNode:
+        node = self._nodes[index]
+        if node is None:
+            assert self._file is not None
+            node = self._nodes[index] = ModuleNode.deserialize(self._file.record(index))
+
+        return node
+
+    def _index(self, node: ModuleNode) -> Optional[int]:
+        if self._indices is None:
+            assert self._file is not None
+            self._indices = {self._file.identifier(index): index for index in range(len(self._nodes))}
+
+        return self._indices.get(node.identifier)
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self._indices: Dict[str, int] = {}
+        self.offsets = array(_OFFSET_TYPECODE, [0])
+        self._data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self._data)
+
+    def intern(self, string: Optional[str]) -> int:
+        if string is None:
+            return _NONE
+
+        index = self._indices.get(string)
+        if index is None:
+            index = self._indices[string] = len(self._indices)
+            self._data += string.encode("utf-8")
+            self.offsets.append(len(self._data))
+
+        return index
+
+
+def _encode_record(data: Mapping[str, Any], strings: _StringTable) -> bytes:
+    flags = 0
+    if not data.get("available", True):
+        flags |= _UNAVAILABLE
+
+    if data.get("in_cycle", False):
+        flags |= _IN_CYCLE
+
+    component = data.get("component")
+    return _RECORD.pack(
+        *(strings.intern(data.get(field)) for field in _STRING_FIELDS),
+        data.get("level", 0),
+        _NO_COMPONENT if component is None else component,
+        _CATEGORY_CODES[data.get("category", ModuleCategory.UNKNOWN.value)],
+        flags,
+    )
+
+
+def _align(position: int) -> int:
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _little_endian(values: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
@@ -1,39 +1,105 @@
-from typing import Dict, FrozenSet, Self
+from contextlib import ExitStack
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Self, Tuple
 
 import networkx as nx
 
-from pda.config import GraphSortMethod
+from pda.config import GraphBackendType, GraphSortMethod
 from pda.constants import DELIMITER
+from pda.models.module.binary import MappedBackend, PDAGraphFile, is_pdagraph, write_pdagraph
 from pda.models.module.node import ModuleNode
 from pda.structures.graph.base import Graph
+from pda.structures.graph.node_link import read_node_link
+from pda.tools.serialization import open_text
+from pda.types import Pathlike
 
 
 class ModuleGraph(Graph[ModuleNode]):
-    def _quotient_graph(self, level: int) -> nx.DiGraph:
-        def partition(node1: ModuleNode, node2: ModuleNode) -> bool:
-            return node1.module.prefix(level) == node2.module.prefix(level)
-
-        return nx.quotient_graph(
-            self._graph,
-            partition,
-            create_using=nx.DiGraph,
+    @classmethod
+    def load(cls, filepath: Pathlike, *, backend: GraphBackendType = "networkx") -> Self:
+        """
+        Read a graph written by ``save``, compressed or not, parsing the file incrementally
+        so that only the graph being built is held in memory. Nodes are rebuilt with
+        ``ModuleNode.deserialize``; neither the filesystem nor the resolver is consulted.
+
+        A file written by ``save_binary`` is memory-mapped with ``load_binary`` instead,
+        whatever ``backend`` is given.
+        """
+        if is_pdagraph(filepath):
+            return cls.load_binary(filepath)
+
+        with open_text(filepath, "r") as file:
+            return cls._from_members(read_node_link(file), backend=backend)
+
+    @classmethod
+    def load_binary(cls, filepath: Pathlike) -> Self:
+        """
+        Memory-map a graph written by ``save_binary``. Only the header is read up front;
+        nodes and edges are decoded as they are visited, and the graph is copied into the
+        compact backend the first time it is changed.
+
+        The file stays mapped for as long as the graph, or a view or copy of it made before
+        the first change, reads from it.
+        """
+        with ExitStack() as stack:
+            file = stack.enter_context(PDAGraphFile(filepath))
+            graph = cls()
+            graph._backend = MappedBackend(file)
+            stack.pop_all()
+
+        return graph
+
+    def save_binary(self, filepath: Pathlike) -> None:
+        """Write the graph in the ``pdagraph`` binary format, which ``load_binary`` reads back in the same order."""
+        write_pdagraph(filepath, self._backend, self._backend.edges(), attributes=self._backend.attributes)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], *, backend: GraphBackendType = "networkx") -> Self:
+        """The inverse of ``to_dict``."""
+        members = chain(
+            (("graph", data["graph"]),) if "graph" in data else (),
+            (("nodes", node) for node in data.get("nodes", ())),
+            (("links", link) for link in data.get("links", ())),
         )
+        return cls._from_members(members, backend=backend)
+
+    @classmethod
+    def _from_members(cls, members: Iterable[Tuple[str, Any]], *, backend: GraphBackendType) -> Self:
+        """
+        Nodes are added in the order their first link appears, then the isolated ones, so
+        that the edges of the rebuilt graph come out in the order they were written.
+        """
+        graph = cls(backend=backend)
+        nodes: Dict[str, ModuleNode] = {}
+        links: List[Tuple[str, str]] = []
+        for key, value in members:
+            match key:
+                case "nodes":
+                    nodes[value["id"]] = ModuleNode.deserialize(value)
+                case "links":
+                    links.append((value["source"], value["target"]))
+                case "graph":
+                    graph.attributes.update(value)
+
+        edges = [(cls._lookup(nodes, source), cls._lookup(nodes, target)) for source, target in links]
+        for source, _ in edges:
+            graph.add_node(source)
+
+        for node in nodes.values():
+            graph.add_node(node)
+
+        for source, target in edges:
+            graph.add_edge(source, target)
+
+        return graph
 
     @staticmethod
-    def _relabel_quotient_graph(
-        quotient: nx.DiGraph,
-        level: int,
-        *,
-        qualified_name: bool = True,
-    ) -> nx.DiGraph:
-        representatives: Dict[FrozenSet[ModuleNode], ModuleNode] = {}
-        for equivalence_class in quotient.nodes():
-            representative = min(equivalence_class, key=lambda node: node.module.qualified_name)
-            prefix = representative.module.prefix(level)
-            label = prefix if qualified_name else prefix.split(DELIMITER)[-1]
-            representatives[equivalence_class] = ModuleNode(representative.module, label=label)
+    def _lookup(nodes: Dict[str, ModuleNode], identifier: str) -> ModuleNode:
+        node = nodes.get(identifier)
+        if node is None:
+            raise ValueError(f"A link refers to the unknown node '{identifier}'")
 
-        return nx.relabel_nodes(quotient, representatives)
+        return node
 
     def simplify(
         self,
@@ -47,8 +113,55 @@ class ModuleGraph(Graph[ModuleNode]):
         Nodes sharing the same prefix up to `level` are merged into a single representative
         node. ``level=0`` collapses all submodules into their top-level package.
         """
-        quotient = self._quotient_graph(level)
-        collapsed = self._relabel_quotient_graph(quotient, level, qualified_name=qualified_name)
-        collapsed.remove_edges_from(nx.selfloop_edges(collapsed))
+
+        def bucket(node: ModuleNode) -> str:
+            return node.module.prefix(level)
+
+        def label(prefix: str) -> str:
+            return prefix if qualified_name else prefix.split(DELIMITER)[-1]
+
+        return self._collapse(bucket, label=label, sort_method=sort_method)
+
+    def collapse_distributions(self, *, sort_method: GraphSortMethod = "topological") -> Self:
+        """
+        Collapse the graph to one node per installed distribution. Modules without a known
+        distribution (local, standard-library or unresolved ones) are collapsed into their
+        top-level package instead.
+        """
+        return self._collapse(self._distribution_bucket, sort_method=sort_method)
+
+    @staticmethod
+    def _distribution_bucket(node: ModuleNode) -> str:
+        return node.module.distribution or node.module.top_level_module
+
+    def _collapse(
+        self,
+        bucket: Callable[[ModuleNode], str],
+        *,
+        label: Callable[[str], str] = str,
+        sort_method: GraphSortMethod,
+    ) -> Self:
+        """
+        Merge nodes sharing a bucket into a single node, represented by the member with the
+        smallest qualified name and labelled after the bucket. Every node is bucketed exactly
+        once, so the collapse is linear in the size of the graph.
+        """
+        buckets: Dict[ModuleNode, str] = {}
+        representatives: Dict[str, ModuleNode] = {}
+        for node in self:
+            key = bucket(node)
+            buckets[node] = key
+            current = representatives.get(key)
+            if current is None or node.module.qualified_name < current.module.qualified_name:
+                representatives[key] = node
+
+        collapsed_nodes = {key: ModuleNode(node.module, label=label(key)) for key, node in representatives.items()}
+        collapsed = nx.DiGraph()
+        collapsed.add_nodes_from(collapsed_nodes.values())
+        for source, target in self.edges:
+            source_key, target_key = buckets[source], buckets[target]
+            if source_key != target_key:
+                collapsed.add_edge(collapsed_nodes[source_key], collapsed_nodes[target_key])
+
         sorted_graph = self._sort(collapsed, method=sort_method)
-        return self.__class__(graph=sorted_graph)
+        return self._derive(sorted_graph)
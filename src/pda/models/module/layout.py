@@ -1,22 +1,33 @@
 import math
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
 from random import Random
-from typing import Any, Dict, Final, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Collection, Dict, Final, List, Optional, Set, Tuple, TypeAlias
 
 from pda.config import PyVisConfig, Theme
 from pda.config.pyvis.layout import LayoutConfig, LayoutMode
 from pda.constants import DELIMITER
 from pda.models.module.graph import ModuleGraph
 from pda.models.module.node import ModuleNode
+from pda.models.module.placement import RingLayoutSnapshot, RingPlacement
 from pda.structures.graph.base import Graph
 from pda.structures.graph.converter import PyVisConverter
+from pda.structures.graph.layered import LayeredLayout
 from pda.structures.graph.layout import GraphLayout, LayoutResult, Position
 
+if TYPE_CHECKING:
+    from pda.models.module.layout_arrays import RingArrays
+
 _VIRTUAL_ROOT: Final[str] = ""
 _TWO_PI: Final[float] = 2.0 * math.pi
 _EPSILON: Final[float] = 1e-9
+_TOLERANCE: Final[float] = 1e-6
+
+# A spatial hash cell: ring, then the column and row of the square cell.
+_Cell: TypeAlias = Tuple[int, int, int]
 
 
 @dataclass
@@ -32,8 +43,13 @@ class _TreeNode:
 
 
 class PackageRingLayout(GraphLayout[ModuleNode]):
-    def __init__(self, config: LayoutConfig) -> None:
+    def __init__(self, config: LayoutConfig, *, snapshot: Optional[RingLayoutSnapshot] = None) -> None:
+        """
+        With a ``snapshot``, modules that still fit their previous placement keep it and
+        only the others are laid out; ``snapshot`` is then replaced by the new placements.
+        """
         self._config = config
+        self.snapshot = snapshot
 
     def compute(self, graph: Graph[ModuleNode]) -> Optional[LayoutResult[ModuleNode]]:
         if graph.empty or not isinstance(graph, ModuleGraph):
@@ -45,15 +61,27 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         subtree_sets: Dict[str, Set[ModuleNode]] = {prefix: set(modules) for prefix, modules in subtree_modules.items()}
         self._leaf_counts(tree, root, subtree_modules)
         neighbours = self._neighbours(graph)
+        arrays = self._arrays(tree, root, subtree_modules, neighbours)
+        previous = self._previous(subtree_modules[root])
 
-        node_angle = self._order(tree, root, subtree_modules, subtree_sets, neighbours)
+        node_angle = self._order(tree, root, subtree_modules, subtree_sets, neighbours, arrays, previous)
         node_radius, node_band, node_ring = self._radii(tree, root_depth, node_angle)
-        node_angle = self._nudge(tree, node_angle, node_radius, neighbours)
         node_wedge = self._node_wedges(tree, self._config.ring.wedge_margin)
-        node_angle, node_radius = self._separate(node_angle, node_radius, node_band, node_wedge, node_ring)
+        kept = self._kept(previous, node_ring, node_wedge, node_band)
+        for module, placement in kept.items():
+            node_angle[module] = placement.angle
+            node_radius[module] = math.hypot(placement.x, placement.y)
+
+        node_angle = self._nudge(tree, node_angle, node_radius, neighbours, arrays, kept)
+        node_angle, node_radius = self._separate(node_angle, node_radius, node_band, node_wedge, node_ring, kept)
 
         rng = Random(self._config.ring.seed)
         positions = self._positions(node_angle, node_radius, rng)
+        for module, placement in kept.items():
+            positions[module] = (placement.x, placement.y)
+
+        if self.snapshot is not None:
+            self.snapshot = self._snapshot(positions, node_angle, node_ring)
 
         return LayoutResult(
             positions=positions,
@@ -137,6 +165,21 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
 
         return neighbours
 
+    def _arrays(
+        self,
+        tree: Dict[str, _TreeNode],
+        root: str,
+        subtree_modules: Dict[str, List[ModuleNode]],
+        neighbours: Dict[ModuleNode, List[ModuleNode]],
+    ) -> Optional["RingArrays"]:
+        if not self._config.ring.vectorized or find_spec("numpy") is None:
+            return None
+
+        from pda.models.module.layout_arrays import RingArrays
+
+        prefix_depths = {prefix: branch.depth for prefix, branch in tree.items() if prefix != root}
+        return RingArrays(subtree_modules[root], neighbours, subtree_modules, prefix_depths)
+
     def _order(
         self,
         tree: Dict[str, _TreeNode],
@@ -144,41 +187,78 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         subtree_modules: Dict[str, List[ModuleNode]],
         subtree_sets: Dict[str, Set[ModuleNode]],
         neighbours: Dict[ModuleNode, List[ModuleNode]],
+        arrays: Optional["RingArrays"] = None,
+        previous: Optional[Dict[ModuleNode, RingPlacement]] = None,
     ) -> Dict[ModuleNode, float]:
+        """
+        Order the children of every package by where their modules connect to. Given the
+        previous placements, a single pass orders them by where their modules were instead.
+        """
         node_angle = self._assign_wedges(tree, root)
-        for _ in range(self._config.ring.order_iterations):
+        for _ in range(1 if previous else self._config.ring.order_iterations):
+            if previous:
+                barycenters = self._previous_barycenters(tree, subtree_modules, previous)
+            else:
+                barycenters = self._barycenters(tree, subtree_modules, subtree_sets, neighbours, node_angle, arrays)
+
             for branch in tree.values():
                 if len(branch.children) < 2:
                     continue
 
                 mid = (branch.wedge_start + branch.wedge_end) / 2
-                branch.children.sort(
-                    key=lambda child: self._order_key(
-                        child,
-                        mid,
-                        tree,
-                        subtree_modules,
-                        subtree_sets,
-                        neighbours,
-                        node_angle,
-                    )
-                )
+                branch.children.sort(key=partial(self._order_key, mid=mid, tree=tree, barycenters=barycenters))
 
             node_angle = self._assign_wedges(tree, root)
 
         return self._spread_modules(tree)
 
-    def _order_key(
+    def _barycenters(
         self,
-        child: str,
-        mid: float,
         tree: Dict[str, _TreeNode],
         subtree_modules: Dict[str, List[ModuleNode]],
         subtree_sets: Dict[str, Set[ModuleNode]],
         neighbours: Dict[ModuleNode, List[ModuleNode]],
         node_angle: Dict[ModuleNode, float],
+        arrays: Optional["RingArrays"],
+    ) -> Dict[str, Optional[float]]:
+        if arrays is not None:
+            return arrays.barycenters(node_angle)
+
+        return {
+            child: self._subtree_barycenter(child, subtree_modules, subtree_sets, neighbours, node_angle)
+            for branch in tree.values()
+            if len(branch.children) >= 2
+            for child in branch.children
+        }
+
+    def _previous_barycenters(
+        self,
+        tree: Dict[str, _TreeNode],
+        subtree_modules: Dict[str, List[ModuleNode]],
+        previous: Dict[ModuleNode, RingPlacement],
+    ) -> Dict[str, Optional[float]]:
+        barycenters: Dict[str, Optional[float]] = {}
+        for branch in tree.values():
+            if len(branch.children) < 2:
+                continue
+
+            for child in branch.children:
+                angles = [previous[module].angle for module in subtree_modules[child] if module in previous]
+                barycenters[child] = self._circular_mean(
+                    sum(math.cos(angle) for angle in angles),
+                    sum(math.sin(angle) for angle in angles),
+                )
+
+        return barycenters
+
+    @staticmethod
+    def _order_key(
+        child: str,
+        mid: float,
+        tree: Dict[str, _TreeNode],
+        barycenters: Dict[str, Optional[float]],
     ) -> Tuple[float, str]:
-        barycenter = self._subtree_barycenter(child, subtree_modules, subtree_sets, neighbours, node_angle)
+        barycenter = barycenters.get(child)
         if barycenter is None:
             branch = tree[child]
             barycenter = (branch.wedge_start + branch.wedge_end) / 2
@@ -356,6 +436,7 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         node_band: Dict[ModuleNode, Tuple[float, float]],
         node_wedge: Dict[ModuleNode, Tuple[float, float]],
         node_ring: Dict[ModuleNode, int],
+        kept: Collection[ModuleNode] = (),
     ) -> Tuple[Dict[ModuleNode, float], Dict[ModuleNode, float]]:
         repulsion = self._config.ring.repulsion
         if repulsion <= 0 or self._config.ring.repulsion_iterations == 0:
@@ -364,9 +445,9 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         min_separation = self._config.ring.node_spacing
         modules = sorted(node_angle, key=lambda node: (node.module.qualified_name, node.ordinal))
         order = {module: index for index, module in enumerate(modules)}
-        by_ring: Dict[int, List[ModuleNode]] = defaultdict(list)
-        for module in modules:
-            by_ring[node_ring[module]].append(module)
+        moving = [module for module in modules if module not in kept]
+        if not moving:
+            return node_angle, node_radius
 
         angle = dict(node_angle)
         radius = dict(node_radius)
@@ -375,11 +456,11 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
                 module: (radius[module] * math.cos(angle[module]), radius[module] * math.sin(angle[module]))
                 for module in modules
             }
+            grid = self._spatial_hash(modules, points, node_ring, min_separation)
             next_angle = dict(angle)
             next_radius = dict(radius)
-            for module in modules:
-                ring = node_ring[module]
-                candidates = by_ring[ring - 1] + by_ring[ring] + by_ring[ring + 1]
+            for module in moving:
+                candidates = self._nearby(module, points, node_ring, grid, min_separation, order)
                 push_x, push_y = self._repulsion_vector(module, points, candidates, min_separation, order, len(modules))
                 point_x, point_y = points[module]
                 moved_x = point_x + repulsion * push_x
@@ -392,6 +473,57 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
 
         return angle, radius
 
+    @staticmethod
+    def _spatial_hash(
+        modules: List[ModuleNode],
+        points: Dict[ModuleNode, Position],
+        node_ring: Dict[ModuleNode, int],
+        cell_size: float,
+    ) -> Dict[_Cell, List[ModuleNode]]:
+        """
+        Bucket the modules of every ring into square cells of side ``cell_size``. Each cell
+        keeps its modules in the order of ``modules``.
+        """
+        grid: Dict[_Cell, List[ModuleNode]] = defaultdict(list)
+        for module in modules:
+            point_x, point_y = points[module]
+            grid[(node_ring[module], math.floor(point_x / cell_size), math.floor(point_y / cell_size))].append(module)
+
+        return grid
+
+    @staticmethod
+    def _nearby(
+        module: ModuleNode,
+        points: Dict[ModuleNode, Position],
+        node_ring: Dict[ModuleNode, int],
+        grid: Dict[_Cell, List[ModuleNode]],
+        cell_size: float,
+        order: Dict[ModuleNode, int],
+    ) -> List[ModuleNode]:
+        """
+        The modules of the same and the adjacent rings that lie in the cells around ``module``.
+        Any two modules closer than ``cell_size`` are in neighbouring cells, so these are all
+        the modules that can repel it. They come ring by ring and in module order, the order
+        in which the pushes were always summed, so the layout does not depend on the grid.
+        """
+        point_x, point_y = points[module]
+        cell_x = math.floor(point_x / cell_size)
+        cell_y = math.floor(point_y / cell_size)
+        ring = node_ring[module]
+
+        candidates: List[ModuleNode] = []
+        for neighbour_ring in (ring - 1, ring, ring + 1):
+            nearby = [
+                other
+                for offset_x in (-1, 0, 1)
+                for offset_y in (-1, 0, 1)
+                for other in grid.get((neighbour_ring, cell_x + offset_x, cell_y + offset_y), ())
+            ]
+            nearby.sort(key=order.__getitem__)
+            candidates.extend(nearby)
+
+        return candidates
+
     @staticmethod
     def _repulsion_vector(
         module: ModuleNode,
@@ -427,11 +559,16 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         return (push_x, push_y)
 
     @staticmethod
-    def _clamp_angle(angle: float, wedge: Tuple[float, float]) -> float:
+    def _nearest_turn(angle: float, wedge: Tuple[float, float]) -> float:
+        """``angle`` shifted by whole turns to lie within half a turn of the wedge centre."""
         low, high = wedge
         mid = (low + high) / 2
-        nearest = mid + ((angle - mid + math.pi) % _TWO_PI - math.pi)
-        return min(high, max(low, nearest))
+        return mid + ((angle - mid + math.pi) % _TWO_PI - math.pi)
+
+    @classmethod
+    def _clamp_angle(cls, angle: float, wedge: Tuple[float, float]) -> float:
+        low, high = wedge
+        return min(high, max(low, cls._nearest_turn(angle, wedge)))
 
     def _nudge(
         self,
@@ -439,16 +576,21 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
         node_angle: Dict[ModuleNode, float],
         node_radius: Dict[ModuleNode, float],
         neighbours: Dict[ModuleNode, List[ModuleNode]],
+        arrays: Optional["RingArrays"] = None,
+        kept: Collection[ModuleNode] = (),
     ) -> Dict[ModuleNode, float]:
         pull = self._config.ring.edge_pull
         margin = self._config.ring.wedge_margin
         if pull <= 0 or self._config.ring.nudge_passes == 0:
             return node_angle
 
-        bounds = self._leaf_bounds(tree, margin)
+        bounds = {module: bound for module, bound in self._leaf_bounds(tree, margin).items() if module not in kept}
         if not bounds:
             return node_angle
 
+        if arrays is not None:
+            return arrays.nudge(node_angle, node_radius, bounds, pull=pull, passes=self._config.ring.nudge_passes)
+
         best = dict(node_angle)
         best_cost = self._edge_cost(best, node_radius, neighbours)
         for _ in range(self._config.ring.nudge_passes):
@@ -508,6 +650,60 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
 
         return cost
 
+    def _settings(self) -> Dict[str, Any]:
+        return self._config.ring.model_dump(mode="json")
+
+    def _previous(self, modules: List[ModuleNode]) -> Dict[ModuleNode, RingPlacement]:
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.settings != self._settings():
+            return {}
+
+        placements = snapshot.placements
+        return {module: placements[module.identifier] for module in modules if module.identifier in placements}
+
+    def _kept(
+        self,
+        previous: Dict[ModuleNode, RingPlacement],
+        node_ring: Dict[ModuleNode, int],
+        node_wedge: Dict[ModuleNode, Tuple[float, float]],
+        node_band: Dict[ModuleNode, Tuple[float, float]],
+    ) -> Dict[ModuleNode, RingPlacement]:
+        """
+        The previous placements that still fit: on the module's ring, inside its radial
+        band and at most one wedge width outside its wedge. Wedges shift a little whenever
+        a package gains or loses modules, so a placement just outside is moved onto the
+        wedge edge instead of being laid out again.
+        """
+        slack = self._config.ring.jitter * self._config.ring.ring_spacing + _TOLERANCE
+        kept: Dict[ModuleNode, RingPlacement] = {}
+        for module, placement in previous.items():
+            low, high = node_band[module]
+            radius = math.hypot(placement.x, placement.y)
+            if placement.ring != node_ring[module] or not low - slack <= radius <= high + slack:
+                continue
+
+            wedge = node_wedge[module]
+            angle = self._clamp_angle(placement.angle, wedge)
+            shift = abs(angle - self._nearest_turn(placement.angle, wedge))
+            if shift <= _TOLERANCE:
+                kept[module] = placement
+            elif shift <= wedge[1] - wedge[0]:
+                kept[module] = RingPlacement(radius * math.cos(angle), radius * math.sin(angle), angle, placement.ring)
+
+        return kept
+
+    def _snapshot(
+        self,
+        positions: Dict[ModuleNode, Position],
+        node_angle: Dict[ModuleNode, float],
+        node_ring: Dict[ModuleNode, int],
+    ) -> RingLayoutSnapshot:
+        placements = {
+            module.identifier: RingPlacement(x, y, node_angle[module], node_ring[module])
+            for module, (x, y) in positions.items()
+        }
+        return RingLayoutSnapshot(settings=self._settings(), placements=placements)
+
     def _positions(
         self,
         node_angle: Dict[ModuleNode, float],
@@ -572,6 +768,8 @@ class PackageRingLayout(GraphLayout[ModuleNode]):
 
 def module_layout_from_config(config: LayoutConfig) -> Optional[GraphLayout[ModuleNode]]:
     match config.mode:
+        case "layered":
+            return LayeredLayout(config)
         case "package_ring":
             return PackageRingLayout(config)
         case _:
@@ -0,0 +1,147 @@
+from typing import Dict, List, Optional, Sequence, Tuple, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from pda.models.module.node import ModuleNode
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+IndexArray: TypeAlias = npt.NDArray[np.intp]
+
+_TWO_PI: float = 2.0 * np.pi
+_EPSILON: float = 1e-9
+
+
+class RingArrays:
+    """
+    The edge sweeps of ``PackageRingLayout`` on NumPy arrays.
+
+    Modules are numbered by their position in ``modules`` and the neighbour lists become a
+    pair of index arrays, one entry per (module, neighbour) pair. Per-module and
+    per-package sums are then a single ``np.bincount`` over those pairs. The pairs are
+    listed module by module in neighbour order, so with ``modules`` in the depth-first
+    order of the package tree every sum adds the same terms in the same order as the
+    pure-Python passes.
+    """
+
+    def __init__(
+        self,
+        modules: Sequence[ModuleNode],
+        neighbours: Dict[ModuleNode, List[ModuleNode]],
+        subtree_modules: Dict[str, List[ModuleNode]],
+        prefix_depths: Dict[str, int],
+    ) -> None:
+        self.modules: List[ModuleNode] = list(modules)
+        self.ids: Dict[ModuleNode, int] = {module: index for index, module in enumerate(self.modules)}
+
+        sources: List[int] = []
+        targets: List[int] = []
+        for index, module in enumerate(self.modules):
+            for neighbour in neighbours.get(module, ()):
+                sources.append(index)
+                targets.append(self.ids[neighbour])
+
+        self.sources: IndexArray = np.array(sources, dtype=np.intp)
+        self.targets: IndexArray = np.array(targets, dtype=np.intp)
+        self.prefixes: List[str] = list(prefix_depths)
+        self._prefix_pairs, self._prefix_targets = self._outgoing_pairs(subtree_modules, prefix_depths)
+
+    def to_array(self, values: Dict[ModuleNode, float]) -> FloatArray:
+        return np.fromiter((values[module] for module in self.modules), dtype=np.float64, count=len(self.modules))
+
+    def to_dict(self, values: FloatArray, *, order: Dict[ModuleNode, float]) -> Dict[ModuleNode, float]:
+        """``values`` keyed by module, in the key order of ``order``."""
+        listed = values.tolist()
+        return {module: listed[self.ids[module]] for module in order}
+
+    def barycenters(self, node_angle: Dict[ModuleNode, float]) -> Dict[str, Optional[float]]:
+        """
+        The circular mean angle of the edges leaving each package subtree, taken at the
+        modules they lead to, or ``None`` where no edge leaves or the pulls cancel out.
+        """
+        angles = self.to_array(node_angle)[self._prefix_targets]
+        count = len(self.prefixes)
+        sum_cos = np.bincount(self._prefix_pairs, weights=np.cos(angles), minlength=count)
+        sum_sin = np.bincount(self._prefix_pairs, weights=np.sin(angles), minlength=count)
+        means = np.arctan2(sum_sin, sum_cos) % _TWO_PI
+        cancelled = (np.abs(sum_cos) < _EPSILON) & (np.abs(sum_sin) < _EPSILON)
+        return {
+            prefix: None if empty else mean
+            for prefix, mean, empty in zip(self.prefixes, means.tolist(), cancelled.tolist())
+        }
+
+    def nudge(
+        self,
+        node_angle: Dict[ModuleNode, float],
+        node_radius: Dict[ModuleNode, float],
+        bounds: Dict[ModuleNode, Tuple[float, float]],
+        *,
+        pull: float,
+        passes: int,
+    ) -> Dict[ModuleNode, float]:
+        """
+        Up to ``passes`` nudge passes, each moving every bounded module ``pull`` of the way
+        to its neighbours' mean angle, kept only while they shorten the edges.
+        """
+        count = len(self.modules)
+        best = self.to_array(node_angle)
+        radius = self.to_array(node_radius)
+        bounded = np.fromiter((module in bounds for module in self.modules), dtype=np.bool_, count=count)
+        low = np.fromiter((bounds.get(module, (0.0, 0.0))[0] for module in self.modules), dtype=np.float64, count=count)
+        high = np.fromiter(
+            (bounds.get(module, (0.0, 0.0))[1] for module in self.modules), dtype=np.float64, count=count
+        )
+
+        best_cost = self.edge_cost(best, radius)
+        for _ in range(passes):
+            sum_cos = np.bincount(self.sources, weights=np.cos(best)[self.targets], minlength=count)
+            sum_sin = np.bincount(self.sources, weights=np.sin(best)[self.targets], minlength=count)
+            target = np.arctan2(sum_sin, sum_cos) % _TWO_PI
+            moving = bounded & ~((np.abs(sum_cos) < _EPSILON) & (np.abs(sum_sin) < _EPSILON))
+            delta = np.arctan2(np.sin(target - best), np.cos(target - best))
+            candidate = np.where(moving, np.clip(best + pull * delta, low, high), best)
+
+            cost = self.edge_cost(candidate, radius)
+            if cost > best_cost - _EPSILON:
+                break
+
+            best, best_cost = candidate, cost
+
+        return self.to_dict(best, order=node_angle)
+
+    def edge_cost(self, angle: FloatArray, radius: FloatArray) -> float:
+        """The total length of all edges, each counted from both ends."""
+        x = radius * np.cos(angle)
+        y = radius * np.sin(angle)
+        return float(np.hypot(x[self.sources] - x[self.targets], y[self.sources] - y[self.targets]).sum())
+
+    def _outgoing_pairs(
+        self,
+        subtree_modules: Dict[str, List[ModuleNode]],
+        prefix_depths: Dict[str, int],
+    ) -> Tuple[IndexArray, IndexArray]:
+        """
+        For every package, the (package, neighbour) pairs of the edges leaving its
+        subtree. Packages of one depth partition their modules, so a module's package at
+        each depth is one lookup and an edge leaves the subtree when the neighbour's
+        package at that depth differs.
+        """
+        depths = sorted(set(prefix_depths.values()))
+        prefix_ids = {prefix: index for index, prefix in enumerate(self.prefixes)}
+        pairs: List[IndexArray] = []
+        targets: List[IndexArray] = []
+        for depth in depths:
+            ancestor = np.full(len(self.modules), -1, dtype=np.intp)
+            for prefix, members in subtree_modules.items():
+                if prefix_depths.get(prefix) == depth:
+                    ancestor[[self.ids[module] for module in members]] = prefix_ids[prefix]
+
+            source_ancestor = ancestor[self.sources]
+            leaving = (source_ancestor >= 0) & (source_ancestor != ancestor[self.targets])
+            pairs.append(source_ancestor[leaving])
+            targets.append(self.targets[leaving])
+
+        if not pairs:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        return np.concatenate(pairs), np.concatenate(targets)
@@ -1,7 +1,21 @@
-from typing import Any, Dict, Optional, Tuple, override
+from pathlib import Path
+from typing import Any, Dict, Final, Mapping, Optional, Self, Tuple, Union, override
 
-from pda.specification import CategorizedModule
+from pda.specification import (
+    CategorizedModule,
+    Module,
+    ModuleCategory,
+    ModuleKind,
+    OriginType,
+    ResolutionDiagnostic,
+    ResolutionDiagnosticCode,
+    UnavailableModule,
+)
 from pda.structures.node.base import Node
+from pda.tools.sources import PYTHON_SUFFIX
+
+_ORDINAL_SEPARATOR: Final[str] = "#"
+_INIT: Final[str] = "__init__"
 
 
 class ModuleNode(Node[CategorizedModule]):
@@ -13,14 +27,17 @@ class ModuleNode(Node[CategorizedModule]):
         level: int = 0,
         qualified_name: bool = False,
         label: Optional[str] = None,
+        available: Optional[bool] = None,
     ) -> None:
         if label is None:
             label = module.qualified_name if qualified_name else module.module_name
 
-        available = module.available
+        if available is None:
+            available = module.available
+
         details = module.name
-        if not available and module.availability_reason:
-            details = f"{module.name} — {module.availability_reason}"
+        if not available:
+            details = f"{module.name} — {module.unavailability_reason}"
 
         group = module.category.value
         order = module.category.order
@@ -34,6 +51,8 @@ class ModuleNode(Node[CategorizedModule]):
             group=group,
             available=available,
         )
+        self._identity = (module.qualified_name, ordinal)
+        self._hash = hash(self._identity)
 
     @property
     def module(self) -> CategorizedModule:
@@ -44,11 +63,11 @@ class ModuleNode(Node[CategorizedModule]):
         if not isinstance(other, ModuleNode):
             return NotImplemented
 
-        return self.module.qualified_name == other.module.qualified_name and self.ordinal == other.ordinal
+        return self._identity == other._identity
 
     @override
     def __hash__(self) -> int:
-        return hash((self.module.qualified_name, self.ordinal))
+        return self._hash
 
     @property
     @override
@@ -59,7 +78,7 @@ class ModuleNode(Node[CategorizedModule]):
     @override
     def identifier(self) -> str:
         name = self.module.qualified_name
-        return f"{name}#{self.ordinal}" if self.ordinal else name
+        return f"{name}{_ORDINAL_SEPARATOR}{self.ordinal}" if self.ordinal else name
 
     @override
     def serialize(self) -> Dict[str, Any]:
@@ -75,10 +94,64 @@ class ModuleNode(Node[CategorizedModule]):
             diagnostic = self.module.diagnostic
             if diagnostic is not None:
                 data["diagnostic"] = diagnostic.code.value
+                data["reason"] = diagnostic.message
 
         origin = self.module.origin
         if origin is not None:
             data["origin"] = str(origin)
 
+        distribution = self.module.distribution
+        if distribution is not None:
+            data["distribution"] = distribution
+
         data.update(self.cycle_data())
         return data
+
+    @classmethod
+    def deserialize(cls, data: Mapping[str, Any]) -> Self:
+        """
+        Rebuild a node from the output of ``serialize`` without touching the filesystem:
+        the recorded availability is trusted, and the module kind is inferred from the
+        origin file name.
+        """
+        name, _, ordinal = data["id"].partition(_ORDINAL_SEPARATOR)
+        origin = data.get("origin")
+        available = data.get("available", True)
+        category = ModuleCategory(data.get("category", ModuleCategory.UNKNOWN.value))
+        module: Union[Module, UnavailableModule]
+        if origin is None and not available:
+            code = data.get("diagnostic")
+            diagnostic = None
+            if code is not None:
+                diagnostic = ResolutionDiagnostic(code=ResolutionDiagnosticCode(code), message=data.get("reason", code))
+
+            module = UnavailableModule.model_construct(name=name, diagnostic=diagnostic)
+        else:
+            module = Module.model_construct(
+                name=name,
+                distribution=data.get("distribution"),
+                **cls._origin_fields(origin),
+            )
+
+        node = cls(
+            CategorizedModule(module=module, category=category),
+            ordinal=int(ordinal or 0),
+            level=data.get("level", 0),
+            label=data.get("label"),
+            available=available,
+        )
+        node.in_cycle = data.get("in_cycle", False)
+        node.component = data.get("component")
+        return node
+
+    @staticmethod
+    def _origin_fields(origin: Optional[str]) -> Dict[str, Any]:
+        if origin is None:
+            return {"origin": None, "origin_type": OriginType.NONE, "kind": ModuleKind.UNKNOWN}
+
+        path = Path(origin)
+        if path.suffix.lower() != PYTHON_SUFFIX:
+            return {"origin": path, "origin_type": OriginType.NO_PYTHON, "kind": ModuleKind.EXTENSION}
+
+        kind = ModuleKind.REGULAR_PACKAGE if path.stem == _INIT else ModuleKind.SOURCE_MODULE
+        return {"origin": path, "origin_type": OriginType.PYTHON, "kind": kind}
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, NamedTuple
+
+from pda.tools.serialization import load_json, save_json
+from pda.types import Pathlike
+
+
+class RingPlacement(NamedTuple):
+    x: float
+    y: float
+    angle: float
+    ring: int
+
+
+@dataclass(frozen=True)
+class RingLayoutSnapshot:
+    """
+    The positions of a previous package-ring layout, keyed by module identifier, with the
+    ring settings they were computed with.
+
+    A ``PackageRingLayout`` given a snapshot keeps every module whose ring, package wedge
+    and radial band still hold its previous place, and lays out only the others. A
+    snapshot taken with different ring settings is not reused.
+    """
+
+    settings: Dict[str, Any] = field(default_factory=dict)
+    placements: Dict[str, RingPlacement] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, filepath: Pathlike) -> RingLayoutSnapshot:
+        return cls.from_dict(load_json(filepath))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> RingLayoutSnapshot:
+        return cls(
+            settings=dict(data.get("settings", {})),
+            placements={
+                identifier: RingPlacement(float(x), float(y), float(angle), int(ring))
+                for identifier, (x, y, angle, ring) in data.get("placements", {}).items()
+            },
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "settings": self.settings,
+            "placements": {identifier: list(placement) for identifier, placement in self.placements.items()},
+        }
+
+    def save(self, filepath: Pathlike) -> None:
+        save_json(self.to_dict(), filepath, indent=None)
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import networkx as nx
+
+from pda.config import GraphSortMethod
+from pda.constants import DELIMITER
+from pda.models.module.graph import ModuleGraph
+from pda.models.module.node import ModuleNode
+
+
+@dataclass(frozen=True)
+class _PyramidLevel:
+    keys: Tuple[str, ...]
+    representatives: Tuple[ModuleNode, ...]
+    edges: Tuple[Tuple[int, int], ...]
+
+
+class CollapsePyramid:
+    """
+    The collapsed graphs of a ``ModuleGraph`` for every level from ``0`` up to its deepest
+    dotted name.
+
+    The finest level buckets the graph's nodes by qualified name; every coarser level is
+    derived from the one below it by trimming the last name component of each bucket, so
+    its edges come from the (already condensed) edges of the finer level rather than from
+    the original graph. Up front, a level is only its bucket keys, a representative node of
+    the original graph per bucket and its edges as pairs of bucket indices. The graph of a
+    level, with its own nodes, is built and sorted the first time it is asked for and kept
+    from then on, so only the levels in use cost a full graph.
+
+    ``pyramid[level]`` returns the same graph as ``graph.simplify(level)``, with levels
+    beyond the deepest name clamped to it.
+    """
+
+    def __init__(
+        self,
+        graph: ModuleGraph,
+        *,
+        qualified_name: bool = True,
+        sort_method: GraphSortMethod = "topological",
+    ) -> None:
+        self._qualified_name = qualified_name
+        self._sort_method: GraphSortMethod = sort_method
+        self._graph_class = graph.__class__
+        self._backend = graph.derived_backend
+        self._levels: Tuple[_PyramidLevel, ...] = tuple(self._build_levels(graph))
+        self._graphs: List[Optional[ModuleGraph]] = [None] * len(self._levels)
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def __getitem__(self, level: int) -> ModuleGraph:
+        if level < 0:
+            raise ValueError("Collapse level must be >= 0")
+
+        level = min(level, self.max_level)
+        graph = self._graphs[level]
+        if graph is None:
+            graph = self._graphs[level] = self._materialize(self._levels[level])
+
+        return graph
+
+    @property
+    def max_level(self) -> int:
+        return len(self._levels) - 1
+
+    @staticmethod
+    def _build_levels(graph: ModuleGraph) -> List[_PyramidLevel]:
+        nodes = list(graph)
+        max_level = max((node.module.qualified_name.count(DELIMITER) for node in nodes), default=0)
+
+        buckets: Dict[ModuleNode, int] = {}
+        indices: Dict[str, int] = {}
+        representatives: List[ModuleNode] = []
+        for node in nodes:
+            key = node.module.prefix(max_level)
+            index = indices.setdefault(key, len(indices))
+            buckets[node] = index
+            if index == len(representatives):
+                representatives.append(node)
+            elif node.module.qualified_name < representatives[index].module.qualified_name:
+                representatives[index] = node
+
+        edges = dict.fromkeys(
+            (buckets[source], buckets[target]) for source, target in graph.edges if buckets[source] != buckets[target]
+        )
+        levels = [_PyramidLevel(tuple(indices), tuple(representatives), tuple(edges))]
+        for level in range(max_level - 1, -1, -1):
+            levels.append(CollapsePyramid._coarsen(levels[-1], level))
+
+        levels.reverse()
+        return levels
+
+    @staticmethod
+    def _coarsen(finer: _PyramidLevel, level: int) -> _PyramidLevel:
+        parents: List[int] = []
+        indices: Dict[str, int] = {}
+        representatives: List[ModuleNode] = []
+        for key, node in zip(finer.keys, finer.representatives):
+            parent_key = DELIMITER.join(key.split(DELIMITER)[: level + 1])
+            index = indices.setdefault(parent_key, len(indices))
+            parents.append(index)
+            if index == len(representatives):
+                representatives.append(node)
+            elif node.module.qualified_name < representatives[index].module.qualified_name:
+                representatives[index] = node
+
+        edges = dict.fromkeys(
+            (parents[source], parents[target]) for source, target in finer.edges if parents[source] != parents[target]
+        )
+        return _PyramidLevel(tuple(indices), tuple(representatives), tuple(edges))
+
+    def _materialize(self, level: _PyramidLevel) -> ModuleGraph:
+        nodes = [
+            ModuleNode(node.module, label=self._label(key)) for key, node in zip(level.keys, level.representatives)
+        ]
+        collapsed = nx.DiGraph()
+        collapsed.add_nodes_from(nodes)
+        collapsed.add_edges_from((nodes[source], nodes[target]) for source, target in level.edges)
+        collapsed_graph = self._graph_class(graph=collapsed, backend=self._backend)
+        collapsed_graph.sort(method=self._sort_method)
+        return collapsed_graph
+
+    def _label(self, prefix: str) -> str:
+        return prefix if self._qualified_name else prefix.split(DELIMITER)[-1]
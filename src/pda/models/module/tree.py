@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional, Tuple
+
+from pda.config import GraphBackendType
+from pda.models.module.graph import ModuleGraph
+from pda.models.module.node import ModuleNode
+from pda.tools import logger
+
+
+class ModuleTree:
+    """
+    The tree-like view of an import traversal (``unify_nodes=False``), held as an unfolding
+    of the unified graph rather than as one node object per import path.
+
+    The traversal records, for every module it expands, the import through which it got
+    there and the modules it imports in turn. Every import is a tree node, identified by
+    its path from a root and numbered in the order the traversal created it; only the
+    first occurrence of a module reached by the traversal has children. ``materialize``
+    builds these nodes on demand, optionally down to a depth or within a node budget.
+    """
+
+    def __init__(self, *, qualified_name: bool = False) -> None:
+        self._qualified_name = qualified_name
+        self._roots: List[ModuleNode] = []
+        self._expanded: List[ModuleNode] = []
+        self._parents: Dict[ModuleNode, Optional[ModuleNode]] = {}
+        self._children: Dict[ModuleNode, List[Tuple[ModuleNode, int]]] = {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._roots) + self._counter
+
+    def add_root(self, node: ModuleNode) -> None:
+        self._roots.append(node)
+
+    def expand(self, node: ModuleNode, parent: Optional[ModuleNode]) -> None:
+        """Record that ``node`` is expanded through its import from ``parent``."""
+        self._expanded.append(node)
+        self._parents[node] = parent
+        self._children[node] = []
+
+    def add_child(self, parent: ModuleNode, child: ModuleNode) -> None:
+        self._counter += 1
+        self._children[parent].append((child, self._counter))
+
+    def materialize(
+        self,
+        *,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        backend: GraphBackendType = "networkx",
+    ) -> ModuleGraph:
+        """
+        The tree as a ``ModuleGraph``. It is cut at ``max_depth`` and at the deepest level
+        whose nodes, together with all shallower ones, fit within ``max_nodes``.
+        """
+        depths = self._depths()
+        limit = self._depth_limit(depths, max_nodes)
+        if max_depth is not None:
+            limit = min(limit, max_depth)
+
+        graph = ModuleGraph(backend=backend)
+        occurrences: Dict[ModuleNode, ModuleNode] = {}
+        for root in self._roots:
+            graph.add_node(root)
+            if root in self._parents and self._parents[root] is None:
+                occurrences[root] = root
+
+        for node in self._expanded:
+            occurrence = occurrences.get(node)
+            depth = depths[node]
+            if occurrence is None or depth >= limit:
+                continue
+
+            for child, ordinal in self._children[node]:
+                child_occurrence = ModuleNode(
+                    child.module,
+                    level=depth + 1,
+                    ordinal=ordinal,
+                    qualified_name=self._qualified_name,
+                )
+                graph.add_edge(occurrence, child_occurrence)
+                if self._parents.get(child) is node:
+                    occurrences[child] = child_occurrence
+
+        if len(graph) < len(self):
+            logger.warning("Tree view truncated to depth %d: %d of %d nodes", limit, len(graph), len(self))
+
+        return graph
+
+    def _depths(self) -> Dict[ModuleNode, int]:
+        depths: Dict[ModuleNode, int] = {}
+        for node in self._expanded:
+            parent = self._parents[node]
+            depths[node] = 0 if parent is None else depths[parent] + 1
+
+        return depths
+
+    def _depth_limit(self, depths: Dict[ModuleNode, int], max_nodes: Optional[int]) -> int:
+        deepest = max(depths.values(), default=0) + 1
+        if max_nodes is None:
+            return deepest
+
+        counts = [0] * (deepest + 1)
+        counts[0] = len(self._roots)
+        for node in self._expanded:
+            counts[depths[node] + 1] += len(self._children[node])
+
+        total = 0
+        for depth, count in enumerate(counts):
+            total += count
+            if total > max_nodes:
+                return max(depth - 1, 0)
+
+        return deepest
@@ -25,4 +25,4 @@ class PathGraph(Graph[PathNode]):
         """
         simplified_graph = self._remove_files_from_graph(self._graph)
         sorted_graph = self._sort(simplified_graph)
-        return self.__class__(graph=sorted_graph)
+        return self._derive(sorted_graph)
@@ -1,6 +1,7 @@
-from .parser import parse_python_file, validate_python_file
+from .parser import parse_python_file, validate_module_file, validate_python_file
 
 __all__ = [
+    "validate_module_file",
     "validate_python_file",
     "parse_python_file",
 ]
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import ast
+from importlib.machinery import BYTECODE_SUFFIXES
 from pathlib import Path
 from typing import Union
 
-from pda.tools.paths import exists, is_file
+from pda.tools.sources import SourceProvider
 
 
 def validate_python_file(filepath: Union[str, Path]) -> Path:
     filepath = Path(filepath)
 
-    if not exists(filepath) or not is_file(filepath):
+    if not SourceProvider().is_file(filepath):
         raise FileNotFoundError(f"The file {filepath} does not exist or is not a file")
 
     if filepath.suffix != ".py":
@@ -19,10 +20,19 @@ def validate_python_file(filepath: Union[str, Path]) -> Path:
     return filepath
 
 
+def validate_module_file(filepath: Union[str, Path]) -> Path:
+    filepath = Path(filepath)
+    if filepath.suffix not in BYTECODE_SUFFIXES:
+        return validate_python_file(filepath)
+
+    if not SourceProvider().is_file(filepath):
+        raise FileNotFoundError(f"The file {filepath} does not exist or is not a file")
+
+    return filepath
+
+
 def parse_python_file(filepath: Union[str, Path]) -> ast.Module:
     validate_python_file(filepath)
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read(), filename=str(filepath))
-
-    return tree
+    source = SourceProvider().read_text(filepath)
+    return ast.parse(source, filename=str(filepath))
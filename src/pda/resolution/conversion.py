@@ -1,3 +1,7 @@
+from typing import Optional
+
+from pda.resolution.distributions import DistributionIndex
+from pda.resolution.models.environment import TargetEnvironment
 from pda.resolution.models.resolution import ModuleResolution
 from pda.specification import ModuleCategory
 from pda.specification.modules.module.categorized import CategorizedModule
@@ -6,6 +10,17 @@ from pda.specification.modules.module.unavailable import UnavailableModule
 
 
 class CategorizedModuleBuilder:
+    def __init__(self, environment: TargetEnvironment) -> None:
+        self._environment = environment
+        self._distributions: Optional[DistributionIndex] = None
+
+    @property
+    def distributions(self) -> DistributionIndex:
+        if self._distributions is None:
+            self._distributions = DistributionIndex.for_environment(self._environment)
+
+        return self._distributions
+
     def from_resolution(
         self,
         resolution: ModuleResolution,
@@ -26,8 +41,15 @@ class CategorizedModuleBuilder:
             origin_type=resolution.location.origin_type,
             submodule_search_locations=resolution.location.submodule_search_locations,
             namespace_portions=resolution.location.namespace_portions,
+            distribution=self._distribution(resolution.identity.name, resolution.category),
         )
         return CategorizedModule.from_module(
             module,
             category=resolution.category,
         )
+
+    def _distribution(self, name: str, category: ModuleCategory) -> Optional[str]:
+        if category != ModuleCategory.EXTERNAL:
+            return None
+
+        return self.distributions.distribution(name)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from importlib.machinery import all_suffixes
+from importlib.metadata import Distribution, PackagePath, distributions
+from pathlib import Path
+from typing import ClassVar, Dict, Final, Iterable, Iterator, Mapping, Optional, Tuple
+
+from pda.constants import DELIMITER
+from pda.resolution.models.environment import TargetEnvironment
+from pda.resolution.paths import unique_path_entries
+
+_INIT: Final[str] = "__init__"
+_METADATA_SUFFIXES: Final[Tuple[str, ...]] = (".dist-info", ".egg-info")
+_MODULE_SUFFIXES: Final[Tuple[str, ...]] = tuple(sorted(all_suffixes(), key=len, reverse=True))
+
+Snapshot = Tuple[Tuple[str, int], ...]
+
+
+class DistributionIndex:
+    """
+    Maps module names to the installed distributions that provide them.
+
+    The index is built once from ``importlib.metadata``: every module file listed in a
+    distribution's ``RECORD`` is registered under its dotted name, and ``top_level.txt``
+    covers distributions installed without a file list. Lookups take the longest
+    registered prefix, so portions of a shared namespace such as ``google.*`` are
+    attributed to the distribution that actually ships them.
+    """
+
+    _snapshots: ClassVar[Dict[Snapshot, DistributionIndex]] = {}
+
+    def __init__(self, providers: Mapping[str, str]) -> None:
+        self._providers: Dict[str, str] = dict(providers)
+
+    def __len__(self) -> int:
+        return len(self._providers)
+
+    @classmethod
+    def for_environment(cls, environment: TargetEnvironment) -> DistributionIndex:
+        """
+        Index of the distributions installed in the external roots of an environment,
+        shared between all lookups as long as none of the roots was modified.
+        """
+        entries = unique_path_entries((*environment.external_roots, *environment.sys_path_roots))
+        snapshot = cls._snapshot(entries)
+        index = cls._snapshots.get(snapshot)
+        if index is None:
+            index = cls.build(entries)
+            cls._snapshots[snapshot] = index
+
+        return index
+
+    @classmethod
+    def build(cls, entries: Iterable[str]) -> DistributionIndex:
+        providers: Dict[str, str] = {}
+        for distribution in distributions(path=list(entries)):
+            name = distribution.name
+            if not name:
+                continue
+
+            for module_name in cls._provided_modules(distribution):
+                providers.setdefault(module_name, name)
+
+        return cls(providers)
+
+    def distribution(self, name: str) -> Optional[str]:
+        """Name of the distribution providing the module, or ``None`` if none does."""
+        parts = name.split(DELIMITER)
+        for length in range(len(parts), 0, -1):
+            provider = self._providers.get(DELIMITER.join(parts[:length]))
+            if provider is not None:
+                return provider
+
+        return None
+
+    @staticmethod
+    def _snapshot(entries: Iterable[str]) -> Snapshot:
+        snapshot = []
+        for entry in entries:
+            try:
+                snapshot.append((entry, Path(entry).stat().st_mtime_ns))
+            except OSError:
+                continue
+
+        return tuple(snapshot)
+
+    @classmethod
+    def _provided_modules(cls, distribution: Distribution) -> Iterator[str]:
+        files = distribution.files
+        if files:
+            for file in files:
+                module_name = cls._module_name(file)
+                if module_name is not None:
+                    yield module_name
+
+            return
+
+        top_level = distribution.read_text("top_level.txt") or ""
+        for line in top_level.splitlines():
+            module_name = line.strip().replace("/", DELIMITER)
+            if module_name:
+                yield module_name
+
+    @staticmethod
+    def _module_name(file: PackagePath) -> Optional[str]:
+        parts = file.parts
+        if not parts or parts[0].endswith(_METADATA_SUFFIXES):
+            return None
+
+        filename = parts[-1]
+        suffix = next((suffix for suffix in _MODULE_SUFFIXES if filename.endswith(suffix)), None)
+        if suffix is None:
+            return None
+
+        names = [*parts[:-1], filename.removesuffix(suffix)]
+        if names[-1] == _INIT:
+            names.pop()
+
+        if not names or not all(name.isidentifier() for name in names):
+            return None
+
+        return DELIMITER.join(names)
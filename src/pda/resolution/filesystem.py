@@ -10,7 +10,7 @@ from pda.resolution.models.location import ModuleCoordinates, ModuleLocation
 from pda.resolution.paths import has_python_file_in_tree, longest_containing_root
 from pda.specification import ResolutionDiagnostic, ResolutionDiagnosticCode
 from pda.specification.imports.origin import OriginType
-from pda.tools.paths import is_dir, is_file, is_python_file
+from pda.tools.sources import SourceProvider
 from pda.types import Pathlike
 
 
@@ -29,6 +29,7 @@ class FilesystemModuleLocator:
     def __init__(self, environment: TargetEnvironment) -> None:
         self._environment = environment
         self._classifier = ModuleClassifier(environment)
+        self._sources = SourceProvider()
 
     def locate(
         self,
@@ -72,12 +73,12 @@ class FilesystemModuleLocator:
         except ValueError:
             return None
 
-        if is_dir(path):
+        if self._sources.is_dir(path):
             if not self._is_package_like_directory(path):
                 return None
 
             parts = relative.parts
-        elif is_python_file(path):
+        elif self._sources.is_python_file(path):
             stem = relative.with_suffix("")
             parts = stem.parts
             if parts[-1] == "__init__":
@@ -92,14 +93,14 @@ class FilesystemModuleLocator:
 
     def _location_from_path(self, path: Path, root: Path) -> ModuleLocation:
         locations: tuple[Path, ...]
-        if is_dir(path):
+        if self._sources.is_dir(path):
             init_file = path / "__init__.py"
-            origin = init_file if is_file(init_file) else None
+            origin = init_file if self._sources.is_file(init_file) else None
             origin_type = OriginType.PYTHON if origin is not None else OriginType.NONE
             locations = (path,)
         else:
             origin = path
-            origin_type = OriginType.PYTHON if is_python_file(path) else OriginType.NO_PYTHON
+            origin_type = OriginType.PYTHON if self._sources.is_python_file(path) else OriginType.NO_PYTHON
             locations = ()
 
         return ModuleLocation(
@@ -111,13 +112,20 @@ class FilesystemModuleLocator:
         )
 
     def _is_package_like_directory(self, path: Path) -> bool:
-        if is_file(path / "__init__.py"):
+        if self._sources.is_file(path / "__init__.py"):
             return True
 
-        return has_python_file_in_tree(path)
+        return self._has_python_file_in_tree(path)
+
+    def _has_python_file_in_tree(self, path: Path) -> bool:
+        return has_python_file_in_tree(path) or self._sources.has_archived_python_file(path)
 
     def _unresolved_path_diagnostic(self, path: Path) -> ResolutionDiagnostic:
-        if is_dir(path) and not is_file(path / "__init__.py") and not has_python_file_in_tree(path):
+        if (
+            self._sources.is_dir(path)
+            and not self._sources.is_file(path / "__init__.py")
+            and not self._has_python_file_in_tree(path)
+        ):
             return ResolutionDiagnostic.create(
                 ResolutionDiagnosticCode.NAMESPACE_WITHOUT_PYTHON_CHILD,
                 f"Directory '{path}' is not a namespace package portion because it contains no Python files",
@@ -40,7 +40,7 @@ class ModuleResolutionService:
         self._import_candidates = ImportPathCandidateBuilder()
         self._locations = ModuleLocationFactory(self._classifier)
         self._specs = ModuleSpecResolver(TargetSearchPath(environment))
-        self._modules = CategorizedModuleBuilder()
+        self._modules = CategorizedModuleBuilder(environment)
 
     @property
     def environment(self) -> TargetEnvironment:
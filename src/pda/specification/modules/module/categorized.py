@@ -11,6 +11,7 @@ from pda.specification.modules.module.module import Module
 from pda.specification.modules.module.namespace import NamespacePortion
 from pda.specification.modules.module.unavailable import UnavailableModule
 from pda.tools.paths import is_file
+from pda.tools.sources import SourceProvider
 
 
 class CategorizedModule(NamedTuple):
@@ -45,6 +46,10 @@ class CategorizedModule(NamedTuple):
     def namespace_portions(self) -> Tuple[NamespacePortion, ...]:
         return self.module.namespace_portions if isinstance(self.module, Module) else ()
 
+    @property
+    def distribution(self) -> Optional[str]:
+        return self.module.distribution if isinstance(self.module, Module) else None
+
     @property
     def base_path(self) -> Optional[Path]:
         return self.module.base_path if isinstance(self.module, Module) else None
@@ -86,7 +91,7 @@ class CategorizedModule(NamedTuple):
             return False
 
         if self.origin_type == OriginType.PYTHON:
-            return self.origin is not None and is_file(self.origin)
+            return self.origin is not None and (is_file(self.origin) or SourceProvider().is_archived_file(self.origin))
 
         return True
 
@@ -96,13 +101,18 @@ class CategorizedModule(NamedTuple):
 
     @property
     def availability_reason(self) -> Optional[str]:
+        if isinstance(self.module, UnavailableModule) or not self.available:
+            return self.unavailability_reason
+
+        return None
+
+    @property
+    def unavailability_reason(self) -> str:
+        """Why the module cannot be analysed, on the assumption that it cannot."""
         if isinstance(self.module, UnavailableModule):
             return self.module.diagnostic.message if self.module.diagnostic is not None else "module not found"
 
-        if not self.available:
-            return "source not available for analysis"
-
-        return None
+        return "source not available for analysis"
 
     @staticmethod
     def from_module(
@@ -10,7 +10,7 @@ from pda.specification.imports.origin import OriginType
 from pda.specification.modules.module.base import BaseModule
 from pda.specification.modules.module.kind import ModuleKind
 from pda.specification.modules.module.namespace import NamespacePortion
-from pda.tools.paths import is_python_file
+from pda.tools.sources import SourceProvider
 
 
 class Module(BaseModule):
@@ -37,6 +37,10 @@ class Module(BaseModule):
         default=(),
         description="Namespace package portions with their root and category facts.",
     )
+    distribution: Optional[str] = Field(
+        default=None,
+        description="Name of the installed distribution providing the module, if known.",
+    )
 
     @model_validator(mode="after")
     def validate_module(self) -> Self:
@@ -47,7 +51,7 @@ class Module(BaseModule):
             if self.origin is None:
                 raise PDAInvalidModuleOriginError(f"Module '{self.name}' has file origin type but no origin path")
 
-            if not is_python_file(self.origin):
+            if not SourceProvider().is_python_file(self.origin):
                 raise PDAInvalidModuleOriginError(f"Module '{self.name}' has non-Python origin file: '{self.origin}'")
 
         return self
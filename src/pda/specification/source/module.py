@@ -9,10 +9,10 @@ from pda.exceptions import (
     PDAMissingTopLevelModuleError,
     PDASourceFileOutsideProjectError,
 )
-from pda.parser import validate_python_file
+from pda.parser import validate_module_file
 from pda.specification.base import Specification
 from pda.specification.imports.path import ImportPath
-from pda.tools.paths import is_dir
+from pda.tools.sources import SourceProvider
 
 
 class ModuleSource(Specification):
@@ -32,9 +32,9 @@ class ModuleSource(Specification):
 
     @model_validator(mode="after")
     def validate_paths(self) -> Self:
-        validate_python_file(self.origin)
+        validate_module_file(self.origin)
 
-        if not is_dir(self.base_path):
+        if not SourceProvider().is_dir(self.base_path):
             raise NotADirectoryError(f"Base path '{self.base_path}' is not a valid directory")
 
         if DELIMITER in self.top_level:
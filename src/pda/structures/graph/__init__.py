@@ -1,11 +1,17 @@
 from pda.structures.graph.base import Graph
 from pda.structures.graph.converter import PyVisConverter
+from pda.structures.graph.layered import LayeredLayout
 from pda.structures.graph.layout import GraphLayout, LayoutResult, Position
+from pda.structures.graph.node_link import NodeLinkWriter
+from pda.structures.graph.reachability import ReachabilityIndex
 
 __all__ = [
     "Graph",
     "PyVisConverter",
     "GraphLayout",
+    "LayeredLayout",
     "LayoutResult",
+    "NodeLinkWriter",
     "Position",
+    "ReachabilityIndex",
 ]
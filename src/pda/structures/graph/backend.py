@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import (
+    Any,
+    ClassVar,
+    Collection,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Self,
+    Tuple,
+)
+
+import networkx as nx
+
+from pda.config import GraphBackendKind, GraphBackendType
+from pda.structures.graph.leveling import graph_levels
+from pda.structures.node.types import Edge, NodeT
+
+
+class GraphBackend(ABC, Generic[NodeT]):
+    """
+    Storage of the nodes, edges and attributes of a ``Graph``.
+
+    The acyclicity check, strongly connected components, condensation and longest path
+    levels that sorting relies on are methods of the backend, so that a backend can run
+    them on its own storage. The defaults operate on the NetworkX graph returned by
+    ``networkx``, which the remaining graph algorithms use as well.
+    """
+
+    kind: ClassVar[GraphBackendKind]
+    derived: ClassVar[GraphBackendType]
+
+    @classmethod
+    @abstractmethod
+    def from_networkx(cls, graph: Optional[nx.DiGraph] = None) -> Self: ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[NodeT]: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def attributes(self) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def has_node(self, node: NodeT) -> bool: ...
+
+    @abstractmethod
+    def has_edge(self, source: NodeT, target: NodeT) -> bool: ...
+
+    @abstractmethod
+    def add_node(self, node: NodeT) -> None: ...
+
+    @abstractmethod
+    def add_edge(self, source: NodeT, target: NodeT) -> None: ...
+
+    @abstractmethod
+    def update_node(self, node: NodeT, **attributes: Any) -> None: ...
+
+    @abstractmethod
+    def node_attributes(self, node: NodeT) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def edges(self) -> Iterator[Tuple[NodeT, NodeT]]: ...
+
+    @abstractmethod
+    def number_of_edges(self) -> int: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def copy(self) -> Self: ...
+
+    @abstractmethod
+    def networkx(self) -> nx.DiGraph: ...
+
+    def reordered(self, nodes: Iterable[NodeT]) -> Self:
+        """A backend of the same kind holding the same graph, with its nodes in the order of ``nodes``."""
+        backend = self.from_networkx()
+        backend.attributes.update(self.attributes)
+        for node in nodes:
+            backend.add_node(node)
+            attributes = self.node_attributes(node)
+            if attributes:
+                backend.update_node(node, **attributes)
+
+        for source, target in self.edges():
+            backend.add_edge(source, target)
+
+        return backend
+
+    def is_acyclic(self) -> bool:
+        return bool(nx.is_directed_acyclic_graph(self.networkx()))
+
+    def strongly_connected_components(self) -> Tuple[FrozenSet[NodeT], ...]:
+        return tuple(frozenset(component) for component in nx.strongly_connected_components(self.networkx()))
+
+    def condensation(self, components: Iterable[Collection[NodeT]]) -> nx.DiGraph:
+        """
+        The graph of ``components``, one node per component numbered in the order given,
+        built the way ``networkx.condensation`` builds it.
+        """
+        condensed = nx.DiGraph()
+        mapping: Dict[NodeT, int] = {}
+        for index, component in enumerate(components):
+            condensed.add_node(index, members=set(component))
+            mapping.update(dict.fromkeys(component, index))
+
+        condensed.add_edges_from(
+            (mapping[source], mapping[target]) for source, target in self.edges() if mapping[source] != mapping[target]
+        )
+        condensed.graph["mapping"] = mapping
+        return condensed
+
+    def levels(self) -> Dict[NodeT, int]:
+        """The longest path reaching each node of an acyclic graph."""
+        return graph_levels(self.networkx())
+
+
+class NodesView(Collection[NodeT]):
+    """
+    The nodes of a graph backend, in storage order, with their attributes by subscript.
+
+    Attributes are handed out read-only: the storage may be shared between graphs, and
+    only ``Graph.update_node`` copies it before a change.
+    """
+
+    def __init__(self, backend: GraphBackend[NodeT]) -> None:
+        self._backend = backend
+
+    def __iter__(self) -> Iterator[NodeT]:
+        return iter(self._backend)
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    def __contains__(self, node: object) -> bool:
+        return self._backend.has_node(node)  # type: ignore[arg-type]
+
+    def __getitem__(self, node: NodeT) -> Mapping[str, Any]:
+        return MappingProxyType(self._backend.node_attributes(node))
+
+
+class EdgesView(Collection[Edge[NodeT]]):
+    """The edges of a graph backend, grouped by source in node order."""
+
+    def __init__(self, backend: GraphBackend[NodeT]) -> None:
+        self._backend = backend
+
+    def __iter__(self) -> Iterator[Edge[NodeT]]:
+        return self._backend.edges()
+
+    def __len__(self) -> int:
+        return self._backend.number_of_edges()
+
+    def __contains__(self, edge: object) -> bool:
+        if not isinstance(edge, tuple) or len(edge) != 2:
+            return False
+
+        source, target = edge
+        return self._backend.has_edge(source, target)
+
+
+class NetworkXBackend(GraphBackend[NodeT]):
+    """
+    Stores the graph directly in a ``networkx.DiGraph``.
+    """
+
+    kind = "networkx"
+    derived = "networkx"
+
+    def __init__(self, graph: Optional[nx.DiGraph] = None) -> None:
+        self._graph = graph or nx.DiGraph()
+
+    @classmethod
+    def from_networkx(cls, graph: Optional[nx.DiGraph] = None) -> Self:
+        return cls(graph)
+
+    def __iter__(self) -> Iterator[NodeT]:
+        return iter(self._graph.nodes)
+
+    def __len__(self) -> int:
+        return int(self._graph.number_of_nodes())
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = self._graph.graph
+        return attributes
+
+    def has_node(self, node: NodeT) -> bool:
+        return bool(self._graph.has_node(node))
+
+    def has_edge(self, source: NodeT, target: NodeT) -> bool:
+        return bool(self._graph.has_edge(source, target))
+
+    def add_node(self, node: NodeT) -> None:
+        self._graph.add_node(node)
+
+    def add_edge(self, source: NodeT, target: NodeT) -> None:
+        self._graph.add_edge(source, target)
+
+    def update_node(self, node: NodeT, **attributes: Any) -> None:
+        self._graph.nodes[node].update(attributes)
+
+    def node_attributes(self, node: NodeT) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = self._graph.nodes[node]
+        return attributes
+
+    def edges(self) -> Iterator[Tuple[NodeT, NodeT]]:
+        return iter(self._graph.edges)
+
+    def number_of_edges(self) -> int:
+        return int(self._graph.number_of_edges())
+
+    def clear(self) -> None:
+        self._graph.clear()
+
+    def copy(self) -> Self:
+        return self.__class__(self._graph.copy())
+
+    def networkx(self) -> nx.DiGraph:
+        return self._graph
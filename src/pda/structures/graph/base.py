@@ -1,67 +1,179 @@
+import time
 import warnings
 from collections import defaultdict
-from itertools import islice
-from typing import Any, Dict, Generic, Iterator, List, Optional, Self, get_args
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    TypeVar,
+    get_args,
+)
 
 import networkx as nx
-from networkx.classes.reportviews import NodeView, OutEdgeView
 
-from pda.config import GraphSortMethod
+from pda.config import GraphBackendKind, GraphBackendType, GraphSortMethod
 from pda.exceptions import PDAGraphLayoutWarning
+from pda.structures.graph.backend import EdgesView, GraphBackend, NetworkXBackend, NodesView
+from pda.structures.graph.compact import CompactBackend
+from pda.structures.graph.cycles import feedback_arcs, shortest_cycles
+from pda.structures.graph.leveling import condensation_levels
+from pda.structures.graph.node_link import write_node_link
+from pda.structures.graph.reachability import ReachabilityIndex
 from pda.structures.node.types import Edge, NodeT
 from pda.tools import logger
-from pda.tools.serialization import save_json
+from pda.tools.serialization import open_text
 from pda.types import Pathlike
 
+T = TypeVar("T")
+
+_ORDER_INDEPENDENT: Final[Tuple[str, ...]] = ("acyclic", "components")
+
 
 class Graph(Generic[NodeT]):
     """
     Base graph class for Python Dependency Analyzer.
+
+    Every structural change bumps ``version``. Acyclicity, strongly connected components,
+    the condensation, the topological order and the reachability index are memoized
+    against it, so each of them is computed at most once per version however many
+    callers ask for it.
+
+    ``view`` hands out a graph that shares storage with this one. Whichever of the two is
+    mutated first copies the storage before the change, so neither sees the other's edits.
     """
 
-    def __init__(self, graph: Optional[nx.DiGraph] = None) -> None:
-        self._graph = graph or nx.DiGraph()
+    def __init__(self, graph: Optional[nx.DiGraph] = None, *, backend: GraphBackendType = "networkx") -> None:
+        self._backend: GraphBackend[NodeT] = _create_backend(backend, graph)
+        self._version = 0
+        self._memo: Dict[str, Any] = {}
+        self._memo_version = 0
+        self._shared = False
 
     def __iter__(self) -> Iterator[NodeT]:
-        return iter(self._graph.nodes)
+        return iter(self._backend)
 
     def __len__(self) -> int:
-        return int(self._graph.number_of_nodes())
+        return len(self._backend)
+
+    @property
+    def _graph(self) -> nx.DiGraph:
+        """The graph as a NetworkX graph; backends other than ``networkx`` build it on every access."""
+        return self._backend.networkx()
+
+    @property
+    def backend(self) -> GraphBackendKind:
+        return self._backend.kind
+
+    @property
+    def derived_backend(self) -> GraphBackendType:
+        """The backend of graphs derived from this one; a read-only backend hands over to a writable one."""
+        return self._backend.derived
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change to the nodes or edges of the graph."""
+        return self._version
+
+    def _bump(self) -> None:
+        self._version += 1
+
+    def _memoized(self, key: str, compute: Callable[[], T]) -> T:
+        if self._memo_version != self._version:
+            self._memo.clear()
+            self._memo_version = self._version
+
+        if key not in self._memo:
+            self._memo[key] = compute()
+
+        value: T = self._memo[key]
+        return value
+
+    def _writable(self) -> None:
+        if self._shared:
+            self._backend = self._backend.copy()
+            self._shared = False
 
     def clear(self) -> None:
-        self._graph.clear()
+        self._writable()
+        self._backend.clear()
+        self._bump()
 
     def copy(self) -> Self:
+        return self._over(self._backend.copy())
+
+    def view(self) -> Self:
+        """A copy-on-write snapshot of the graph; storage is only copied once either side changes."""
+        self._shared = True
+        memo = dict(self._memo) if self._memo_version == self._version else None
+        return self._over(self._backend, shared=True, memo=memo)
+
+    @classmethod
+    def _over(
+        cls,
+        backend: GraphBackend[NodeT],
+        *,
+        shared: bool = False,
+        memo: Optional[Dict[str, Any]] = None,
+    ) -> Self:
+        """A graph of this class holding ``backend``, optionally with analyses already memoized for it."""
+        graph = cls()
+        graph._backend = backend
+        graph._shared = shared
+        if memo is not None:
+            graph._memo = memo
+
+        return graph
+
+    def _derive(self, graph: Optional[nx.DiGraph]) -> Self:
+        """A graph of the same class holding ``graph``, on the backend given by ``derived_backend``."""
         cls = self.__class__
-        return cls(graph=self._graph.copy())
+        return cls(graph=graph, backend=self.derived_backend)
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Graph-level attributes, exported under the node-link ``graph`` key."""
+        self._writable()
+        return self._backend.attributes
 
     @property
-    def nodes(self) -> NodeView[NodeT]:
-        return self._graph.nodes
+    def nodes(self) -> NodesView[NodeT]:
+        """A read-only view of the nodes; node attributes are changed with ``update_node``."""
+        return NodesView(self._backend)
 
     @property
-    def edges(self) -> OutEdgeView[NodeT]:
-        return self._graph.edges
+    def edges(self) -> EdgesView[NodeT]:
+        return EdgesView(self._backend)
 
     def has_node(self, module: NodeT) -> bool:
-        return bool(self._graph.has_node(module))
+        return self._backend.has_node(module)
 
     def has_edge(self, from_module: NodeT, to_module: NodeT) -> bool:
-        return bool(self._graph.has_edge(from_module, to_module))
+        return self._backend.has_edge(from_module, to_module)
 
     def add_node(self, module: NodeT) -> None:
         if not self.has_node(module):
-            self._graph.add_node(module)
+            self._writable()
+            self._backend.add_node(module)
+            self._bump()
 
     def add_edge(self, from_module: NodeT, to_module: NodeT) -> None:
         if from_module != to_module and not self.has_edge(from_module, to_module):
-            self.add_node(from_module)
-            self.add_node(to_module)
-            self._graph.add_edge(from_module, to_module)
+            self._writable()
+            self._backend.add_edge(from_module, to_module)
+            self._bump()
 
     def update_node(self, module: NodeT, **attributes: Any) -> None:
         if self.has_node(module):
-            self._graph.nodes[module].update(attributes)
+            self._writable()
+            self._backend.update_node(module, **attributes)
 
     def edge_label(self, from_node: NodeT, to_node: NodeT) -> str:
         from_label = from_node.label
@@ -73,31 +185,75 @@ class Graph(Generic[NodeT]):
         Serialize the graph into the node-link format consumed by NetworkX,
         Cytoscape.js, D3 and similar frameworks.
         """
-        nodes = sorted(self._graph.nodes)
-        return {
-            "directed": True,
-            "nodes": [node.serialize() for node in nodes],
-            "links": [
-                {
-                    "source": source.identifier,
-                    "target": target.identifier,
-                }
-                for source, target in self._graph.edges
-            ],
-        }
+        nodes = sorted(self._backend)
+        data: Dict[str, Any] = {"directed": True}
+        attributes = self._backend.attributes
+        if attributes:
+            data["graph"] = dict(attributes)
+
+        data["nodes"] = [node.serialize() for node in nodes]
+        data["links"] = [
+            {
+                "source": source.identifier,
+                "target": target.identifier,
+            }
+            for source, target in self._backend.edges()
+        ]
+        return data
 
-    def save(self, filepath: Pathlike, *, indent: int = 2) -> None:
-        save_json(self.to_dict(), filepath, indent=indent)
+    def save(self, filepath: Pathlike, *, indent: Optional[int] = 2) -> None:
+        """
+        Write the node-link document of ``to_dict`` without building it, one node and
+        one link at a time. ``indent=None`` writes it compactly, and a ``.gz``, ``.xz``
+        or ``.lzma`` suffix compresses it.
+        """
+        attributes = self._backend.attributes
+        links = ({"source": source.identifier, "target": target.identifier} for source, target in self._backend.edges())
+        with open_text(filepath, "w") as file:
+            write_node_link(
+                file,
+                (node.serialize() for node in sorted(self._backend)),
+                links,
+                attributes=dict(attributes) if attributes else None,
+                indent=indent,
+            )
 
     @property
     def empty(self) -> bool:
         return len(self) == 0
 
+    @property
+    def is_acyclic(self) -> bool:
+        return self._memoized("acyclic", self._backend.is_acyclic)
+
     @property
     def has_cycles(self) -> bool:
-        return not nx.is_directed_acyclic_graph(self._graph)
+        return not self.is_acyclic
+
+    def strongly_connected_components(self) -> Tuple[FrozenSet[NodeT], ...]:
+        return self._memoized("components", self._backend.strongly_connected_components)
+
+    def condensation(self) -> nx.DiGraph:
+        """
+        The condensation of the graph, with the node-to-component ``mapping`` graph attribute.
+        The returned graph is shared by all callers and must not be modified.
+        """
+        return self._memoized("condensation", lambda: self._backend.condensation(self.strongly_connected_components()))
+
+    def topological_order(self) -> Tuple[NodeT, ...]:
+        if not self.is_acyclic:
+            raise ValueError("Graph contains cycles, cannot perform topological sort.")
+
+        return self._memoized("topological_order", lambda: tuple(nx.topological_sort(self._graph)))
+
+    def reachability(self) -> ReachabilityIndex[NodeT]:
+        """The transitive closure of the graph, for constant-time dependency queries."""
+        return self._memoized("reachability", lambda: ReachabilityIndex(self._graph, self.condensation()))
 
     def find_cycle(self) -> Optional[List[NodeT]]:
+        if self.is_acyclic:
+            return None
+
         try:
             cycle: List[Edge[NodeT]] = nx.find_cycle(self._graph)
             return [cycle[0][0]] + [edge[1] for edge in cycle]
@@ -113,14 +269,14 @@ class Graph(Generic[NodeT]):
     def _nontrivial_components(self) -> List[List[NodeT]]:
         components = [
             sorted(component, key=lambda node: node.identifier)
-            for component in nx.strongly_connected_components(self._graph)
+            for component in self.strongly_connected_components()
             if len(component) > 1
         ]
         components.sort(key=lambda members: members[0].identifier)
         return components
 
     def annotate_cycles(self) -> None:
-        for node in self._graph.nodes:
+        for node in self._backend:
             node.in_cycle = False
             node.component = None
 
@@ -129,36 +285,81 @@ class Graph(Generic[NodeT]):
                 node.in_cycle = True
                 node.component = index
 
-    def cycle_components(self, *, length_bound: int, max_examples: int) -> List[Dict[str, Any]]:
+    def cycle_components(
+        self,
+        *,
+        length_bound: int,
+        max_examples: int,
+        time_budget: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Describe every strongly connected component with more than one node: its members,
+        up to ``max_examples`` example loops (shortest first, searched for at most
+        ``time_budget`` seconds per component) and a small set of edges whose removal
+        breaks all of its cycles.
+        """
+        nontrivial = self._nontrivial_components()
+        if not nontrivial:
+            return []
+
+        graph = self._graph
         components: List[Dict[str, Any]] = []
-        for index, members in enumerate(self._nontrivial_components()):
-            subgraph = self._graph.subgraph(members)
-            examples = [
-                [node.identifier for node in cycle]
-                for cycle in islice(nx.simple_cycles(subgraph, length_bound=length_bound), max_examples)
-            ]
+        for index, members in enumerate(nontrivial):
+            deadline = time.monotonic() + time_budget if time_budget is not None else None
+            cycles, complete = shortest_cycles(
+                graph,
+                members,
+                length_bound=length_bound,
+                max_examples=max_examples,
+                deadline=deadline,
+            )
+            arcs = sorted((source.identifier, target.identifier) for source, target in feedback_arcs(graph, members))
             components.append(
                 {
                     "component": index,
                     "modules": [node.identifier for node in members],
-                    "examples": examples,
+                    "examples": [[node.identifier for node in cycle] for cycle in cycles],
+                    "feedback_arcs": [list(arc) for arc in arcs],
+                    "truncated": not complete,
                 }
             )
 
         return components
 
     def sort(self, method: GraphSortMethod = "auto") -> None:
-        self._graph = self._sort(self._graph, method=method)
-
-    @staticmethod
-    def _sort(graph: nx.DiGraph, method: GraphSortMethod = "auto") -> nx.DiGraph:
-        if not graph:
-            return graph
+        order = self._sorted_order(method)
+        memo = self._memo if self._memo_version == self._version else {}
+        if order is None:
+            # Levels were assigned in place; neither the nodes nor their order changed.
+            carried = dict(memo)
+        else:
+            # Sorting only reorders the nodes, so the analyses that ignore node order carry over.
+            carried = {key: memo[key] for key in _ORDER_INDEPENDENT if key in memo}
+            self._backend = self._backend.reordered(order)
+            self._shared = False
+
+        self._bump()
+        self._memo = carried
+        self._memo_version = self._version
+
+    @classmethod
+    def _sort(cls, graph: nx.DiGraph, method: GraphSortMethod = "auto") -> nx.DiGraph:
+        sorted_graph = cls(graph)
+        sorted_graph.sort(method)
+        return sorted_graph._graph
+
+    def _sorted_order(self, method: GraphSortMethod = "auto") -> Optional[List[NodeT]]:
+        """
+        Assign the node levels for ``method`` and return the new node order, or ``None``
+        when the nodes keep their order.
+        """
+        if self.empty:
+            return None
 
         if method not in get_args(GraphSortMethod):
             warnings.warn(f"Unknown sorting method '{method}', defaulting to 'auto'", PDAGraphLayoutWarning)
 
-        is_acyclic: bool = nx.is_directed_acyclic_graph(graph)
+        is_acyclic: bool = self.is_acyclic
         auto: bool = method == "auto" and is_acyclic
 
         if method == "topological" and not is_acyclic:
@@ -169,92 +370,45 @@ class Graph(Generic[NodeT]):
             method = "condensation"
 
         if method == "topological" or auto:
-            return Graph._sort_topologically(graph)
+            logger.info("Sorting graph topologically")
+            for node, level in self._backend.levels().items():
+                node.level = level
 
-        if method in ("auto", "condensation"):
-            return Graph._sort_by_condensation(graph)
+            return None
 
-        return Graph._sort_by_levels(graph)
+        if method in ("auto", "condensation"):
+            return Graph._sort_by_condensation(self.condensation())
 
-    @staticmethod
-    def _sort_by_levels(graph: nx.DiGraph) -> nx.DiGraph:
         logger.info("Sorting graph by levels")
-        sorted_nodes = sorted(graph.nodes())
-        node_map: Dict[NodeT, NodeT] = {}
-        for node in sorted_nodes:
-            node.level = 0
-            node_map[node] = node
+        for node, level in condensation_levels(self.condensation()).items():
+            node.level = level
 
-        graph = graph.copy()
-        for sorted_node in sorted_nodes:
-            node = node_map[sorted_node]
-
-            if graph.in_degree(sorted_node) > 0:
-                predecessors = [node_map[pred] for pred in graph.predecessors(sorted_node)]
-                node.level = max(pred.level for pred in predecessors) + 1
-
-        return graph
+        return None
 
     @staticmethod
-    def _sort_by_condensation(graph: nx.DiGraph) -> nx.DiGraph:
+    def _sort_by_condensation(condensed: nx.DiGraph) -> List[NodeT]:
         logger.info("Sorting graph by condensation")
 
-        graph = graph.copy()
-        condensed = nx.condensation(graph)
         mapping = condensed.graph["mapping"]
+        levels = condensation_levels(condensed)
 
         components = defaultdict(list)
         for node, component_id in mapping.items():
             components[component_id].append(node)
 
-        sorted_component_ids = list(nx.topological_sort(condensed))
         final_order: List[NodeT] = []
-
-        for component_id in sorted_component_ids:
+        for component_id in nx.topological_sort(condensed):
             component_nodes: List[NodeT] = sorted(components[component_id])
-            external_preds = [
-                predecessor
-                for node in component_nodes
-                for predecessor in graph.predecessors(node)
-                if mapping[predecessor] != component_id
-            ]
-
-            if external_preds:
-                base_level = max(predecessor.level for predecessor in external_preds) + 1
-            else:
-                base_level = 0
-
             for node in component_nodes:
-                node.level = base_level
+                node.level = levels[node]
                 final_order.append(node)
 
-        sorted_graph = nx.DiGraph()
-        sorted_graph.add_nodes_from(final_order)
-        sorted_graph.add_edges_from(graph.edges())
-
-        return sorted_graph
-
-    @staticmethod
-    def _sort_topologically(graph: nx.DiGraph) -> nx.DiGraph:
-        logger.info("Sorting graph topologically")
-        if not nx.is_directed_acyclic_graph(graph):
-            raise ValueError("Graph contains cycles, cannot perform topological sort.")
-
-        graph = graph.copy()
-        roots: List[NodeT] = []
-        node_map: Dict[NodeT, NodeT] = {}
-        for node in graph.nodes():
-            node.level = 0
-            node_map[node] = node
-            if graph.in_degree(node) == 0:
-                roots.append(node)
+        return final_order
 
-        for sorted_node in nx.topological_sort(graph):
-            node = node_map[sorted_node]
-            if node in roots:
-                continue
 
-            predecessors = list(graph.predecessors(sorted_node))
-            node.level = max(pred.level for pred in predecessors) + 1
-
-        return graph
+def _create_backend(kind: GraphBackendType, graph: Optional[nx.DiGraph]) -> GraphBackend[Any]:
+    match kind:
+        case "compact":
+            return CompactBackend.from_networkx(graph)
+        case _:
+            return NetworkXBackend.from_networkx(graph)
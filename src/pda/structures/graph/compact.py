@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Final, FrozenSet, Iterator, List, Optional, Self, Set, Tuple
+
+import networkx as nx
+
+from pda.structures.graph.backend import GraphBackend
+from pda.structures.graph.leveling import sparse_longest_path_levels
+from pda.structures.node.types import NodeT
+
+_ID_BITS: Final[int] = 32
+_ID_TYPECODE: Final[str] = "q"
+
+
+class _Missing:
+    pass
+
+
+_MISSING: Final = _Missing()
+
+
+class CompactBackend(GraphBackend[NodeT]):
+    """
+    Interns every node to an integer id and keeps edges in integer arrays.
+
+    While the graph is being built, edges are appended to a pair of growable id arrays
+    and deduplicated through a set of packed integer keys. ``freeze`` turns them into a
+    compressed sparse row layout (an offset per node into one target array), which keeps
+    the edge order NetworkX would report and drops the per-edge dictionaries entirely.
+    Adding an edge to a frozen graph unpacks it again. Node attributes are held column
+    by column; edge attributes are not stored.
+
+    Acyclicity, strongly connected components and longest path levels run directly on
+    the sparse rows. The NetworkX graph that the remaining algorithms need is built for
+    each call and not kept, so the backend never holds a second copy of the graph.
+    """
+
+    kind = "compact"
+    derived = "compact"
+
+    def __init__(self) -> None:
+        self._ids: Dict[NodeT, int] = {}
+        self._nodes: List[NodeT] = []
+        self._columns: Dict[str, List[Any]] = {}
+        self._attributes: Dict[str, Any] = {}
+
+        self._sources: array[int] = array(_ID_TYPECODE)
+        self._targets: array[int] = array(_ID_TYPECODE)
+        self._keys: Set[int] = set()
+
+        self._frozen = False
+        self._offsets: array[int] = array(_ID_TYPECODE, [0])
+        self._adjacency: array[int] = array(_ID_TYPECODE)
+
+    @classmethod
+    def from_networkx(cls, graph: Optional[nx.DiGraph] = None) -> Self:
+        backend = cls()
+        if graph is None:
+            return backend
+
+        backend._attributes.update(graph.graph)
+        for node, attributes in graph.nodes(data=True):
+            backend.add_node(node)
+            if attributes:
+                backend.update_node(node, **attributes)
+
+        for source, target in graph.edges:
+            backend.add_edge(source, target)
+
+        backend.freeze()
+        return backend
+
+    def __iter__(self) -> Iterator[NodeT]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self._attributes
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def has_node(self, node: NodeT) -> bool:
+        return node in self._ids
+
+    def has_edge(self, source: NodeT, target: NodeT) -> bool:
+        source_id = self._ids.get(source)
+        target_id = self._ids.get(target)
+        if source_id is None or target_id is None:
+            return False
+
+        if self._frozen:
+            return target_id in self._successor_ids(source_id)
+
+        return self._key(source_id, target_id) in self._keys
+
+    def add_node(self, node: NodeT) -> None:
+        self._intern(node)
+
+    def add_edge(self, source: NodeT, target: NodeT) -> None:
+        source_id = self._intern(source)
+        target_id = self._intern(target)
+        if self._frozen:
+            if target_id in self._successor_ids(source_id):
+                return
+
+            self._thaw()
+
+        key = self._key(source_id, target_id)
+        if key in self._keys:
+            return
+
+        self._keys.add(key)
+        self._sources.append(source_id)
+        self._targets.append(target_id)
+
+    def update_node(self, node: NodeT, **attributes: Any) -> None:
+        node_id = self._ids[node]
+        for name, value in attributes.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [_MISSING] * len(self._nodes)
+
+            column[node_id] = value
+
+    def node_attributes(self, node: NodeT) -> Dict[str, Any]:
+        node_id = self._ids[node]
+        return {name: column[node_id] for name, column in self._columns.items() if column[node_id] is not _MISSING}
+
+    def edges(self) -> Iterator[Tuple[NodeT, NodeT]]:
+        self.freeze()
+        nodes = self._nodes
+        offsets = self._offsets
+        adjacency = self._adjacency
+        for source_id, source in enumerate(nodes):
+            for index in range(offsets[source_id], offsets[source_id + 1]):
+                yield source, nodes[adjacency[index]]
+
+    def number_of_edges(self) -> int:
+        return len(self._adjacency) if self._frozen else len(self._sources)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._nodes.clear()
+        self._columns.clear()
+        self._attributes.clear()
+        self._sources = array(_ID_TYPECODE)
+        self._targets = array(_ID_TYPECODE)
+        self._keys = set()
+        self._frozen = False
+        self._offsets = array(_ID_TYPECODE, [0])
+        self._adjacency = array(_ID_TYPECODE)
+
+    def copy(self) -> Self:
+        return self._restored(
+            nodes=list(self._nodes),
+            columns={name: list(column) for name, column in self._columns.items()},
+            attributes=dict(self._attributes),
+            edges=(array(_ID_TYPECODE, self._sources), array(_ID_TYPECODE, self._targets), set(self._keys)),
+            rows=(array(_ID_TYPECODE, self._offsets), array(_ID_TYPECODE, self._adjacency)) if self._frozen else None,
+        )
+
+    @classmethod
+    def _restored(
+        cls,
+        *,
+        nodes: List[NodeT],
+        columns: Dict[str, List[Any]],
+        attributes: Dict[str, Any],
+        edges: Tuple[array[int], array[int], Set[int]],
+        rows: Optional[Tuple[array[int], array[int]]],
+    ) -> Self:
+        """A backend over the given storage: the edges being built, or the sparse rows of a frozen graph."""
+        backend = cls()
+        backend._ids = {node: node_id for node_id, node in enumerate(nodes)}
+        backend._nodes = nodes
+        backend._columns = columns
+        backend._attributes = attributes
+        backend._sources, backend._targets, backend._keys = edges
+        if rows is not None:
+            backend._offsets, backend._adjacency = rows
+            backend._frozen = True
+
+        return backend
+
+    def networkx(self) -> nx.DiGraph:
+        graph = nx.DiGraph()
+        graph.graph = self._attributes
+        graph.add_nodes_from((node, self.node_attributes(node)) for node in self._nodes)
+        graph.add_edges_from(self.edges())
+        return graph
+
+    def is_acyclic(self) -> bool:
+        try:
+            self._levels()
+        except ValueError:
+            return False
+
+        return True
+
+    def levels(self) -> Dict[NodeT, int]:
+        return dict(zip(self._nodes, self._levels()))
+
+    def strongly_connected_components(self) -> Tuple[FrozenSet[NodeT], ...]:
+        """
+        Tarjan's algorithm over the sparse rows, with an explicit stack of (node, next
+        edge position) frames instead of recursion.
+        """
+        self.freeze()
+        offsets = self._offsets
+        adjacency = self._adjacency
+        count = len(self._nodes)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[FrozenSet[NodeT]] = []
+        counter = 0
+        for root in range(count):
+            if index[root] >= 0:
+                continue
+
+            frames = [(root, offsets[root])]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while frames:
+                node_id, position = frames[-1]
+                if position < offsets[node_id + 1]:
+                    frames[-1] = (node_id, position + 1)
+                    target_id = adjacency[position]
+                    if index[target_id] < 0:
+                        index[target_id] = lowlink[target_id] = counter
+                        counter += 1
+                        stack.append(target_id)
+                        on_stack[target_id] = True
+                        frames.append((target_id, offsets[target_id]))
+                    elif on_stack[target_id] and index[target_id] < lowlink[node_id]:
+                        lowlink[node_id] = index[target_id]
+
+                    continue
+
+                frames.pop()
+                if frames:
+                    parent_id = frames[-1][0]
+                    if lowlink[node_id] < lowlink[parent_id]:
+                        lowlink[parent_id] = lowlink[node_id]
+
+                if lowlink[node_id] == index[node_id]:
+                    members: List[NodeT] = []
+                    while True:
+                        member_id = stack.pop()
+                        on_stack[member_id] = False
+                        members.append(self._nodes[member_id])
+                        if member_id == node_id:
+                            break
+
+                    components.append(frozenset(members))
+
+        return tuple(components)
+
+    def freeze(self) -> None:
+        """Pack the edges built so far into the compressed sparse row layout."""
+        if self._frozen:
+            return
+
+        counts = [0] * len(self._nodes)
+        for source_id in self._sources:
+            counts[source_id] += 1
+
+        offsets = array(_ID_TYPECODE, [0])
+        offsets.extend(accumulate(counts))
+        cursor = list(offsets[:-1])
+        adjacency = array(_ID_TYPECODE, bytes(offsets.itemsize * len(self._sources)))
+        for source_id, target_id in zip(self._sources, self._targets):
+            adjacency[cursor[source_id]] = target_id
+            cursor[source_id] += 1
+
+        self._offsets = offsets
+        self._adjacency = adjacency
+        self._sources = array(_ID_TYPECODE)
+        self._targets = array(_ID_TYPECODE)
+        self._keys = set()
+        self._frozen = True
+
+    def _thaw(self) -> None:
+        for source_id in range(len(self._nodes)):
+            for target_id in self._successor_ids(source_id):
+                self._sources.append(source_id)
+                self._targets.append(target_id)
+                self._keys.add(self._key(source_id, target_id))
+
+        self._offsets = array(_ID_TYPECODE, [0])
+        self._adjacency = array(_ID_TYPECODE)
+        self._frozen = False
+
+    def _successor_ids(self, node_id: int) -> array[int]:
+        if node_id + 1 >= len(self._offsets):
+            return array(_ID_TYPECODE)
+
+        return self._adjacency[self._offsets[node_id] : self._offsets[node_id + 1]]
+
+    def _levels(self) -> array[int]:
+        self.freeze()
+        return sparse_longest_path_levels(self._offsets, self._adjacency)
+
+    def _intern(self, node: NodeT) -> int:
+        node_id = self._ids.get(node)
+        if node_id is not None:
+            return node_id
+
+        node_id = len(self._nodes)
+        self._ids[node] = node_id
+        self._nodes.append(node)
+        for column in self._columns.values():
+            column.append(_MISSING)
+
+        if self._frozen:
+            self._offsets.append(self._offsets[-1])
+
+        return node_id
+
+    @staticmethod
+    def _key(source_id: int, target_id: int) -> int:
+        return (source_id << _ID_BITS) | target_id
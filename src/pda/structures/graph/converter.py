@@ -1,18 +1,38 @@
 import json
 import warnings
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Generic, List, Literal, Optional, Union, overload
-
-from bs4 import BeautifulSoup, Tag
-from pyvis.network import Network
+from typing import TYPE_CHECKING, Any, Dict, Final, Generic, List, Literal, Optional, Tuple, Union, overload
 
 from pda.config import LayoutConfig, PyVisConfig, Theme
 from pda.exceptions import PDAGraphLayoutWarning
 from pda.structures.graph.base import Graph
 from pda.structures.graph.layout import GraphLayout, LayoutResult
 from pda.structures.node.types import NodeT
+from pda.tools.templates import PAGE_STYLE, vis_network_html
 from pda.types.nested_defaultdict import NestedDefaultDict, nested_defaultdict
 
+if TYPE_CHECKING:
+    from pyvis.network import Network
+
+# Network options only the pyvis template implements; HTML asking for them is rendered by pyvis.
+PYVIS_ONLY_OPTIONS: Final[Tuple[str, ...]] = ("neighborhood_highlight", "select_menu", "filter_menu")
+
+_DEFAULT_NODE_SHAPE: Final[str] = "dot"
+_DEFAULT_NODE_COLOR: Final[str] = "#97c2fc"
+_HEAD_END: Final[str] = "</head>"
+_NODE_ARGUMENTS: Final[Tuple[str, ...]] = ("label", "shape", "color")
+
+
+@dataclass
+class VisNetworkData:
+    """The node and edge arrays and the options handed to ``vis.Network``."""
+
+    nodes: List[Dict[str, Any]]
+    edges: List[Dict[str, Any]]
+    options: Dict[str, Any]
+
 
 class PyVisConverter(Generic[NodeT]):
     config: PyVisConfig
@@ -35,7 +55,7 @@ class PyVisConverter(Generic[NodeT]):
         self.layout: Optional[GraphLayout[NodeT]] = layout
 
     @overload
-    def __call__(self, graph: Graph[NodeT], *, html: Literal[False] = False, **kwargs: Any) -> Network: ...
+    def __call__(self, graph: Graph[NodeT], *, html: Literal[False] = False, **kwargs: Any) -> "Network": ...
 
     @overload
     def __call__(self, graph: Graph[NodeT], *, html: Literal[True], **kwargs: Any) -> str: ...
@@ -46,7 +66,14 @@ class PyVisConverter(Generic[NodeT]):
         *,
         html: bool = False,
         **kwargs: Any,
-    ) -> Union[str, Network]:
+    ) -> Union[str, "Network"]:
+        """
+        Convert ``graph`` to a pyvis ``Network`` or, with ``html=True``, to a standalone
+        page. ``kwargs`` override the configured ``Network`` keyword arguments.
+
+        Pages are rendered straight from the vis-network data, without pyvis, unless the
+        network options ask for one of the pyvis-only features (``PYVIS_ONLY_OPTIONS``).
+        """
         if self.layout is None and graph.has_cycles:
             warnings.warn(
                 "Graph contains cycles; the hierarchical layout may render them poorly. "
@@ -55,15 +82,69 @@ class PyVisConverter(Generic[NodeT]):
             )
 
         result = self.layout.compute(graph) if self.layout is not None else None
-        network = self._build_network(graph, result, **kwargs)
-        self._set_network_options(network, result)
+        network_kwargs = {**self.network_kwargs, **kwargs}
+        data = self.network_data(graph, result, font_color=network_kwargs.get("font_color"))
+        if html and not any(network_kwargs.get(option) for option in PYVIS_ONLY_OPTIONS):
+            return self.render_html(data, **kwargs)
 
+        network = self._build_network(data, **kwargs)
         if html:
             return self.to_html(network)
 
         return network
 
-    def to_html(self, network: Network) -> str:
+    def network_data(
+        self,
+        graph: Graph[NodeT],
+        result: Optional[LayoutResult[NodeT]] = None,
+        *,
+        font_color: Optional[str] = None,
+    ) -> VisNetworkData:
+        """
+        The vis-network arrays of ``graph``, node for node and edge for edge what pyvis
+        ``Network.add_node`` and ``add_edge`` would build, in a single pass over each.
+
+        The configured node and edge properties are resolved once into base templates that
+        every element is merged over, and the sort keys are computed once per node.
+        """
+        vis_options = self.vis_options
+        node_template: Dict[str, Any] = dict(vis_options["nodes"])
+        edge_template: Dict[str, Any] = dict(vis_options["edges"])
+
+        nodes = sorted(graph.nodes, key=attrgetter("key"))
+        node_map: Dict[NodeT, int] = {}
+        node_data: List[Dict[str, Any]] = []
+        for i, node in enumerate(nodes):
+            node_map[node] = i
+            node_properties = self._build_node_properties(node, result, template=node_template)
+            node_data.append(self._node_data(i, node_properties, font_color))
+
+        edge_data: List[Dict[str, Any]] = []
+        for from_node, to_node in graph.edges:
+            edge_properties = self._build_edge_properties(graph, from_node, to_node, template=edge_template)
+            edge_data.append(self._edge_data(node_map[from_node], node_map[to_node], edge_properties))
+
+        options: Dict[str, Any] = dict(vis_options)
+        if result is not None:
+            options = self._merge_options(options, result.vis_options_patch)
+
+        return VisNetworkData(nodes=node_data, edges=edge_data, options=options)
+
+    def render_html(self, data: VisNetworkData, **kwargs: Any) -> str:
+        """A standalone page for ``data``, laid out with the configured network options."""
+        network_kwargs = {**self.network_kwargs, **kwargs}
+        return vis_network_html(
+            data.nodes,
+            data.edges,
+            data.options,
+            height=network_kwargs.get("height", "600px"),
+            width=network_kwargs.get("width", "100%"),
+            bgcolor=network_kwargs.get("bgcolor", "#ffffff"),
+            heading=network_kwargs.get("heading", ""),
+            cdn_resources=network_kwargs.get("cdn_resources", "remote"),
+        )
+
+    def to_html(self, network: "Network") -> str:
         html: str = network.generate_html(".temp.html")
         return self._inject_background_color(html)
 
@@ -100,44 +181,54 @@ class PyVisConverter(Generic[NodeT]):
     def network_kwargs(self) -> Dict[str, Any]:
         return self.config.network or {}
 
-    def _build_network(
-        self,
-        graph: Graph[NodeT],
-        result: Optional[LayoutResult[NodeT]] = None,
-        **kwargs: Any,
-    ) -> Network:
-        nodes = sorted(graph.nodes)
-        network_kwargs = self.network_kwargs
-        pyvis_graph = Network(directed=True, **network_kwargs, **kwargs)
-        node_map = self._add_nodes(pyvis_graph, nodes, result)
-        self._add_edges(pyvis_graph, graph, node_map)
+    def _build_network(self, data: VisNetworkData, **kwargs: Any) -> "Network":
+        from pyvis.network import Network
+
+        pyvis_graph = Network(directed=True, **self.network_kwargs, **kwargs)
+        # The prepared arrays are assigned to the attributes ``add_node`` and ``add_edge``
+        # fill in pyvis 0.3.2, the version pinned in pyproject.toml, skipping their
+        # per-element checks; revisit this when upgrading pyvis.
+        pyvis_graph.nodes = data.nodes
+        pyvis_graph.node_ids = [node["id"] for node in data.nodes]
+        pyvis_graph.node_map = {node["id"]: node for node in data.nodes}
+        pyvis_graph.edges = data.edges
+        pyvis_graph.set_options(json.dumps(data.options))
         return pyvis_graph
 
-    def _set_network_options(self, network: Network, result: Optional[LayoutResult[NodeT]] = None) -> None:
-        options: Dict[str, Any] = dict(self.vis_options)
-        if result is not None:
-            options = self._merge_options(options, result.vis_options_patch)
+    @staticmethod
+    def _node_data(node_id: int, properties: Dict[str, Any], font_color: Optional[str]) -> Dict[str, Any]:
+        data = {key: value for key, value in properties.items() if key not in _NODE_ARGUMENTS}
+        if "group" not in data:
+            data["color"] = properties.get("color", _DEFAULT_NODE_COLOR)
+
+        data["id"] = node_id
+        data["label"] = properties.get("label") or node_id
+        data["shape"] = properties.get("shape", _DEFAULT_NODE_SHAPE)
+        if font_color:
+            data["font"] = {"color": font_color}
+
+        return data
+
+    @staticmethod
+    def _edge_data(from_id: int, to_id: int, properties: Dict[str, Any]) -> Dict[str, Any]:
+        data = {**properties, "from": from_id, "to": to_id}
+        if "arrows" not in data:
+            data["arrows"] = "to"
 
-        network.set_options(json.dumps(options))
+        return data
 
-    def _add_nodes(
+    def _build_node_properties(
         self,
-        pyvis_graph: Network,
-        nodes: List[NodeT],
+        node: NodeT,
         result: Optional[LayoutResult[NodeT]] = None,
-    ) -> Dict[NodeT, int]:
-        node_map: Dict[NodeT, int] = {}
-        for i, node in enumerate(nodes):
-            node_map[node] = i
-            node_props = self._build_node_properties(node, result)
-            pyvis_graph.add_node(i, **node_props)
-
-        return node_map
+        *,
+        template: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if template is None:
+            template = self.vis_options["nodes"]
 
-    def _build_node_properties(self, node: NodeT, result: Optional[LayoutResult[NodeT]] = None) -> Dict[str, Any]:
-        node_properties = self.vis_options["nodes"]
         props: Dict[str, Any] = {
-            **node_properties,
+            **template,
             "label": node.label,
             "title": node.details or node.label,
             "level": node.level,
@@ -169,44 +260,26 @@ class PyVisConverter(Generic[NodeT]):
 
         return merged
 
-    def _add_edges(
+    def _build_edge_properties(
         self,
-        pyvis_graph: Network,
         graph: Graph[NodeT],
-        node_map: Dict[NodeT, int],
-    ) -> None:
-        for from_node, to_node in graph.edges:
-            edge_properties = self._build_edge_properties(graph, from_node, to_node)
-            pyvis_graph.add_edge(
-                node_map[from_node],
-                node_map[to_node],
-                **edge_properties,
-            )
+        from_node: NodeT,
+        to_node: NodeT,
+        *,
+        template: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if template is None:
+            template = self.vis_options["edges"]
 
-    def _build_edge_properties(self, graph: Graph[NodeT], from_node: NodeT, to_node: NodeT) -> Dict[str, Any]:
-        edge_properties = self.vis_options["edges"]
         return {
             "title": graph.edge_label(from_node, to_node),
-            **edge_properties,
+            **template,
         }
 
     def _inject_background_color(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        head: Optional[Tag] = soup.head
-        if head is None:
+        head_end = html.rfind(_HEAD_END)
+        if head_end < 0:
             raise ValueError("Generated HTML is missing a <head> element.")
 
-        network_config = self.network_kwargs
-        style_tag = soup.new_tag("style")
-        style_tag.string = f"""
-        body {{
-            background-color: {network_config.get("bgcolor", "#ffffff")};
-        }}
-
-        .card, #mynetwork {{
-            border: none !important;
-        }}
-        """
-
-        head.append(style_tag)
-        return str(soup)
+        style = PAGE_STYLE.substitute(bgcolor=self.network_kwargs.get("bgcolor", "#ffffff"))
+        return f"{html[:head_end]}{style}\n{html[head_end:]}"
@@ -0,0 +1,165 @@
+import heapq
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+import networkx as nx
+
+from pda.structures.node.types import Edge, NodeT
+
+_DEADLINE_CHECK_INTERVAL = 1024
+
+
+def shortest_cycles(
+    graph: nx.DiGraph,
+    members: Sequence[NodeT],
+    *,
+    length_bound: int,
+    max_examples: int,
+    deadline: Optional[float] = None,
+) -> Tuple[List[List[NodeT]], bool]:
+    """
+    Up to ``max_examples`` distinct cycles within ``members``, shortest first.
+
+    A breadth-first search from every member finds the shortest cycle through it, no
+    longer than ``length_bound``. Each cycle is rotated to start at its earliest member.
+    The search stops at ``deadline`` (a ``time.monotonic`` value). The flag returned next
+    to the cycles tells whether every member was searched.
+    """
+    if max_examples == 0:
+        return [], True
+
+    rank = {node: index for index, node in enumerate(members)}
+    found: Dict[Tuple[int, ...], List[NodeT]] = {}
+    for start in members:
+        if deadline is not None and time.monotonic() > deadline:
+            return _select(found, max_examples), False
+
+        cycle, timed_out = _shortest_cycle_through(graph, start, rank, length_bound=length_bound, deadline=deadline)
+        if timed_out:
+            return _select(found, max_examples), False
+
+        if cycle is None:
+            continue
+
+        ranks = [rank[node] for node in cycle]
+        pivot = ranks.index(min(ranks))
+        rotated = cycle[pivot:] + cycle[:pivot]
+        found.setdefault(tuple(rank[node] for node in rotated), rotated)
+
+    return _select(found, max_examples), True
+
+
+def _shortest_cycle_through(
+    graph: nx.DiGraph,
+    start: NodeT,
+    rank: Dict[NodeT, int],
+    *,
+    length_bound: int,
+    deadline: Optional[float],
+) -> Tuple[Optional[List[NodeT]], bool]:
+    """The shortest cycle through ``start``, if any, and whether the search ran past ``deadline``."""
+    parents: Dict[NodeT, NodeT] = {start: start}
+    depths: Dict[NodeT, int] = {start: 0}
+    queue: Deque[NodeT] = deque([start])
+    popped = 0
+    while queue:
+        node = queue.popleft()
+        popped += 1
+        if deadline is not None and popped % _DEADLINE_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+            return None, True
+
+        if depths[node] >= length_bound:
+            continue
+
+        for successor in graph.successors(node):
+            if successor == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+
+                path.reverse()
+                return path, False
+
+            if successor in rank and successor not in parents:
+                parents[successor] = node
+                depths[successor] = depths[node] + 1
+                queue.append(successor)
+
+    return None, False
+
+
+def _select(found: Dict[Tuple[int, ...], List[NodeT]], max_examples: int) -> List[List[NodeT]]:
+    keys = sorted(found, key=lambda ranks: (len(ranks), ranks))
+    return [found[key] for key in keys[:max_examples]]
+
+
+def feedback_arcs(graph: nx.DiGraph, members: Sequence[NodeT]) -> List[Edge[NodeT]]:
+    """
+    Edges within ``members`` whose removal leaves them acyclic, chosen with the greedy
+    heuristic of Eades, Lin and Smyth.
+
+    Sinks are peeled off to the back of a vertex sequence and sources to the front; when
+    neither is left, the vertex with the largest out-degree minus in-degree goes to the
+    front. The edges pointing backwards in the final sequence form the set.
+    """
+    remaining: Set[NodeT] = set(members)
+    rank = {node: index for index, node in enumerate(members)}
+    successors = {node: [target for target in graph.successors(node) if target in remaining] for node in members}
+    predecessors = {node: [source for source in graph.predecessors(node) if source in remaining] for node in members}
+    out_degree = {node: len(successors[node]) for node in members}
+    in_degree = {node: len(predecessors[node]) for node in members}
+
+    sinks: Deque[NodeT] = deque(node for node in members if out_degree[node] == 0)
+    sources: Deque[NodeT] = deque(node for node in members if in_degree[node] == 0 and out_degree[node] > 0)
+    heap = [(in_degree[node] - out_degree[node], rank[node], node) for node in members]
+    heapq.heapify(heap)
+
+    front: List[NodeT] = []
+    back: List[NodeT] = []
+
+    def remove(node: NodeT) -> None:
+        remaining.discard(node)
+        for target in successors[node]:
+            if target in remaining:
+                in_degree[target] -= 1
+                if in_degree[target] == 0 and out_degree[target] > 0:
+                    sources.append(target)
+                else:
+                    heapq.heappush(heap, (in_degree[target] - out_degree[target], rank[target], target))
+
+        for source in predecessors[node]:
+            if source in remaining:
+                out_degree[source] -= 1
+                if out_degree[source] == 0:
+                    sinks.append(source)
+                else:
+                    heapq.heappush(heap, (in_degree[source] - out_degree[source], rank[source], source))
+
+    while remaining:
+        if sinks:
+            node = sinks.popleft()
+            if node in remaining:
+                back.append(node)
+                remove(node)
+
+            continue
+
+        if sources:
+            node = sources.popleft()
+            if node in remaining and in_degree[node] == 0:
+                front.append(node)
+                remove(node)
+
+            continue
+
+        delta, _, node = heapq.heappop(heap)
+        if node in remaining and delta == in_degree[node] - out_degree[node]:
+            front.append(node)
+            remove(node)
+
+    order = front + back[::-1]
+    position = {node: index for index, node in enumerate(order)}
+    return [
+        (source, target) for source in order for target in successors[source] if position[target] < position[source]
+    ]
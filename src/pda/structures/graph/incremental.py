@@ -0,0 +1,102 @@
+from typing import Dict, Generic, List, Optional, Set, Union
+
+from pda.structures.node.types import NodeT
+
+
+class IncrementalCycleDetector(Generic[NodeT]):
+    """
+    Keeps a topological order of a growing graph and reports the first edge that closes
+    a cycle (Pearce and Kelly's dynamic topological sort).
+
+    An edge that agrees with the current order is accepted in constant time. Otherwise
+    only the nodes whose position lies between its endpoints are searched: forwards from
+    the target, where reaching the source means a cycle, and backwards from the source,
+    after which the two affected regions swap positions.
+    """
+
+    def __init__(self) -> None:
+        self._order: Dict[NodeT, int] = {}
+        self._successors: Dict[NodeT, Dict[NodeT, None]] = {}
+        self._predecessors: Dict[NodeT, Dict[NodeT, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add_node(self, node: NodeT) -> None:
+        if node not in self._order:
+            self._order[node] = len(self._order)
+            self._successors[node] = {}
+            self._predecessors[node] = {}
+
+    def add_edge(self, source: NodeT, target: NodeT) -> Optional[List[NodeT]]:
+        """
+        Record ``source -> target`` and return ``None``, or return the cycle the edge
+        would close as a path ``[target, ..., source]`` without recording it.
+        """
+        if source == target:
+            return [source]
+
+        self.add_node(source)
+        self.add_node(target)
+        if target in self._successors[source]:
+            return None
+
+        lower = self._order[target]
+        upper = self._order[source]
+        if lower < upper:
+            forward = self._search_forward(source, target, upper)
+            if isinstance(forward, list):
+                return forward
+
+            backward = self._search_backward(source, lower)
+            self._reorder(backward, forward)
+
+        self._successors[source][target] = None
+        self._predecessors[target][source] = None
+        return None
+
+    def _search_forward(self, source: NodeT, target: NodeT, upper: int) -> Union[List[NodeT], Set[NodeT]]:
+        parents: Dict[NodeT, Optional[NodeT]] = {target: None}
+        stack = [target]
+        while stack:
+            node = stack.pop()
+            for successor in self._successors[node]:
+                if successor == source:
+                    return [*self._path(parents, node), source]
+
+                if successor not in parents and self._order[successor] < upper:
+                    parents[successor] = node
+                    stack.append(successor)
+
+        return set(parents)
+
+    def _search_backward(self, source: NodeT, lower: int) -> Set[NodeT]:
+        visited = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            for predecessor in self._predecessors[node]:
+                if predecessor not in visited and self._order[predecessor] > lower:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+
+        return visited
+
+    def _reorder(self, backward: Set[NodeT], forward: Set[NodeT]) -> None:
+        order = self._order
+        ahead = sorted(backward, key=order.__getitem__)
+        behind = sorted(forward, key=order.__getitem__)
+        positions = sorted(order[node] for node in ahead + behind)
+        for node, position in zip(ahead + behind, positions):
+            order[node] = position
+
+    @staticmethod
+    def _path(parents: Dict[NodeT, Optional[NodeT]], last: NodeT) -> List[NodeT]:
+        path = [last]
+        parent = parents[last]
+        while parent is not None:
+            path.append(parent)
+            parent = parents[parent]
+
+        path.reverse()
+        return path
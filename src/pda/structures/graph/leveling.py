@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Final, Iterable, List, Sequence, Tuple
+
+import networkx as nx
+
+_ID_TYPECODE: Final[str] = "q"
+
+
+def longest_path_levels(count: int, edges: Iterable[Tuple[int, int]]) -> array[int]:
+    """
+    The length of the longest path reaching each of ``count`` integer nodes of a DAG.
+
+    Nodes are processed in topological frontiers: a node joins the next frontier once all
+    of its predecessors have been levelled, so every level is final when it is read and a
+    single pass over the edge arrays suffices.
+    """
+    sources: array[int] = array(_ID_TYPECODE)
+    targets: array[int] = array(_ID_TYPECODE)
+    for source, target in edges:
+        sources.append(source)
+        targets.append(target)
+
+    out_counts = [0] * count
+    for source in sources:
+        out_counts[source] += 1
+
+    offsets = array(_ID_TYPECODE, [0])
+    offsets.extend(accumulate(out_counts))
+    cursor = list(offsets[:-1])
+    adjacency = array(_ID_TYPECODE, bytes(offsets.itemsize * len(sources)))
+    for source, target in zip(sources, targets):
+        adjacency[cursor[source]] = target
+        cursor[source] += 1
+
+    return sparse_longest_path_levels(offsets, adjacency)
+
+
+def sparse_longest_path_levels(offsets: Sequence[int], adjacency: Sequence[int]) -> array[int]:
+    """
+    ``longest_path_levels`` of a DAG already held in compressed sparse row form: the
+    successors of node ``i`` are ``adjacency[offsets[i]:offsets[i + 1]]``.
+    """
+    count = len(offsets) - 1
+    indegree = [0] * count
+    for target in adjacency:
+        indegree[target] += 1
+
+    levels = array(_ID_TYPECODE, [0]) * count
+    frontier = [node for node in range(count) if indegree[node] == 0]
+    visited = len(frontier)
+    while frontier:
+        following: List[int] = []
+        for source in frontier:
+            level = levels[source] + 1
+            for index in range(offsets[source], offsets[source + 1]):
+                target = adjacency[index]
+                if levels[target] < level:
+                    levels[target] = level
+
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    following.append(target)
+
+        visited += len(following)
+        frontier = following
+
+    if visited != count:
+        raise ValueError("Graph contains cycles, cannot compute longest path levels.")
+
+    return levels
+
+
+def graph_levels(graph: nx.DiGraph) -> Dict[Any, int]:
+    """Longest path levels of the nodes of an acyclic NetworkX graph."""
+    nodes = list(graph)
+    ids = {node: index for index, node in enumerate(nodes)}
+    levels = longest_path_levels(len(nodes), ((ids[source], ids[target]) for source, target in graph.edges))
+    return dict(zip(nodes, levels))
+
+
+def condensation_levels(condensed: nx.DiGraph) -> Dict[Any, int]:
+    """
+    Longest path levels of the nodes of the graph ``condensed`` was built from: every
+    member of a strongly connected component takes the level of its component.
+    """
+    levels = longest_path_levels(condensed.number_of_nodes(), condensed.edges)
+    mapping: Dict[Any, int] = condensed.graph["mapping"]
+    return {node: levels[component] for node, component in mapping.items()}
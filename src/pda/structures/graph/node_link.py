@@ -0,0 +1,238 @@
+import json
+import re
+from typing import IO, Any, Dict, Final, Iterable, Iterator, List, Optional, Tuple
+
+from pda.tools.serialization import COMPACT_SEPARATORS
+
+CHUNK_SIZE: Final[int] = 1024
+READ_SIZE: Final[int] = 1 << 16
+ARRAY_MEMBERS: Final = ("nodes", "links")
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+
+
+class NodeLinkWriter:
+    """
+    Writes a node-link JSON document to a text file one member at a time.
+
+    Array items are buffered and encoded ``CHUNK_SIZE`` at a time, so only one chunk is
+    held in memory and nodes and links can be produced lazily. With an ``indent`` the
+    output is byte for byte what ``json.dump`` writes for the equivalent dictionary;
+    without one it carries no whitespace, and every chunk is a single call into the C
+    accelerated encoder.
+
+    Members are written in the order they are given, after the leading ``"directed"``.
+    An array opened with ``begin`` must be closed with ``end`` before the next member.
+    """
+
+    def __init__(self, file: IO[str], *, indent: Optional[int] = None) -> None:
+        self._file = file
+        self._indent = indent
+        self._encoder = json.JSONEncoder(
+            indent=indent,
+            separators=COMPACT_SEPARATORS if indent is None else None,
+        )
+        self._open: Optional[str] = None
+        self._pending: List[Any] = []
+        self._items = 0
+        self._members = 0
+        self._file.write("{")
+        self.field("directed", True)
+
+    def field(self, key: str, value: Any) -> None:
+        """Write a whole member."""
+        self._member(key)
+        self._file.write(self._encoder.encode(value).replace("\n", self._newline(1)))
+
+    def begin(self, key: str) -> None:
+        """Open an array member."""
+        self._member(key)
+        self._file.write("[")
+        self._open = key
+        self._items = 0
+
+    def item(self, value: Any) -> None:
+        """Append an item to the open array."""
+        if self._open is None:
+            raise ValueError("No array is open")
+
+        self._pending.append(value)
+        if len(self._pending) >= CHUNK_SIZE:
+            self.flush()
+
+    def end(self) -> None:
+        """Close the open array."""
+        if self._open is None:
+            raise ValueError("No array is open")
+
+        self.flush()
+        if self._items:
+            self._file.write(self._newline(1))
+
+        self._file.write("]")
+        self._open = None
+
+    def array(self, key: str, items: Iterable[Any]) -> None:
+        """Write an array member from ``items``."""
+        self.begin(key)
+        for item in items:
+            self.item(item)
+
+        self.end()
+
+    def flush(self) -> None:
+        """Encode the buffered items of the open array."""
+        if not self._pending:
+            return
+
+        encoded = self._encoder.encode(self._pending)
+        if self._indent is None:
+            chunk = encoded[1:-1]
+        else:
+            chunk = encoded[1:-2].replace("\n", self._newline(1))
+
+        self._file.write("," + chunk if self._items else chunk)
+        self._items += len(self._pending)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Close the document. The file itself stays open."""
+        if self._open is not None:
+            self.end()
+
+        self._file.write(self._newline(0))
+        self._file.write("}")
+
+    def _member(self, key: str) -> None:
+        if self._open is not None:
+            raise ValueError(f"Array '{self._open}' is still open")
+
+        if self._members:
+            self._file.write(",")
+
+        self._members += 1
+        self._file.write(self._newline(1))
+        self._file.write(json.dumps(key))
+        self._file.write(": " if self._indent is not None else ":")
+
+    def _newline(self, depth: int) -> str:
+        if self._indent is None:
+            return ""
+
+        return "\n" + " " * (self._indent * depth)
+
+
+def write_node_link(
+    file: IO[str],
+    nodes: Iterable[Dict[str, Any]],
+    links: Iterable[Dict[str, Any]],
+    *,
+    attributes: Optional[Dict[str, Any]] = None,
+    indent: Optional[int] = None,
+) -> None:
+    """Write a whole node-link document in the key order of ``Graph.to_dict``."""
+    writer = NodeLinkWriter(file, indent=indent)
+    if attributes:
+        writer.field("graph", attributes)
+
+    writer.array("nodes", nodes)
+    writer.array("links", links)
+    writer.close()
+
+
+def read_node_link(file: IO[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Parse a node-link JSON document incrementally, reading ``READ_SIZE`` characters at a time.
+
+    Every item of the ``nodes`` and ``links`` arrays is yielded on its own, paired with
+    the name of its array; any other member is yielded whole, paired with its key. Only
+    the item being decoded and the unread part of the last block are held in memory.
+    """
+    reader = _JsonReader(file)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key, found {key!r}")
+
+        reader.expect(":")
+        if key in ARRAY_MEMBERS and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield key, reader.value()
+                    if reader.expect(",", "]") == "]":
+                        break
+        else:
+            yield key, reader.value()
+
+        if reader.expect(",", "}") == "}":
+            return
+
+
+class _JsonReader:
+    def __init__(self, file: IO[str]) -> None:
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        while True:
+            position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+            self._position = position
+            if position < len(self._buffer):
+                return self._buffer[position]
+
+            if not self._read():
+                raise ValueError("Unexpected end of the node-link document")
+
+    def expect(self, *tokens: str) -> str:
+        token = self.peek()
+        if token not in tokens:
+            raise ValueError(f"Expected {' or '.join(map(repr, tokens))} in the node-link document, found {token!r}")
+
+        self._position += 1
+        return token
+
+    def value(self) -> Any:
+        """
+        Decode the next value. A value cut off by the end of the buffer is decoded again
+        once more text has been read, in blocks that double each time so that a large
+        value is decoded a logarithmic number of times.
+        """
+        self.peek()
+        size = READ_SIZE
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read(size):
+                    raise
+
+                size *= 2
+                continue
+
+            if end < len(self._buffer) or self._exhausted:
+                self._position = end
+                return value
+
+            self._read(size)
+
+    def _read(self, size: int = READ_SIZE) -> bool:
+        if self._exhausted:
+            return False
+
+        block = self._file.read(size)
+        if not block:
+            self._exhausted = True
+            return False
+
+        self._buffer = self._buffer[self._position :] + block
+        self._position = 0
+        return True
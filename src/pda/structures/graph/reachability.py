@@ -0,0 +1,88 @@
+from collections.abc import Hashable
+from typing import Dict, Generic, List, Optional, TypeVar
+
+import networkx as nx
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class ReachabilityIndex(Generic[KeyT]):
+    """
+    Transitive closure of a directed graph, one bitset per strongly connected component.
+
+    Nodes are numbered in graph order and every set of nodes is a Python integer with one
+    bit per node. The components of the condensation are visited in reverse topological
+    order, so the reachable set of a component is its own members OR-ed with the sets of
+    its successors, all of which are already known. Queries are bit tests and bitwise
+    operations over ``n / 64`` machine words.
+
+    A node reaches another when there is a path of at least one edge between them, so a
+    node reaches itself only when it lies on a cycle.
+    """
+
+    def __init__(self, graph: nx.DiGraph, condensed: Optional[nx.DiGraph] = None) -> None:
+        if condensed is None:
+            condensed = nx.condensation(graph)
+
+        self._nodes: List[KeyT] = list(graph)
+        self._bits: Dict[KeyT, int] = {node: index for index, node in enumerate(self._nodes)}
+        self._components: Dict[KeyT, int] = condensed.graph["mapping"]
+
+        members = [0] * condensed.number_of_nodes()
+        sizes = [0] * condensed.number_of_nodes()
+        for node, component in self._components.items():
+            members[component] |= 1 << self._bits[node]
+            sizes[component] += 1
+
+        self._members = members
+        self._cyclic = [size > 1 for size in sizes]
+        for node in nx.nodes_with_selfloops(graph):
+            self._cyclic[self._components[node]] = True
+
+        self._reachable = list(members)
+        for component in reversed(list(nx.topological_sort(condensed))):
+            reachable = self._reachable[component]
+            for successor in condensed.successors(component):
+                reachable |= self._reachable[successor]
+
+            self._reachable[component] = reachable
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._bits
+
+    def reaches(self, source: KeyT, target: KeyT) -> bool:
+        """Whether ``source`` transitively depends on ``target``."""
+        return bool(self._mask(source) >> self._bits[target] & 1)
+
+    def closure(self, node: KeyT) -> List[KeyT]:
+        """Every node ``node`` transitively depends on, in graph order."""
+        return self._decode(self._mask(node))
+
+    def closure_size(self, node: KeyT) -> int:
+        return self._mask(node).bit_count()
+
+    def common(self, *nodes: KeyT) -> List[KeyT]:
+        """The nodes every one of ``nodes`` transitively depends on, in graph order."""
+        if not nodes:
+            return []
+
+        mask = self._mask(nodes[0])
+        for node in nodes[1:]:
+            mask &= self._mask(node)
+
+        return self._decode(mask)
+
+    def _mask(self, node: KeyT) -> int:
+        component = self._components[node]
+        mask = self._reachable[component]
+        if self._cyclic[component]:
+            return mask
+
+        return mask & ~(1 << self._bits[node])
+
+    def _decode(self, mask: int) -> List[KeyT]:
+        bits = bin(mask)[:1:-1]
+        return [self._nodes[index] for index, bit in enumerate(bits) if bit == "1"]
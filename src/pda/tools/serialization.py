@@ -1,19 +1,49 @@
+import gzip
 import json
-from typing import Any
+import lzma
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Final, Optional
 
 import yaml
 
 from pda.types import Pathlike
 
+COMPACT_SEPARATORS: Final = (",", ":")
+
+_OPENERS: Final[Dict[str, Callable[..., IO[str]]]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+
+def open_text(filepath: Pathlike, mode: str = "r") -> IO[str]:
+    """
+    Open a UTF-8 text file, compressed with gzip or lzma when the path ends
+    in ``.gz``, ``.xz`` or ``.lzma``.
+    """
+    opener = _OPENERS.get(Path(filepath).suffix.lower())
+    if opener is None:
+        return open(filepath, mode, encoding="utf-8")
+
+    return opener(filepath, f"{mode}t", encoding="utf-8")
+
+
+def strip_compression(filepath: Pathlike) -> Path:
+    """The path without its compression suffix, if it has one."""
+    path = Path(filepath)
+    return path.with_suffix("") if path.suffix.lower() in _OPENERS else path
+
 
 def load_json(filepath: Pathlike) -> Any:
-    with open(filepath, "r", encoding="utf-8") as file:
+    with open_text(filepath, "r") as file:
         return json.load(file)
 
 
-def save_json(data: Any, filepath: Pathlike, indent: int = 4) -> None:
-    with open(filepath, "w", encoding="utf-8") as file:
-        json.dump(data, file, indent=indent)
+def save_json(data: Any, filepath: Pathlike, indent: Optional[int] = 4) -> None:
+    """Write ``data`` as JSON, indented or, with ``indent=None``, without any whitespace."""
+    with open_text(filepath, "w") as file:
+        json.dump(data, file, indent=indent, separators=None if indent is not None else COMPACT_SEPARATORS)
 
 
 def load_yaml(filepath: Pathlike) -> Any:
@@ -27,5 +57,5 @@ def save_yaml(data: Any, filepath: Pathlike) -> None:
 
 
 def save_html(content: str, filepath: Pathlike) -> None:
-    with open(filepath, "w", encoding="utf-8") as file:
+    with open_text(filepath, "w") as file:
         file.write(content)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Set, Tuple
+
+from pda.tools.paths import is_dir, is_file
+from pda.tools.singleton import Singleton
+from pda.types import Pathlike
+
+PYTHON_SUFFIX = ".py"
+
+
+class ZipArchiveIndex:
+    """
+    In-memory view of a zip archive's central directory.
+
+    The central directory is read once; membership questions are answered from the index.
+    The archive is reopened on the first read and the handle is kept for the reads that
+    follow, until ``close`` releases it.
+    """
+
+    def __init__(self, archive: Path) -> None:
+        self._archive = archive
+        self._handle: Optional[zipfile.ZipFile] = None
+        self._files: Set[str] = set()
+        self._directories: Set[str] = {""}
+        with zipfile.ZipFile(archive) as archived:
+            infos = archived.infolist()
+
+        for info in infos:
+            name = info.filename.rstrip("/")
+            if info.is_dir():
+                self._directories.add(name)
+            else:
+                self._files.add(name)
+
+            self._directories.update(str(parent) for parent in PurePosixPath(name).parents if str(parent) != ".")
+
+    @property
+    def archive(self) -> Path:
+        return self._archive
+
+    def member(self, path: Path) -> str:
+        relative = path.relative_to(self._archive).as_posix()
+        return "" if relative == "." else relative
+
+    def is_file(self, member: str) -> bool:
+        return member in self._files
+
+    def is_dir(self, member: str) -> bool:
+        return member in self._directories
+
+    def has_python_file(self, member: str) -> bool:
+        prefix = f"{member}/" if member else ""
+        return any(name.startswith(prefix) and name.endswith(PYTHON_SUFFIX) for name in self._files)
+
+    def read_text(self, member: str, encoding: str = "utf-8") -> str:
+        if self._handle is None:
+            self._handle = zipfile.ZipFile(self._archive)  # pylint: disable=consider-using-with
+
+        return self._handle.read(member).decode(encoding)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class SourceProvider(metaclass=Singleton):
+    """
+    Answers file questions and serves module sources from the filesystem, falling back
+    to zip archives found on the path (zipped standard libraries, zipped eggs) so that
+    archived modules can be analyzed without extracting them.
+    """
+
+    def __init__(self) -> None:
+        self._archives: Dict[Path, ZipArchiveIndex] = {}
+
+    def is_file(self, path: Pathlike) -> bool:
+        path = Path(path)
+        return is_file(path) or self.is_archived_file(path)
+
+    def is_dir(self, path: Pathlike) -> bool:
+        path = Path(path)
+        if is_dir(path):
+            return True
+
+        located = self._locate(path)
+        return located is not None and located[0].is_dir(located[1])
+
+    def exists(self, path: Pathlike) -> bool:
+        return self.is_file(path) or self.is_dir(path)
+
+    def is_python_file(self, path: Pathlike) -> bool:
+        path = Path(path)
+        return path.suffix.lower() == PYTHON_SUFFIX and self.is_file(path)
+
+    def is_archived(self, path: Pathlike) -> bool:
+        return self._locate(Path(path)) is not None
+
+    def is_archived_file(self, path: Pathlike) -> bool:
+        located = self._locate(Path(path))
+        return located is not None and located[0].is_file(located[1])
+
+    def has_archived_python_file(self, path: Pathlike) -> bool:
+        located = self._locate(Path(path))
+        return located is not None and located[0].has_python_file(located[1])
+
+    def read_text(self, path: Pathlike, encoding: str = "utf-8") -> str:
+        path = Path(path)
+        if is_file(path):
+            return path.read_text(encoding=encoding)
+
+        located = self._locate(path)
+        if located is None or not located[0].is_file(located[1]):
+            raise FileNotFoundError(f"The file {path} does not exist or is not a file")
+
+        archive, member = located
+        return archive.read_text(member, encoding=encoding)
+
+    def clear(self) -> None:
+        for archive in set(self._archives.values()):
+            archive.close()
+
+        self._archives.clear()
+
+    def _locate(self, path: Path) -> Optional[Tuple[ZipArchiveIndex, str]]:
+        for candidate in (path, *path.parents):
+            archive = self._archives.get(candidate)
+            if archive is not None:
+                return archive, archive.member(path)
+
+            if is_dir(candidate):
+                return None
+
+            if is_file(candidate):
+                return self._open(candidate, path)
+
+        return None
+
+    def _open(self, candidate: Path, path: Path) -> Optional[Tuple[ZipArchiveIndex, str]]:
+        if candidate.suffix == PYTHON_SUFFIX or not zipfile.is_zipfile(candidate):
+            return None
+
+        archive = ZipArchiveIndex(candidate)
+        self._archives[candidate] = archive
+        return archive, archive.member(path)
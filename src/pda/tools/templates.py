@@ -1,10 +1,80 @@
+import json
 import re
+from functools import cache
+from importlib import resources
 from pathlib import Path
 from string import Template
-from typing import Any, Dict
+from typing import Any, Dict, Final, Optional, Tuple
 
 import yaml
 
+from pda.tools.logger import logger
+
+VIS_NETWORK_VERSION: Final[str] = "9.1.2"
+
+_VIS_NETWORK_CDN: Final[str] = f"https://cdnjs.cloudflare.com/ajax/libs/vis-network/{VIS_NETWORK_VERSION}/dist"
+_VIS_NETWORK_REMOTE: Final[str] = (
+    f'<link rel="stylesheet" href="{_VIS_NETWORK_CDN}/dist/vis-network.min.css"'
+    ' integrity="sha512-WgxfT5LWjfszlPHXRmBWHkV2eceiWTOBvrKCNbdgDYTHrT2AeLCGbF4sZlZw3UMN3WtL0tGUoIAKsu8mllg/XA=="'
+    ' crossorigin="anonymous" referrerpolicy="no-referrer" />\n'
+    f'        <script src="{_VIS_NETWORK_CDN}/vis-network.min.js"'
+    ' integrity="sha512-LnvoEWDFrqGHlHmDD2101OrLcbsfkrzoSpvtSQtxK3RMnRV0eOkhhBN2dXHKRrUU8p2DGRTk35n4O8nWSVe1mQ=="'
+    ' crossorigin="anonymous" referrerpolicy="no-referrer"></script>'
+)
+
+# The ``cdn_resources`` values of pyvis. pyvis serves ``local`` from a ``lib`` directory
+# written next to the page; a standalone page has none, so the bundled files are inlined.
+CDN_RESOURCES: Final[Tuple[str, ...]] = ("local", "in_line", "remote")
+_INLINED_RESOURCES: Final[Tuple[str, ...]] = ("local", "in_line")
+
+# ``$``-placeholders only; the inlined scripts and the graph data are substituted, never parsed.
+VIS_NETWORK_HTML: Final = Template("""<html>
+    <head>
+        <meta charset="utf-8">
+        $resources
+        $page_style
+        <style type="text/css">
+            #mynetwork {
+                width: $width;
+                height: $height;
+                background-color: $bgcolor;
+                position: relative;
+                float: left;
+            }
+        </style>
+    </head>
+
+    <body>
+        $heading
+        <div class="card" style="width: 100%">
+            <div id="mynetwork" class="card-body"></div>
+        </div>
+
+        <script type="text/javascript">
+            var nodes = new vis.DataSet($nodes);
+            var edges = new vis.DataSet($edges);
+            var options = $options;
+            var container = document.getElementById("mynetwork");
+            var network = new vis.Network(container, {nodes: nodes, edges: edges}, options);
+        </script>
+    </body>
+</html>
+""")
+
+# Paints the page around the network in the network background colour.
+PAGE_STYLE: Final = Template("""<style>
+            body {
+                background-color: $bgcolor;
+            }
+
+            .card, #mynetwork {
+                border: none !important;
+            }
+        </style>""")
+
+_SCRIPT_ESCAPES: Final[Dict[str, str]] = {"<": "\\u003c", ">": "\\u003e", "&": "\\u0026"}
+_SCRIPT_UNSAFE: Final = re.compile("[<>&]")
+
 
 class DottedTemplate(Template):
     idpattern = r"(?a:[_a-z][_a-z0-9_.]*)"
@@ -79,5 +149,65 @@ class TemplateLoader:
         return dict(items)
 
 
+def vis_network_html(
+    nodes: Any,
+    edges: Any,
+    options: Any,
+    *,
+    height: str = "600px",
+    width: str = "100%",
+    bgcolor: str = "#ffffff",
+    heading: str = "",
+    cdn_resources: str = "remote",
+) -> str:
+    """
+    A standalone page drawing a vis-network graph. ``nodes``, ``edges`` and ``options``
+    are serialized to JSON once, straight into the page. With ``cdn_resources`` set to
+    ``"in_line"`` or ``"local"`` the vis-network script and stylesheet bundled with pyvis
+    are inlined; with ``"remote"``, or when pyvis is not installed, they are loaded from a
+    CDN. Any other value is rejected.
+    """
+    if cdn_resources not in CDN_RESOURCES:
+        raise ValueError(f"Unsupported cdn_resources {cdn_resources!r}, expected one of {', '.join(CDN_RESOURCES)}")
+
+    head_resources = _VIS_NETWORK_REMOTE
+    if cdn_resources in _INLINED_RESOURCES:
+        assets = _vis_network_assets()
+        if assets is None:
+            logger.warning("pyvis is not installed; loading vis-network from %s instead", _VIS_NETWORK_CDN)
+        else:
+            style, script = assets
+            head_resources = f"<style>{style}</style>\n        <script>{script}</script>"
+
+    return VIS_NETWORK_HTML.substitute(
+        resources=head_resources,
+        page_style=PAGE_STYLE.substitute(bgcolor=bgcolor),
+        bgcolor=bgcolor,
+        width=width,
+        height=height,
+        heading=f"<h1>{heading}</h1>" if heading else "",
+        nodes=script_json(nodes),
+        edges=script_json(edges),
+        options=script_json(options),
+    )
+
+
+def script_json(value: Any) -> str:
+    """``value`` as JSON that can be embedded in a ``<script>`` element."""
+    return _SCRIPT_UNSAFE.sub(lambda match: _SCRIPT_ESCAPES[match.group()], json.dumps(value))
+
+
+@cache
+def _vis_network_assets() -> Optional[Tuple[str, str]]:
+    try:
+        directory = resources.files("pyvis") / "templates" / "lib" / f"vis-{VIS_NETWORK_VERSION}"
+    except ModuleNotFoundError:
+        return None
+
+    style = (directory / "vis-network.css").read_text(encoding="utf-8")
+    script = (directory / "vis-network.min.js").read_text(encoding="utf-8")
+    return style, script
+
+
 def flatten_dict(nested: Dict[str, Any], parent_key: str = "", sep: str = ".") -> Dict[str, str]:
     return TemplateLoader.flatten_dict(nested, parent_key, sep)
@@ -58,6 +58,18 @@ class TestFailOnCycle:
         with pytest.raises(PDADependencyCycleError, match="cycle"):
             _analyze("cyclic_two", fail_on_cycle=True)
 
+    def test_fail_on_cycle_stops_at_first_loop(self) -> None:
+        with pytest.raises(PDADependencyCycleError, match="Import cycle detected: ") as error:
+            _analyze("cyclic_three", fail_on_cycle=True)
+
+        loop = str(error.value).removeprefix("Import cycle detected: ").split(" -> ")
+        assert loop[0] == loop[-1]
+        assert set(loop) == {"cyclic_three.a", "cyclic_three.b", "cyclic_three.c"}
+
+    def test_collapsed_graph_is_checked_after_traversal(self) -> None:
+        with pytest.raises(PDADependencyCycleError, match="Detected 1 import cycle group"):
+            _analyze("cyclic_three", fail_on_cycle=True, collapse_level=1)
+
 
 class TestCycleReportConfig:
     def test_examples_zero_keeps_membership(self) -> None:
@@ -67,6 +79,19 @@ class TestCycleReportConfig:
         assert report["components"][0]["examples"] == []
         assert len(report["components"][0]["modules"]) == 3
 
+    def test_report_suggests_edges_to_cut(self) -> None:
+        report = build_cycle_report(_analyze("cyclic_three"), length_bound=8, max_examples=5, time_budget=1.0)
+
+        component = report["components"][0]
+        assert report["feedback_arc_count"] == 1
+        assert len(component["feedback_arcs"]) == 1
+        assert component["examples"] == [["cyclic_three.a", "cyclic_three.b", "cyclic_three.c"]]
+        assert not component["truncated"]
+
+    def test_invalid_cycle_time_budget_rejected(self) -> None:
+        with pytest.raises(ValueError, match="cycle_time_budget"):
+            ModuleImportsAnalyzerConfig(cycle_time_budget=0)
+
     def test_invalid_cycle_length_bound_rejected(self) -> None:
         with pytest.raises(ValueError, match="cycle_length_bound"):
             ModuleImportsAnalyzerConfig(cycle_length_bound=0)
@@ -97,6 +122,8 @@ class TestCli:
                 "cyclic_two",
                 "--cycles-output",
                 str(cycles),
+                "--cycle-time-budget",
+                "0.5",
                 "--output",
                 str(tmp_path / "graph.json"),
             ]
@@ -106,6 +133,7 @@ class TestCli:
         report = json.loads(cycles.read_text(encoding="utf-8"))
         assert report["cycle_count"] >= 1
         assert any("cyclic_two.a" in component["modules"] for component in report["components"])
+        assert report["feedback_arc_count"] == 1
 
     def test_fail_on_cycle_exit_code(self, tmp_path: Path) -> None:
         code = cli.main(
@@ -113,3 +141,28 @@ class TestCli:
         )
 
         assert code == 1
+
+    def test_cycles_command_reads_saved_graph(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        graph = tmp_path / "graph.json"
+        expected = tmp_path / "expected.json"
+        cli.main(["analyze", str(PACKAGES), "cyclic_two", "--output", str(graph), "--cycles-output", str(expected)])
+        capsys.readouterr()
+
+        report = tmp_path / "report.json"
+        code = cli.main(["cycles", str(graph), "--output", str(report), "--fail-on-cycle"])
+
+        assert code == 1
+        assert json.loads(report.read_text(encoding="utf-8")) == json.loads(expected.read_text(encoding="utf-8"))
+        assert "to break: cyclic_two.b -> cyclic_two.a" in capsys.readouterr().out
+        assert cli.main(["cycles", str(graph)]) == 0
+
+    def test_render_matches_direct_html(self, tmp_path: Path) -> None:
+        graph = tmp_path / "graph.json"
+        direct = tmp_path / "direct.html"
+        cli.main(["analyze", str(PACKAGES), "cyclic_three", "--output", str(graph)])
+        cli.main(["analyze", str(PACKAGES), "cyclic_three", "--output", str(direct), "--layout", "package_ring"])
+
+        code = cli.main(["render", str(graph), "--output", str(tmp_path / "rendered.html"), "--layout", "package_ring"])
+
+        assert code == 0
+        assert (tmp_path / "rendered.html").read_text(encoding="utf-8") == direct.read_text(encoding="utf-8")
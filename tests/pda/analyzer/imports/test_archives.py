@@ -0,0 +1,33 @@
+import zipfile
+from pathlib import Path
+from typing import Set, Tuple
+
+from pda.analyzer import ModuleImportsAnalyzer
+from pda.config import ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModuleScanConfig
+
+
+def _edges(analyzer: ModuleImportsAnalyzer) -> Set[Tuple[str, str]]:
+    return {(source.module.qualified_name, target.module.qualified_name) for source, target in analyzer.graph.edges}
+
+
+def test_imports_of_zipped_dependency_are_followed(tmp_path: Path) -> None:
+    archive = tmp_path / "dependencies.zip"
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr("zipped_dep/__init__.py", "import zipped_dep.inner\n")
+        bundle.writestr("zipped_dep/inner.py", "import json\n")
+
+    package = tmp_path / "project" / "zip_app"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("import zipped_dep\n")
+
+    config = ModuleImportsAnalyzerConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=1, external_depth=None),
+        resolution=ModuleResolutionConfig(external_roots=(archive,), include_sys_path=False),
+    )
+    analyzer = ModuleImportsAnalyzer(config, project_root=tmp_path / "project", root_module_name="zip_app")
+    analyzer(package / "__init__.py")
+
+    assert analyzer.modules["zipped_dep.inner"].available
+    assert {("zip_app", "zipped_dep"), ("zipped_dep", "zipped_dep.inner"), ("zipped_dep.inner", "json")} <= _edges(
+        analyzer
+    )
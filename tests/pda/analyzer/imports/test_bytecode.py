@@ -0,0 +1,160 @@
+import os
+import py_compile
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from pda.analyzer import ModuleImportsAnalyzer
+from pda.analyzer.imports.parser import BytecodeImportParser, ImportStatementParser
+from pda.config import ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModuleScanConfig
+from pda.specification import ImportScope, ImportStatement
+
+SOURCE = """\
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+
+try:
+    import json
+except ImportError:
+    json = None
+
+
+def load():
+    from .sibling import helper
+    return helper
+
+
+class Loader:
+    import csv
+
+
+with open(__file__) as handle:
+    import shutil
+
+if __name__ == "__main__":
+    import argparse
+"""
+
+
+def _compile(filepath: Path) -> Path:
+    return Path(py_compile.compile(str(filepath), doraise=True))
+
+
+def _scopes(statements: List[ImportStatement]) -> Dict[str, ImportScope]:
+    scopes: Dict[str, ImportScope] = {}
+    for statement in statements:
+        name = statement.path.name or statement.path.module
+        assert name is not None
+        scope = ImportScope.NONE
+        for item in statement.scopes:
+            scope |= item
+
+        scopes[name] = scope
+
+    return scopes
+
+
+def _key(statement: ImportStatement) -> Tuple[Optional[str], int, Optional[str], int]:
+    return statement.path.module, statement.path.level, statement.path.name, statement.span.lineno
+
+
+def _edges(analyzer: ModuleImportsAnalyzer) -> Set[Tuple[str, str]]:
+    return {(source.module.qualified_name, target.module.qualified_name) for source, target in analyzer.graph.edges}
+
+
+class TestBytecodeImportParser:
+    def test_cached_bytecode_matches_source_imports(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "module.py"
+        filepath.write_text(SOURCE)
+        _compile(filepath)
+        parser = BytecodeImportParser(ImportStatementParser())
+
+        assert parser.load(filepath) is not None
+        statements = parser(filepath)
+
+        expected = ImportStatementParser()(filepath)
+        assert [_key(item) for item in statements] == [_key(item) for item in expected]
+
+    def test_scopes_are_recovered(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "module.py"
+        filepath.write_text(SOURCE)
+        _compile(filepath)
+
+        scopes = _scopes(BytecodeImportParser(ImportStatementParser())(filepath))
+
+        assert scopes["os"] == ImportScope.NONE
+        assert scopes["OrderedDict"] & ImportScope.TYPE_CHECKING
+        assert scopes["json"] & ImportScope.TRY
+        assert scopes["helper"] & ImportScope.FUNCTION
+        assert scopes["csv"] & ImportScope.CLASS
+        assert scopes["shutil"] == ImportScope.NONE
+        assert scopes["argparse"] & ImportScope.MAIN
+
+    def test_stale_bytecode_falls_back_to_source(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "module.py"
+        filepath.write_text("import os\n")
+        _compile(filepath)
+        filepath.write_text("import os\nimport json\n")
+        stat = filepath.stat()
+        os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+        parser = BytecodeImportParser(ImportStatementParser())
+
+        assert parser.load(filepath) is None
+        assert [item.path.module for item in parser(filepath)] == ["os", "json"]
+
+    def test_sourceless_bytecode_is_read(self, tmp_path: Path) -> None:
+        source = tmp_path / "module.py"
+        source.write_text("import os\n")
+        compiled = tmp_path / "module.pyc"
+        py_compile.compile(str(source), cfile=str(compiled), doraise=True)
+        source.unlink()
+
+        statements = BytecodeImportParser(ImportStatementParser())(compiled)
+
+        assert [item.path.module for item in statements] == ["os"]
+
+    def test_level_and_fromlist_are_read(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "module.py"
+        filepath.write_text("from . import x\nfrom a import b\nfrom ..c import d, e\n")
+        _compile(filepath)
+        parser = BytecodeImportParser(ImportStatementParser())
+
+        assert parser.load(filepath) is not None
+        assert [(item.path.module, item.path.level, item.path.name) for item in parser(filepath)] == [
+            (None, 1, "x"),
+            ("a", 0, "b"),
+            ("c", 2, "d"),
+            ("c", 2, "e"),
+        ]
+
+    def test_corrupt_bytecode_falls_back_to_source(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "module.py"
+        filepath.write_text("import os\n")
+        cache = _compile(filepath)
+        cache.write_bytes(cache.read_bytes()[:16] + b"\xe3\x00")
+        parser = BytecodeImportParser(ImportStatementParser())
+
+        assert parser.load(filepath) is None
+        assert [item.path.module for item in parser(filepath)] == ["os"]
+
+
+def test_sourceless_module_is_analyzed(tmp_path: Path) -> None:
+    package = tmp_path / "project" / "pyc_app"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("import pyc_app.compiled\n")
+    source = package / "compiled.py"
+    source.write_text("import json\n")
+    py_compile.compile(str(source), cfile=str(package / "compiled.pyc"), doraise=True)
+    source.unlink()
+
+    config = ModuleImportsAnalyzerConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=1),
+        resolution=ModuleResolutionConfig(include_sys_path=False),
+        read_bytecode=True,
+    )
+    analyzer = ModuleImportsAnalyzer(config, project_root=tmp_path / "project", root_module_name="pyc_app")
+    analyzer(package / "__init__.py")
+
+    assert {("pyc_app", "pyc_app.compiled"), ("pyc_app.compiled", "json")} <= _edges(analyzer)
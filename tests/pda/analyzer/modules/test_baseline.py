@@ -0,0 +1,178 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from pda import cli
+from pda.analyzer import ModulesCollector
+from pda.analyzer.modules.baseline import InventoryBaseline, InventoryDelta
+from pda.config import ModuleResolutionConfig, ModuleScanConfig, ModulesCollectorConfig
+
+
+def _document(nodes: Dict[str, int], links: Any = (), fingerprints: Any = None) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"directed": True}
+    if fingerprints is not None:
+        data["graph"] = {"fingerprints": fingerprints}
+
+    data["nodes"] = [
+        {"id": name, "label": name, "category": "external", "level": level} for name, level in nodes.items()
+    ]
+    data["links"] = [{"source": source, "target": target} for source, target in links]
+    return data
+
+
+@pytest.fixture
+def environment(tmp_path: Path) -> Path:
+    external_root = tmp_path / "site-packages"
+    for name in ("alpha_dep", "beta_dep"):
+        package = external_root / name
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "core.py").write_text("")
+
+    project = tmp_path / "project" / "app_pkg"
+    project.mkdir(parents=True)
+    (project / "__init__.py").write_text("")
+    return tmp_path
+
+
+def _collector(environment: Path, *, fingerprint_packages: bool = True, **kwargs: Any) -> ModulesCollector:
+    config = ModulesCollectorConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=0, external_depth=None, hide_unavailable=False),
+        resolution=ModuleResolutionConfig(external_roots=(environment / "site-packages",), include_sys_path=False),
+        fingerprint_packages=fingerprint_packages,
+    )
+    return ModulesCollector(config, project_root=environment / "project", root_module_name="app_pkg", **kwargs)
+
+
+class TestInventoryBaseline:
+    def test_merge_carries_reused_packages_only(self) -> None:
+        baseline = InventoryBaseline.from_dict(
+            _document(
+                {"alpha": 0, "alpha.core": 1, "beta": 0, "beta.old": 1},
+                links=[("alpha", "alpha.core"), ("beta", "beta.old")],
+                fingerprints={"alpha": "a", "beta": "b"},
+            )
+        )
+        fresh = _document({"beta": 0, "beta.new": 1}, links=[("beta", "beta.new")], fingerprints={"alpha": "a"})
+
+        merged = baseline.merge(fresh, {"alpha"})
+
+        assert [node["id"] for node in merged["nodes"]] == ["alpha", "beta", "alpha.core", "beta.new"]
+        assert {(link["source"], link["target"]) for link in merged["links"]} == {
+            ("alpha", "alpha.core"),
+            ("beta", "beta.new"),
+        }
+
+    def test_delta_reports_modules_and_packages(self) -> None:
+        baseline = InventoryBaseline.from_dict(
+            _document({"alpha": 0, "beta": 0, "beta.old": 1}, fingerprints={"alpha": "a", "beta": "b"})
+        )
+        current = _document({"alpha": 1, "beta": 0, "gamma": 0}, fingerprints={"alpha": "a", "beta": "c", "gamma": "g"})
+
+        delta = InventoryDelta.between(baseline, current)
+
+        assert delta.added == ["gamma"]
+        assert delta.removed == ["beta.old"]
+        assert delta.changed == ["alpha"]
+        assert delta.packages == {"added": ["gamma"], "removed": [], "changed": ["beta"]}
+
+    def test_missing_fingerprints_rescan_everything(self) -> None:
+        assert InventoryBaseline.from_dict(_document({"alpha": 0})).fingerprints == {}
+
+
+class TestIncrementalCollection:
+    def test_fingerprints_are_exported(self, environment: Path) -> None:
+        data = _collector(environment)().to_dict()
+
+        assert {"alpha_dep", "beta_dep"} <= set(data["graph"]["fingerprints"])
+
+    def test_packages_are_not_fingerprinted_by_default(self, environment: Path) -> None:
+        collector = _collector(environment, fingerprint_packages=False)
+
+        assert "fingerprints" not in collector().to_dict().get("graph", {})
+        assert collector.fingerprints == {}
+
+    def test_baseline_enables_fingerprints(self, environment: Path) -> None:
+        collector = _collector(environment, fingerprint_packages=False, known_fingerprints={})
+        collector()
+
+        assert {"alpha_dep", "beta_dep"} <= set(collector.fingerprints)
+
+    def test_distribution_is_fingerprinted_by_record(self, environment: Path) -> None:
+        site_packages = environment / "site-packages"
+        dist_info = site_packages / "beta_dep-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text("Name: beta_dep\nVersion: 1.0\n")
+        record = dist_info / "RECORD"
+        record.write_text("beta_dep/__init__.py,,\nbeta_dep/core.py,,\nbeta_dep-1.0.dist-info/RECORD,,\n")
+        first = _collector(environment)
+        first()
+
+        (site_packages / "beta_dep" / "core.py").write_text("x = 1")
+        unchanged = _collector(environment, known_fingerprints=first.fingerprints)
+        unchanged()
+        record.write_text(record.read_text() + "beta_dep/extra.py,,\n")
+        upgraded = _collector(environment, known_fingerprints=first.fingerprints)
+        upgraded()
+
+        assert "beta_dep" in unchanged.reused_packages
+        assert "beta_dep" not in upgraded.reused_packages
+        assert "alpha_dep" in upgraded.reused_packages
+
+    def test_unchanged_packages_are_reused(self, environment: Path) -> None:
+        first = _collector(environment)
+        first()
+
+        second = _collector(environment, known_fingerprints=first.fingerprints)
+        names = {node.module.qualified_name for node in second()}
+
+        assert {"alpha_dep", "beta_dep"} <= second.reused_packages
+        assert not {"alpha_dep", "beta_dep"} & names
+
+    def test_changed_package_is_rescanned(self, environment: Path) -> None:
+        first = _collector(environment)
+        first()
+        (environment / "site-packages" / "beta_dep" / "extra.py").write_text("")
+
+        second = _collector(environment, known_fingerprints=first.fingerprints)
+        names = {node.module.qualified_name for node in second()}
+
+        assert "alpha_dep" in second.reused_packages
+        assert "beta_dep" not in second.reused_packages
+        assert "alpha_dep" not in names
+        assert "beta_dep" in names
+
+    def test_cli_writes_merged_graph_and_delta(self, environment: Path) -> None:
+        arguments = [
+            "collect",
+            str(environment / "project"),
+            "app_pkg",
+            "--stdlib-depth",
+            "0",
+            "--external-roots",
+            str(environment / "site-packages"),
+            "--no-include-sys-path",
+        ]
+        previous = environment / "previous.json"
+        assert cli.main([*arguments, "--fingerprint-packages", "--output", str(previous)]) == 0
+        (environment / "site-packages" / "beta_dep" / "extra.py").write_text("")
+
+        current = environment / "current.json"
+        assert cli.main([*arguments, "--output", str(current), "--baseline", str(previous)]) == 0
+
+        nodes = {node["id"] for node in json.loads(current.read_text(encoding="utf-8"))["nodes"]}
+        delta = json.loads((environment / "current-delta.json").read_text(encoding="utf-8"))
+        assert {"app_pkg", "alpha_dep", "beta_dep"} <= nodes
+        assert delta["added"] == []
+        assert delta["removed"] == []
+        assert delta["packages"]["changed"] == ["beta_dep"]
+
+    def test_cli_rejects_html_baseline(self, environment: Path) -> None:
+        previous = environment / "previous.json"
+        previous.write_text(json.dumps(_document({})), encoding="utf-8")
+
+        code = cli.main(["collect", "--baseline", str(previous), "--output", str(environment / "modules.html")])
+
+        assert code == 1
@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import networkx as nx
+import pytest
+
+from pda import cli
+from pda.analyzer import ModulesCollector
+from pda.analyzer.modules.baseline import InventoryBaseline
+from pda.analyzer.modules.sink import StreamingModuleSink
+from pda.config import ModuleResolutionConfig, ModuleScanConfig, ModulesCollectorConfig
+from pda.tools.serialization import load_json
+
+
+@pytest.fixture
+def environment(tmp_path: Path) -> Path:
+    external_root = tmp_path / "site-packages"
+    for name in ("alpha_dep", "beta_dep"):
+        package = external_root / name
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "core.py").write_text("")
+
+    project = tmp_path / "project" / "app_pkg" / "sub"
+    project.mkdir(parents=True)
+    (project.parent / "__init__.py").write_text("")
+    (project.parent / "main.py").write_text("")
+    (project / "__init__.py").write_text("")
+    (project / "leaf.py").write_text("")
+    return tmp_path
+
+
+def _collector(environment: Path, **config_kwargs: Any) -> ModulesCollector:
+    config = ModulesCollectorConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=0, external_depth=None, hide_unavailable=False),
+        resolution=ModuleResolutionConfig(external_roots=(environment / "site-packages",), include_sys_path=False),
+        fingerprint_packages=True,
+        **config_kwargs,
+    )
+    return ModulesCollector(config, project_root=environment / "project", root_module_name="app_pkg")
+
+
+def _summary(data: Dict[str, Any]) -> Tuple[Set[str], Set[Tuple[str, str]]]:
+    nodes = {node["id"] for node in data["nodes"]}
+    links = {(link["source"], link["target"]) for link in data["links"]}
+    return nodes, links
+
+
+class TestStreamingCollection:
+    def test_stream_matches_in_memory_collection(self, environment: Path) -> None:
+        output = environment / "modules.json"
+
+        sink = _collector(environment).stream(output)
+
+        streamed = json.loads(output.read_text(encoding="utf-8"))
+        expected = _collector(environment)().to_dict()
+        assert _summary(streamed) == _summary(expected)
+        assert streamed["graph"] == expected["graph"]
+        assert sink.node_count == len(streamed["nodes"])
+        assert sink.link_count == len(streamed["links"])
+        assert {node["id"]: node["level"] for node in streamed["nodes"]} == {
+            node["id"]: node["level"] for node in expected["nodes"]
+        }
+
+    def test_stream_is_valid_node_link_and_baseline(self, environment: Path) -> None:
+        output = environment / "modules.json"
+        _collector(environment).stream(output)
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        graph = nx.node_link_graph(data, directed=True, multigraph=False, edges="links")
+
+        assert ("app_pkg.sub", "app_pkg.sub.leaf") in graph.edges
+        assert {"alpha_dep", "beta_dep"} <= set(InventoryBaseline.from_dict(data).fingerprints)
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_stream_compresses_by_suffix(self, environment: Path, indent: Optional[int]) -> None:
+        output = environment / "modules.json.gz"
+
+        _collector(environment).stream(output, indent=indent)
+
+        streamed = load_json(output)
+        assert _summary(streamed) == _summary(_collector(environment)().to_dict())
+        assert list(streamed) == ["directed", "nodes", "links", "graph"]
+
+    def test_collector_is_left_empty(self, environment: Path) -> None:
+        collector = _collector(environment)
+
+        collector.stream(environment / "modules.json")
+
+        assert not collector._collection
+        assert collector._graph.empty
+
+    def test_aborted_stream_leaves_previous_output(self, environment: Path) -> None:
+        output = environment / "modules.json"
+        output.write_text("previous", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with StreamingModuleSink(output) as sink:
+                sink.flush()
+                raise RuntimeError("interrupted")
+
+        assert output.read_text(encoding="utf-8") == "previous"
+        assert sorted(path.name for path in environment.iterdir()) == ["modules.json", "project", "site-packages"]
+
+    def test_stream_rejects_collapse(self, environment: Path) -> None:
+        with pytest.raises(ValueError):
+            _collector(environment, collapse_level=0).stream(environment / "modules.json")
+
+    def test_cli_streams_collection(self, environment: Path) -> None:
+        output = environment / "modules.json"
+
+        code = cli.main(
+            [
+                "collect",
+                str(environment / "project"),
+                "app_pkg",
+                "--stdlib-depth",
+                "0",
+                "--external-roots",
+                str(environment / "site-packages"),
+                "--no-include-sys-path",
+                "--stream",
+                "--output",
+                str(output),
+            ]
+        )
+
+        nodes, links = _summary(json.loads(output.read_text(encoding="utf-8")))
+        assert code == 0
+        assert {"app_pkg", "app_pkg.sub.leaf", "alpha_dep", "beta_dep"} <= nodes
+        assert ("app_pkg.sub", "app_pkg.sub.leaf") in links
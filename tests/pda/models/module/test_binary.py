@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from pda.models import MappedBackend, ModuleGraph, ModuleNode, PDAGraphFile
+from pda.models.module.binary import is_pdagraph
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+
+def _node(name: str) -> ModuleNode:
+    module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.EXTERNAL)
+    return ModuleNode(module, qualified_name=True)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    graph = ModuleGraph()
+    graph.add_edge(_node("app"), _node("core"))
+    graph.add_edge(_node("app"), _node("ünïcode"))
+    graph.add_edge(_node("core"), _node("app"))
+    graph.add_node(_node("isolated"))
+    graph.annotate_cycles()
+    graph.attributes["fingerprints"] = {"app": "1"}
+    graph.save_binary(tmp_path / "graph.pdagraph")
+    return tmp_path / "graph.pdagraph"
+
+
+class TestPDAGraphFile:
+    def test_header_and_records(self, path: Path) -> None:
+        file = PDAGraphFile(path)
+
+        assert (len(file), file.edge_count) == (4, 3)
+        assert [file.identifier(index) for index in range(len(file))] == ["app", "core", "ünïcode", "isolated"]
+        assert file.record(0) == _node("app").serialize() | {"in_cycle": True, "component": 0}
+        assert file.record(2) == _node("ünïcode").serialize()
+        assert list(file.successors(0)) == [1, 2]
+        assert list(file.edges()) == [(0, 1), (0, 2), (1, 0)]
+        assert file.attributes() == {"fingerprints": {"app": "1"}}
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        (tmp_path / "graph.json").write_text('{"nodes": []}' + " " * 100)
+
+        assert not is_pdagraph(tmp_path / "graph.json")
+        with pytest.raises(ValueError, match="Not a pdagraph file"):
+            PDAGraphFile(tmp_path / "graph.json")
+
+    def test_rejects_unknown_magic(self, path: Path) -> None:
+        data = bytearray(path.read_bytes())
+        data[:8] = b"PDAGRAFF"
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match="Not a pdagraph file"):
+            PDAGraphFile(path)
+
+    def test_close_unmaps_the_file(self, path: Path) -> None:
+        with PDAGraphFile(path) as file:
+            assert file.identifier(0) == "app"
+            assert not file.closed
+
+        assert file.closed
+        with pytest.raises(ValueError):
+            file.identifier(0)
+
+        file.close()
+
+    def test_cannot_be_compressed(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="cannot be compressed"):
+            ModuleGraph().save_binary(tmp_path / "graph.pdagraph.gz")
+
+
+class TestMappedBackend:
+    def test_nodes_are_decoded_on_demand(self, path: Path) -> None:
+        backend = MappedBackend(PDAGraphFile(path))
+
+        assert len(backend) == 4
+        assert backend.has_edge(_node("core"), _node("app"))
+        assert not backend.has_edge(_node("app"), _node("isolated"))
+        assert not backend.has_node(_node("missing"))
+        assert backend._nodes == [None] * 4
+
+    def test_networkx_view(self, path: Path) -> None:
+        graph = ModuleGraph.load_binary(path)
+
+        assert graph.has_cycles
+        assert [node.label for node in graph.nodes] == ["app", "core", "ünïcode", "isolated"]
+        assert graph.attributes == {"fingerprints": {"app": "1"}}
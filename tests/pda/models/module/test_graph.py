@@ -1,11 +1,15 @@
 import json
+import shutil
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Any, List, Optional, Set, Tuple
 
 import networkx as nx
+import pytest
 
+from pda.analyzer import ModuleImportsAnalyzer
+from pda.config import ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModuleScanConfig
 from pda.models import ModuleGraph, ModuleNode
-from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+from pda.specification import CategorizedModule, Module, ModuleCategory, ModuleKind, OriginType, UnavailableModule
 
 
 def _node(name: str, category: ModuleCategory = ModuleCategory.LOCAL) -> ModuleNode:
@@ -13,6 +17,16 @@ def _node(name: str, category: ModuleCategory = ModuleCategory.LOCAL) -> ModuleN
     return ModuleNode(module, qualified_name=True)
 
 
+def _distribution_node(name: str, distribution: Optional[str]) -> ModuleNode:
+    module = Module(
+        name=name,
+        kind=ModuleKind.EXTENSION,
+        origin_type=OriginType.NO_PYTHON,
+        distribution=distribution,
+    )
+    return ModuleNode(CategorizedModule(module=module, category=ModuleCategory.EXTERNAL), qualified_name=True)
+
+
 def _build_graph(edges: List[Tuple[str, str]]) -> ModuleGraph:
     graph = ModuleGraph()
     nodes = {}
@@ -86,6 +100,23 @@ class TestSimplifyLevel:
         assert _labels(collapsed) == {"pkg"}
         assert _edges(collapsed) == set()
 
+    def test_representative_is_smallest_member(self) -> None:
+        graph = _build_graph([("pkg.sub.d", "pkg.sub.c"), ("pkg.sub.c", "other.x")])
+
+        collapsed = graph.simplify(1, qualified_name=False)
+
+        representatives = {node.label: node.module.qualified_name for node in collapsed}
+        assert representatives == {"sub": "pkg.sub.c", "x": "other.x"}
+
+    def test_large_graph_collapses_in_one_pass(self) -> None:
+        edges = [(f"pkg{index % 50}.mod{index}", f"pkg{(index + 1) % 50}.mod{index + 1}") for index in range(20000)]
+        graph = _build_graph(edges)
+
+        collapsed = graph.simplify(0, sort_method="condensation")
+
+        assert len(collapsed) == 50
+        assert len(collapsed.edges) == 50
+
     def test_cyclic_collapse_does_not_raise(self) -> None:
         graph = _build_graph([("pkg.a", "other.x"), ("other.x", "pkg.a")])
 
@@ -94,6 +125,36 @@ class TestSimplifyLevel:
         assert _labels(collapsed) == {"pkg", "other"}
 
 
+class TestCollapseDistributions:
+    def test_namespace_portions_collapse_by_distribution(self) -> None:
+        app = _node("app.main")
+        protobuf = _distribution_node("google.protobuf.message", "protobuf")
+        api = _distribution_node("google.api.http", "googleapis-common-protos")
+        api_core = _distribution_node("google.api.annotations", "googleapis-common-protos")
+        graph = ModuleGraph()
+        graph.add_edge(app, protobuf)
+        graph.add_edge(app, api)
+        graph.add_edge(api, api_core)
+        graph.add_edge(api_core, protobuf)
+
+        collapsed = graph.collapse_distributions()
+
+        assert _labels(collapsed) == {"app", "protobuf", "googleapis-common-protos"}
+        assert _edges(collapsed) == {
+            ("app", "protobuf"),
+            ("app", "googleapis-common-protos"),
+            ("googleapis-common-protos", "protobuf"),
+        }
+
+    def test_modules_without_distribution_collapse_to_top_level(self) -> None:
+        graph = _build_graph([("pkg.a", "pkg.sub.b"), ("pkg.a", "other.c")])
+
+        collapsed = graph.collapse_distributions()
+
+        assert _labels(collapsed) == {"pkg", "other"}
+        assert _edges(collapsed) == {("pkg", "other")}
+
+
 class TestToDict:
     def test_node_link_structure(self) -> None:
         graph = _build_graph([("pkg.a", "pkg.b"), ("pkg.b", "other.c")])
@@ -134,3 +195,100 @@ class TestSave:
         loaded = json.loads(filepath.read_text(encoding="utf-8"))
         assert {node["id"] for node in loaded["nodes"]} == {"pkg.a", "pkg.b"}
         assert loaded["links"] == [{"source": "pkg.a", "target": "pkg.b"}]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    package = tmp_path / "project" / "proj"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("import proj.a\n")
+    (package / "a.py").write_text("import proj.b\nimport missing_dependency\n")
+    (package / "b.py").write_text("import proj.a\n")
+    return package.parent
+
+
+def _analyze(project: Path, **overrides: Any) -> ModuleGraph:
+    config = ModuleImportsAnalyzerConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=0, external_depth=0, hide_unavailable=False),
+        resolution=ModuleResolutionConfig(include_sys_path=False),
+        **overrides,
+    )
+    analyzer = ModuleImportsAnalyzer(config, project_root=project, root_module_name="proj")
+    return analyzer(project / "proj" / "__init__.py")
+
+
+class TestLoad:
+    @pytest.mark.parametrize("unify_nodes", [True, False])
+    def test_round_trip(self, project: Path, tmp_path: Path, unify_nodes: bool) -> None:
+        graph = _analyze(project, unify_nodes=unify_nodes)
+        graph.save(tmp_path / "graph.json")
+
+        loaded = ModuleGraph.load(tmp_path / "graph.json")
+
+        assert loaded.to_dict() == graph.to_dict()
+        assert (loaded.has_cycles, len(loaded), len(loaded.edges)) == (graph.has_cycles, len(graph), len(graph.edges))
+
+    def test_load_does_not_touch_the_filesystem(self, project: Path, tmp_path: Path) -> None:
+        graph = _analyze(project)
+        graph.save(tmp_path / "graph.json.gz", indent=None)
+        shutil.rmtree(project)
+
+        loaded = ModuleGraph.load(tmp_path / "graph.json.gz")
+
+        assert loaded.to_dict() == graph.to_dict()
+        assert all(node.available for node in loaded if node.module.category == ModuleCategory.LOCAL)
+
+    def test_from_dict(self) -> None:
+        graph = _build_graph([("pkg.a", "pkg.b"), ("pkg.b", "pkg.c")])
+        graph.attributes["fingerprints"] = {"pkg": "1"}
+
+        loaded = ModuleGraph.from_dict(graph.to_dict(), backend="compact")
+
+        assert loaded.backend == "compact"
+        assert loaded.to_dict() == graph.to_dict()
+
+    def test_links_may_precede_nodes(self) -> None:
+        data = {"links": [{"source": "a", "target": "b"}], "nodes": [{"id": "a"}, {"id": "b"}]}
+
+        assert _edges(ModuleGraph.from_dict(data)) == {("a", "b")}
+
+    def test_unknown_link_endpoint_rejected(self) -> None:
+        data = {"nodes": [{"id": "a"}], "links": [{"source": "a", "target": "b"}]}
+
+        with pytest.raises(ValueError, match="unknown node 'b'"):
+            ModuleGraph.from_dict(data)
+
+
+class TestBinary:
+    @pytest.mark.parametrize("unify_nodes", [True, False])
+    def test_round_trip(self, project: Path, tmp_path: Path, unify_nodes: bool) -> None:
+        graph = _analyze(project, unify_nodes=unify_nodes)
+        graph.save_binary(tmp_path / "graph.pdagraph")
+
+        loaded = ModuleGraph.load_binary(tmp_path / "graph.pdagraph")
+
+        assert loaded.to_dict() == graph.to_dict()
+        assert (loaded.has_cycles, len(loaded), len(loaded.edges)) == (graph.has_cycles, len(graph), len(graph.edges))
+
+    def test_load_detects_the_format(self, project: Path, tmp_path: Path) -> None:
+        graph = _analyze(project)
+        graph.save_binary(tmp_path / "graph.bin")
+        shutil.rmtree(project)
+
+        loaded = ModuleGraph.load(tmp_path / "graph.bin")
+
+        assert loaded.backend == "mapped"
+        assert loaded.to_dict() == graph.to_dict()
+        assert loaded.collapse_distributions().backend == "compact"
+
+    def test_changes_copy_the_file(self, tmp_path: Path) -> None:
+        graph = _build_graph([("pkg.a", "pkg.b")])
+        graph.save_binary(tmp_path / "graph.pdagraph")
+        loaded = ModuleGraph.load_binary(tmp_path / "graph.pdagraph")
+        snapshot = loaded.view()
+
+        loaded.add_edge(_node("pkg.b"), _node("pkg.c"))
+
+        assert _edges(loaded) == {("pkg.a", "pkg.b"), ("pkg.b", "pkg.c")}
+        assert _edges(snapshot) == {("pkg.a", "pkg.b")}
+        assert ModuleGraph.load_binary(tmp_path / "graph.pdagraph").to_dict() == snapshot.to_dict()
@@ -1,16 +1,21 @@
+import json
 import math
-from typing import Dict, List, Tuple
+from random import Random
+from typing import Any, Dict, List, Tuple
+
+import pytest
 
 from pda.config import LayoutConfig, RelaxationConfig, RingConfig
 from pda.models import (
     ModuleGraph,
     ModuleNode,
     PackageRingLayout,
+    RingLayoutSnapshot,
     module_layout_from_config,
     module_pyvis_converter,
 )
 from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
-from pda.structures.graph import PyVisConverter
+from pda.structures.graph import LayeredLayout, PyVisConverter
 from pda.structures.graph.layout import GraphLayout, Position
 
 
@@ -244,6 +249,84 @@ class TestPackageRingLayout:
         assert math.isclose(radii[0], radii[1], abs_tol=1e-6)
         assert math.isclose(radii[1], radii[2], abs_tol=1e-6)
 
+    def test_vectorized_sweeps_match_python(self) -> None:
+        pytest.importorskip("numpy")
+        generator = Random(1)
+        names = [f"pkg.{package}.{module}" for package in "abcde" for module in "uvwxyz"] + ["pkg", "other.x"]
+        graph = _build_graph([(generator.choice(names), generator.choice(names)) for _ in range(80)])
+        settings = dict(jitter=0.0, dependency_blend=1.0, edge_pull=1.0, order_iterations=8, nudge_passes=10)
+
+        python = _positions_by_label(PackageRingLayout(_config(ring=RingConfig(vectorized=False, **settings))), graph)
+        vectorized = _positions_by_label(
+            PackageRingLayout(_config(ring=RingConfig(vectorized=True, **settings))), graph
+        )
+
+        assert list(vectorized) == list(python)
+        for label, position in python.items():
+            assert math.dist(vectorized[label], position) < 1e-6
+
+    def test_spatial_hash_finds_every_close_pair(self) -> None:
+        generator = Random(0)
+        modules = [_node(f"pkg.m{index}") for index in range(300)]
+        points = {module: (generator.uniform(-500, 500), generator.uniform(-500, 500)) for module in modules}
+        rings = {module: generator.randrange(4) for module in modules}
+        order = {module: index for index, module in enumerate(modules)}
+        spacing = 60.0
+        grid = PackageRingLayout._spatial_hash(modules, points, rings, spacing)
+
+        for module in modules:
+            nearby = PackageRingLayout._nearby(module, points, rings, grid, spacing, order)
+            close = [
+                other
+                for ring in (rings[module] - 1, rings[module], rings[module] + 1)
+                for other in modules
+                if rings[other] == ring and math.dist(points[module], points[other]) < spacing
+            ]
+            assert [other for other in nearby if other in close] == close
+
+
+class TestLayoutSnapshot:
+    @staticmethod
+    def _layout(**settings: Any) -> PackageRingLayout:
+        return PackageRingLayout(_config(ring=RingConfig(jitter=0.0, **settings)), snapshot=RingLayoutSnapshot())
+
+    def test_unchanged_graph_keeps_every_position(self) -> None:
+        graph = _build_graph([("pkg.a", "pkg.b"), ("pkg.sub.c", "pkg.sub.d"), ("pkg.a", "other.x")])
+        layout = self._layout(repulsion=1.0)
+
+        first = _positions_by_label(layout, graph)
+        assert layout.snapshot is not None
+        snapshot = RingLayoutSnapshot.from_dict(json.loads(json.dumps(layout.snapshot.to_dict())))
+        layout.snapshot = snapshot
+
+        assert _positions_by_label(layout, graph) == first
+        assert set(snapshot.placements) == set(first)
+
+    def test_only_new_modules_are_placed(self) -> None:
+        edges = [("pkg.a", "pkg.b"), ("pkg.b", "pkg.c"), ("pkg.a", "other.x"), ("other.x", "other.y")]
+        graph = _build_graph(edges)
+        layout = self._layout()
+        first = _positions_by_label(layout, graph)
+
+        graph.add_edge(next(node for node in graph.nodes if node.label == "other.y"), _node("other.z"))
+        second = _positions_by_label(layout, graph)
+
+        fresh = _positions_by_label(self._layout(), graph)
+
+        assert second["other.z"] == fresh["other.z"]
+        kept = {label for label in first if second[label] == first[label]}
+        assert len(kept) > len({label for label in first if fresh[label] == first[label]})
+
+    def test_snapshot_of_other_settings_is_ignored(self) -> None:
+        graph = _build_graph([("pkg.a", "pkg.b"), ("pkg.a", "other.x")])
+        near = self._layout(min_radius=100.0)
+        _positions_by_label(near, graph)
+
+        far = self._layout(min_radius=700.0)
+        far.snapshot = near.snapshot
+
+        assert _positions_by_label(far, graph) == _positions_by_label(self._layout(min_radius=700.0), graph)
+
 
 class TestVisOptionsPatch:
     def test_static_disables_hierarchical_and_physics(self) -> None:
@@ -278,6 +361,11 @@ class TestModuleLayoutFactory:
 
         assert isinstance(layout, GraphLayout)
 
+    def test_layered_mode_yields_layout(self) -> None:
+        layout = module_layout_from_config(LayoutConfig(mode="layered"))
+
+        assert isinstance(layout, LayeredLayout)
+
 
 class TestModulePyVisConverter:
     def test_helper_wires_layout_from_config(self) -> None:
@@ -28,3 +28,27 @@ def test_unavailable_module_node_serializes_availability() -> None:
     assert node.available is False
     assert data["category"] == "unknown"
     assert data["available"] is False
+
+
+def test_deserialize_restores_serialized_fields() -> None:
+    for name in ("pathlib", "json", "definitely_not_a_real_module_xyz"):
+        node = ModuleNode(_runtime_module(name), ordinal=3, level=2)
+        node.in_cycle = True
+        node.component = 1
+
+        restored = ModuleNode.deserialize(node.serialize())
+
+        assert restored == node
+        assert restored.serialize() == node.serialize()
+        assert restored.key == node.key
+
+
+def test_deserialize_trusts_recorded_availability() -> None:
+    data = {"id": "pkg.gone", "label": "gone", "category": "local", "level": 1, "available": False}
+    data["origin"] = "/nowhere/pkg/gone.py"
+
+    node = ModuleNode.deserialize(data)
+
+    assert node.available is False
+    assert node.module.origin is not None
+    assert node.serialize() == data
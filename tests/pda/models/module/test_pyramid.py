@@ -0,0 +1,77 @@
+from typing import List, Tuple
+
+import pytest
+
+from pda.models import CollapsePyramid, ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+
+EDGES: List[Tuple[str, str]] = [
+    ("pkg.a", "pkg.b"),
+    ("pkg.b", "pkg.sub.c"),
+    ("pkg.sub.c", "pkg.sub.deep.d"),
+    ("pkg.sub.deep.d", "other.x"),
+    ("other.x", "pkg.a"),
+    ("other", "other.y"),
+]
+
+
+def _build_graph(edges: List[Tuple[str, str]] = EDGES) -> ModuleGraph:
+    graph = ModuleGraph()
+    nodes = {}
+    for source, target in edges:
+        for name in (source, target):
+            module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+            nodes.setdefault(name, ModuleNode(module, qualified_name=True))
+
+        graph.add_edge(nodes[source], nodes[target])
+
+    return graph
+
+
+def _summary(graph: ModuleGraph) -> Tuple[List[Tuple[str, str, int]], List[Tuple[str, str]]]:
+    nodes = [(node.label, node.module.qualified_name, node.level) for node in graph]
+    edges = [(source.label, target.label) for source, target in graph.edges]
+    return nodes, edges
+
+
+class TestCollapsePyramid:
+    @pytest.mark.parametrize("qualified_name", [True, False])
+    def test_levels_match_simplify(self, qualified_name: bool) -> None:
+        graph = _build_graph()
+
+        pyramid = CollapsePyramid(graph, qualified_name=qualified_name, sort_method="condensation")
+
+        assert pyramid.max_level == 3
+        for level in range(pyramid.max_level + 1):
+            expected = graph.simplify(level, qualified_name=qualified_name, sort_method="condensation")
+            assert _summary(pyramid[level]) == _summary(expected)
+
+    def test_levels_are_built_once_on_demand(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        built: List[int] = []
+        materialize = CollapsePyramid._materialize
+        monkeypatch.setattr(
+            CollapsePyramid,
+            "_materialize",
+            lambda self, level: built.append(len(level.keys)) or materialize(self, level),
+        )
+        pyramid = CollapsePyramid(_build_graph(), sort_method="condensation")
+
+        assert not built
+        assert pyramid[1] is pyramid[1]
+        assert {node.label for node in pyramid[0]} == {"pkg", "other"}
+        assert len(built) == 2
+
+    def test_levels_beyond_depth_are_clamped(self) -> None:
+        pyramid = CollapsePyramid(_build_graph(), sort_method="condensation")
+
+        assert pyramid[10] is pyramid[pyramid.max_level]
+
+    def test_negative_level_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            CollapsePyramid(_build_graph(), sort_method="condensation")[-1]
+
+    def test_empty_graph(self) -> None:
+        pyramid = CollapsePyramid(ModuleGraph())
+
+        assert len(pyramid) == 1
+        assert pyramid[0].empty
@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple
+
+import pytest
+
+from pda.analyzer import ModuleImportsAnalyzer
+from pda.config import ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModuleScanConfig
+from pda.models import ModuleGraph
+
+
+@pytest.fixture
+def diamond(tmp_path: Path) -> Path:
+    package = tmp_path / "diamond"
+    package.mkdir()
+    (package / "__init__.py").write_text("import diamond.left\nimport diamond.right\n")
+    (package / "left.py").write_text("import diamond.base\n")
+    (package / "right.py").write_text("import diamond.base\n")
+    (package / "base.py").write_text("import diamond.leaf\n")
+    (package / "leaf.py").write_text("")
+    return tmp_path
+
+
+def _analyzer(project: Path, **overrides: Any) -> ModuleImportsAnalyzer:
+    config = ModuleImportsAnalyzerConfig(
+        module_scan=ModuleScanConfig(stdlib_depth=0, external_depth=0),
+        resolution=ModuleResolutionConfig(include_sys_path=False),
+        unify_nodes=False,
+        **overrides,
+    )
+    return ModuleImportsAnalyzer(config, project_root=project, root_module_name="diamond")
+
+
+def _links(graph: ModuleGraph) -> Set[Tuple[str, str]]:
+    return {(link["source"], link["target"]) for link in graph.to_dict()["links"]}
+
+
+def _levels(graph: ModuleGraph) -> Dict[str, int]:
+    return {node["id"]: node["level"] for node in graph.to_dict()["nodes"]}
+
+
+class TestModuleTree:
+    def test_one_node_per_import_path(self, diamond: Path) -> None:
+        graph = _analyzer(diamond)(diamond / "diamond" / "__init__.py")
+
+        labels = sorted(node.module.qualified_name for node in graph)
+        assert labels == ["diamond", "diamond.base", "diamond.base", "diamond.leaf", "diamond.left", "diamond.right"]
+        assert not graph.has_cycles
+        assert all(len(list(graph._graph.predecessors(node))) <= 1 for node in graph)
+
+    def test_budget_keeps_whole_levels(self, diamond: Path) -> None:
+        analyzer = _analyzer(diamond)
+        full = analyzer(diamond / "diamond" / "__init__.py")
+        tree = analyzer.tree
+        assert tree is not None and len(tree) == len(full)
+
+        cut = tree.materialize(max_nodes=5)
+
+        assert max(_levels(cut).values()) == 2
+        assert _links(cut) <= _links(full)
+        assert set(_levels(cut)) <= set(_levels(full))
+
+    def test_depth_limit(self, diamond: Path) -> None:
+        analyzer = _analyzer(diamond)
+        analyzer(diamond / "diamond" / "__init__.py")
+        assert analyzer.tree is not None
+
+        assert len(analyzer.tree.materialize(max_depth=1)) == 3
+        assert len(analyzer.tree.materialize(max_depth=0)) == 1
+
+    def test_budget_from_config(self, diamond: Path) -> None:
+        graph = _analyzer(diamond, tree_node_budget=3)(diamond / "diamond" / "__init__.py")
+
+        assert len(graph) == 3
+
+    def test_unified_analyzer_has_no_tree(self, diamond: Path) -> None:
+        config = ModuleImportsAnalyzerConfig(
+            module_scan=ModuleScanConfig(stdlib_depth=0, external_depth=0),
+            resolution=ModuleResolutionConfig(include_sys_path=False),
+        )
+        analyzer = ModuleImportsAnalyzer(config, project_root=diamond, root_module_name="diamond")
+        analyzer(diamond / "diamond" / "__init__.py")
+
+        assert analyzer.tree is None
@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import Sequence
+
+from pda.resolution import ModuleResolutionService, TargetEnvironment
+from pda.resolution.distributions import DistributionIndex
+
+
+def _install(root: Path, name: str, files: Sequence[str] = (), top_level: Sequence[str] = ()) -> None:
+    metadata = root / f"{name.replace('-', '_')}-1.0.dist-info"
+    metadata.mkdir(parents=True)
+    (metadata / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+    if files:
+        (metadata / "RECORD").write_text("".join(f"{file},,\n" for file in files))
+    if top_level:
+        (metadata / "top_level.txt").write_text("\n".join(top_level))
+
+    for file in files:
+        path = root / file
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+
+def _environment(root: Path) -> TargetEnvironment:
+    return TargetEnvironment.create((), external_roots=(root,))
+
+
+class TestDistributionIndex:
+    def test_namespace_portions_map_to_their_distributions(self, tmp_path: Path) -> None:
+        _install(tmp_path, "proto-dist", files=["google/protobuf/__init__.py", "google/protobuf/message.py"])
+        _install(tmp_path, "api-dist", files=["google/api/__init__.py", "google/api/http.py"])
+
+        index = DistributionIndex.build([str(tmp_path)])
+
+        assert index.distribution("google.protobuf.message") == "proto-dist"
+        assert index.distribution("google.api") == "api-dist"
+        assert index.distribution("google") is None
+
+    def test_ignores_metadata_and_bytecode_files(self, tmp_path: Path) -> None:
+        _install(
+            tmp_path,
+            "plain-dist",
+            files=[
+                "plain/__init__.py",
+                "plain/__pycache__/__init__.cpython-313.pyc",
+                "plain_dist-1.0.dist-info/RECORD",
+            ],
+        )
+
+        index = DistributionIndex.build([str(tmp_path)])
+
+        assert len(index) == 1
+        assert index.distribution("plain.anything") == "plain-dist"
+
+    def test_top_level_is_used_without_record(self, tmp_path: Path) -> None:
+        _install(tmp_path, "legacy-dist", top_level=["legacy"])
+
+        index = DistributionIndex.build([str(tmp_path)])
+
+        assert index.distribution("legacy.sub") == "legacy-dist"
+
+    def test_index_is_cached_per_environment_snapshot(self, tmp_path: Path) -> None:
+        _install(tmp_path, "first-dist", files=["first/__init__.py"])
+        environment = _environment(tmp_path)
+
+        index = DistributionIndex.for_environment(environment)
+        assert DistributionIndex.for_environment(environment) is index
+
+        _install(tmp_path, "second-dist", files=["second/__init__.py"])
+        refreshed = DistributionIndex.for_environment(environment)
+
+        assert refreshed is not index
+        assert refreshed.distribution("second") == "second-dist"
+
+    def test_resolved_external_modules_carry_distribution(self, tmp_path: Path) -> None:
+        _install(tmp_path, "tagged-dist", files=["tagged_pkg/__init__.py", "tagged_pkg/core.py"])
+        resolver = ModuleResolutionService(_environment(tmp_path))
+
+        module = resolver.to_categorized_module(resolver.resolve_name("tagged_pkg.core"))
+
+        assert module.distribution == "tagged-dist"
@@ -0,0 +1,196 @@
+import json
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from pda.config import GraphSortMethod
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+from pda.tools.serialization import load_json
+
+EDGES: List[Tuple[str, str]] = [
+    ("pkg.a", "pkg.b"),
+    ("pkg.b", "pkg.c"),
+    ("pkg.c", "pkg.a"),
+    ("pkg.c", "other"),
+]
+
+
+def _node(name: str) -> ModuleNode:
+    module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+    return ModuleNode(module, qualified_name=True)
+
+
+def _build_graph(edges: List[Tuple[str, str]] = EDGES) -> ModuleGraph:
+    graph = ModuleGraph()
+    nodes = {}
+    for source, target in edges:
+        nodes.setdefault(source, _node(source))
+        nodes.setdefault(target, _node(target))
+        graph.add_edge(nodes[source], nodes[target])
+
+    return graph
+
+
+class TestGraphMemo:
+    def test_structural_changes_bump_version(self) -> None:
+        graph = _build_graph()
+        version = graph.version
+
+        graph.add_node(_node("pkg.a"))
+        assert graph.version == version
+
+        graph.add_node(_node("new"))
+        assert graph.version > version
+
+        version = graph.version
+        graph.add_edge(_node("pkg.a"), _node("pkg.b"))
+        assert graph.version == version
+
+        graph.add_edge(_node("pkg.b"), _node("pkg.a"))
+        assert graph.version > version
+
+        version = graph.version
+        graph.update_node(_node("new"), color="red")
+        assert graph.version == version
+
+        graph.sort(method="condensation")
+        assert graph.version > version
+
+        version = graph.version
+        graph.clear()
+        assert graph.version > version
+
+    def test_analyses_are_computed_once_per_version(self) -> None:
+        graph = _build_graph()
+
+        with (
+            patch("networkx.is_directed_acyclic_graph", wraps=nx.is_directed_acyclic_graph) as acyclic,
+            patch("networkx.strongly_connected_components", wraps=nx.strongly_connected_components) as components,
+        ):
+            assert graph.has_cycles
+            assert graph.has_cycles
+            graph.annotate_cycles()
+            graph.condensation()
+
+            assert acyclic.call_count == 1
+            assert components.call_count == 1
+
+    def test_sort_reuses_analyses(self) -> None:
+        graph = _build_graph()
+
+        with (
+            patch("networkx.is_directed_acyclic_graph", wraps=nx.is_directed_acyclic_graph) as acyclic,
+            patch("networkx.strongly_connected_components", wraps=nx.strongly_connected_components) as components,
+        ):
+            graph.sort(method="auto")
+            graph.annotate_cycles()
+            assert graph.has_cycles
+
+            assert acyclic.call_count == 1
+            assert components.call_count == 1
+
+    def test_change_invalidates_memo(self) -> None:
+        graph = _build_graph([("a", "b"), ("b", "c")])
+        assert graph.is_acyclic
+        assert graph.topological_order() == (_node("a"), _node("b"), _node("c"))
+
+        graph.add_edge(_node("c"), _node("a"))
+
+        assert graph.has_cycles
+        assert [len(component) for component in graph.strongly_connected_components()] == [3]
+        assert graph.condensation().number_of_nodes() == 1
+
+
+class TestGraphView:
+    def test_view_shares_storage_until_mutated(self) -> None:
+        graph = _build_graph()
+        view = graph.view()
+
+        assert view._backend is graph._backend
+        assert view.to_dict() == graph.to_dict()
+
+        view.add_edge(_node("other"), _node("new"))
+
+        assert view._backend is not graph._backend
+        assert not graph.has_node(_node("new"))
+        assert view.has_edge(_node("other"), _node("new"))
+
+    def test_owner_mutation_does_not_leak_into_view(self) -> None:
+        graph = _build_graph()
+        view = graph.view()
+        snapshot = view.to_dict()
+
+        graph.add_edge(_node("other"), _node("new"))
+        graph.attributes["key"] = "value"
+
+        assert view.to_dict() == snapshot
+        assert graph.has_node(_node("new"))
+
+    def test_node_attributes_are_read_only(self) -> None:
+        graph = _build_graph()
+        node = _node("other")
+        view = graph.view()
+
+        with pytest.raises(TypeError):
+            graph.nodes[node]["key"] = "value"  # type: ignore[index]
+
+        view.update_node(node, key="value")
+
+        assert view.nodes[node]["key"] == "value"
+        assert "key" not in graph.nodes[node]
+
+    def test_view_reuses_memoized_analyses(self) -> None:
+        graph = _build_graph()
+        assert graph.has_cycles
+
+        with patch("networkx.is_directed_acyclic_graph", wraps=nx.is_directed_acyclic_graph) as acyclic:
+            assert graph.view().has_cycles
+
+        assert acyclic.call_count == 0
+
+    def test_sort_does_not_copy_acyclic_graph(self) -> None:
+        graph = _build_graph([("a", "b"), ("b", "c")])
+        storage = graph._graph
+
+        graph.sort(method="topological")
+
+        assert graph._graph is storage
+        assert [node.level for node in graph] == [0, 1, 2]
+
+
+class TestGraphSort:
+    @pytest.mark.parametrize("method", ["levels", "topological", "condensation"])
+    def test_levels_are_longest_paths(self, method: GraphSortMethod) -> None:
+        graph = _build_graph([("c", "b"), ("b", "a"), ("c", "a"), ("a", "d")])
+
+        graph.sort(method=method)
+
+        assert {node.label: node.level for node in graph} == {"c": 0, "b": 1, "a": 2, "d": 3}
+
+    def test_cycle_members_share_a_level(self) -> None:
+        graph = _build_graph()
+
+        graph.sort(method="levels")
+
+        assert {node.label: node.level for node in graph} == {"pkg.a": 0, "pkg.b": 0, "pkg.c": 0, "other": 1}
+
+
+class TestGraphSave:
+    def test_indented_save_matches_to_dict(self, tmp_path: Path) -> None:
+        graph = _build_graph()
+        graph.attributes["fingerprints"] = {"pkg": "1"}
+
+        graph.save(tmp_path / "graph.json")
+
+        assert (tmp_path / "graph.json").read_text(encoding="utf-8") == json.dumps(graph.to_dict(), indent=2)
+
+    def test_compact_compressed_save(self, tmp_path: Path) -> None:
+        graph = _build_graph()
+
+        graph.save(tmp_path / "graph.json.xz", indent=None)
+
+        assert load_json(tmp_path / "graph.json.xz") == graph.to_dict()
@@ -0,0 +1,155 @@
+from pathlib import Path
+from random import Random
+from typing import Any, List, Tuple
+
+import networkx as nx
+import pytest
+
+from pda.analyzer import ModuleImportsAnalyzer
+from pda.config import GraphBackendType, ModuleImportsAnalyzerConfig, ModuleResolutionConfig, ModuleScanConfig
+from pda.models import ModuleGraph, ModuleNode
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+from pda.structures.graph.compact import CompactBackend
+
+EDGES: List[Tuple[str, str]] = [
+    ("pkg.a", "pkg.b"),
+    ("pkg.b", "pkg.sub.c"),
+    ("pkg.a", "other.x"),
+    ("other.x", "pkg.b"),
+    ("pkg.a", "pkg.sub.c"),
+]
+
+
+def _node(name: str) -> ModuleNode:
+    module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+    return ModuleNode(module, qualified_name=True)
+
+
+def _build_graph(backend: GraphBackendType, edges: List[Tuple[str, str]] = EDGES) -> ModuleGraph:
+    graph = ModuleGraph(backend=backend)
+    nodes = {}
+    for source, target in edges:
+        nodes.setdefault(source, _node(source))
+        nodes.setdefault(target, _node(target))
+        graph.add_edge(nodes[source], nodes[target])
+        graph.add_edge(nodes[source], nodes[target])
+
+    return graph
+
+
+class TestCompactBackend:
+    def test_matches_networkx_backend(self) -> None:
+        compact = _build_graph("compact")
+        reference = _build_graph("networkx")
+
+        assert compact.backend == "compact"
+        assert len(compact) == len(reference)
+        assert compact.to_dict() == reference.to_dict()
+        assert list(compact.edges) == list(reference.edges)
+
+    def test_membership(self) -> None:
+        graph = _build_graph("compact")
+
+        assert graph.has_node(_node("pkg.sub.c"))
+        assert graph.has_edge(_node("other.x"), _node("pkg.b"))
+        assert not graph.has_edge(_node("pkg.b"), _node("other.x"))
+        assert not graph.has_node(_node("missing"))
+
+    def test_edges_added_after_freeze(self) -> None:
+        backend: CompactBackend[ModuleNode] = CompactBackend()
+        a, b, c = _node("a"), _node("b"), _node("c")
+        backend.add_edge(a, b)
+        backend.freeze()
+
+        backend.add_edge(a, b)
+        assert backend.frozen
+        backend.add_edge(c, a)
+
+        assert not backend.frozen
+        assert list(backend.edges()) == [(a, b), (c, a)]
+        assert backend.number_of_edges() == 2
+
+    def test_node_attributes_are_columnar(self) -> None:
+        graph = _build_graph("compact")
+        graph.update_node(_node("pkg.b"), color="red")
+        graph.attributes["key"] = "value"
+
+        view = graph.nodes
+        assert view[_node("pkg.b")] == {"color": "red"}
+        assert view[_node("pkg.a")] == {}
+        assert graph.to_dict()["graph"] == {"key": "value"}
+
+    def test_copy_is_independent(self) -> None:
+        graph = _build_graph("compact")
+        copied = graph.copy()
+
+        copied.add_edge(_node("pkg.sub.c"), _node("new"))
+
+        assert copied.backend == "compact"
+        assert len(copied) == len(graph) + 1
+        assert not graph.has_node(_node("new"))
+
+    def test_algorithms_run_on_compact_graph(self) -> None:
+        graph = _build_graph("compact", [*EDGES, ("pkg.sub.c", "pkg.a")])
+
+        graph.sort(method="auto")
+        collapsed = graph.simplify(0, sort_method="condensation")
+
+        assert graph.backend == "compact"
+        assert graph.has_cycles
+        assert collapsed.backend == "compact"
+        assert {node.label for node in collapsed} == {"pkg", "other"}
+        assert nx.is_isomorphic(graph._graph, _build_graph("networkx", [*EDGES, ("pkg.sub.c", "pkg.a")])._graph)
+
+    def test_components_and_levels_match_networkx(self) -> None:
+        generator = Random(0)
+        names = [f"pkg.module{index}" for index in range(60)]
+        edges = [(generator.choice(names), generator.choice(names)) for _ in range(150)]
+        acyclic = [(source, target) for source, target in edges if source < target]
+
+        for pair in (edges, acyclic):
+            compact = _build_graph("compact", pair)
+            reference = _build_graph("networkx", pair)
+
+            assert compact.is_acyclic == reference.is_acyclic
+            assert set(compact.strongly_connected_components()) == set(reference.strongly_connected_components())
+
+        compact._backend.freeze()
+        assert compact._backend.levels() == _build_graph("networkx", acyclic)._backend.levels()
+
+    def test_pipeline_does_not_build_networkx_graph(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def unexpected(*_: Any) -> nx.DiGraph:
+            raise AssertionError("networkx graph built")
+
+        graph = _build_graph("compact", [*EDGES, ("pkg.sub.c", "pkg.a")])
+        reference = _build_graph("networkx", [*EDGES, ("pkg.sub.c", "pkg.a")])
+        reference.sort(method="auto")
+        reference.annotate_cycles()
+        monkeypatch.setattr(CompactBackend, "networkx", unexpected)
+
+        graph.sort(method="auto")
+        graph.annotate_cycles()
+
+        assert graph.has_cycles
+        assert graph.to_dict() == reference.to_dict()
+
+
+def test_analyzer_builds_compact_graph(tmp_path: Path) -> None:
+    package = tmp_path / "compact_app"
+    package.mkdir()
+    (package / "__init__.py").write_text("from compact_app import a, b\n")
+    (package / "a.py").write_text("import json\nfrom compact_app import b\n")
+    (package / "b.py").write_text("import json\nimport os\n")
+
+    graphs = {}
+    for backend in ("networkx", "compact"):
+        config = ModuleImportsAnalyzerConfig(
+            module_scan=ModuleScanConfig(stdlib_depth=1),
+            resolution=ModuleResolutionConfig(include_sys_path=False),
+            graph_backend=backend,
+        )
+        analyzer = ModuleImportsAnalyzer(config, project_root=tmp_path, root_module_name="compact_app")
+        graphs[backend] = analyzer(package / "__init__.py")
+
+    assert graphs["compact"].backend == "compact"
+    assert graphs["compact"].to_dict() == graphs["networkx"].to_dict()
@@ -0,0 +1,127 @@
+import json
+import re
+from typing import Any, List, Tuple
+
+import pytest
+from pyvis.network import Network
+
+from pda.models import ModuleGraph, ModuleNode, PackageRingLayout
+from pda.specification import CategorizedModule, Module, ModuleCategory, ModuleKind, OriginType, UnavailableModule
+from pda.structures.graph import PyVisConverter
+from pda.tools.templates import script_json
+
+
+def _node(name: str, *, available: bool = True) -> ModuleNode:
+    module: Any = UnavailableModule(name=name)
+    if available:
+        module = Module(name=name, kind=ModuleKind.SOURCE_MODULE, origin_type=OriginType.NONE)
+
+    return ModuleNode(CategorizedModule(module=module, category=ModuleCategory.LOCAL), qualified_name=True)
+
+
+def _graph(edges: List[Tuple[str, str]]) -> ModuleGraph:
+    graph = ModuleGraph()
+    for source, target in edges:
+        graph.add_edge(_node(source), _node(target, available=target != "pkg.missing"))
+
+    return graph
+
+
+def _data_sets(html: str) -> List[Any]:
+    return [json.loads(match) for match in re.findall(r"new vis\.DataSet\((.*)\);", html)]
+
+
+@pytest.fixture
+def graph() -> ModuleGraph:
+    return _graph([("pkg", "pkg.a"), ("pkg.a", "pkg.b"), ("pkg", "pkg.missing")])
+
+
+class TestPyVisConverter:
+    @pytest.mark.parametrize("ring", [False, True])
+    def test_network_data_matches_pyvis(self, graph: ModuleGraph, ring: bool) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter()
+        if ring:
+            converter.layout = PackageRingLayout(converter.config.layout)
+
+        result = converter.layout.compute(graph) if converter.layout is not None else None
+        data = converter.network_data(graph, result, font_color=converter.network_kwargs.get("font_color"))
+
+        network = Network(directed=True, **converter.network_kwargs)
+        ids = {node: index for index, node in enumerate(sorted(graph.nodes))}
+        for node, index in ids.items():
+            network.add_node(index, **converter._build_node_properties(node, result))
+
+        for source, target in graph.edges:
+            network.add_edge(ids[source], ids[target], **converter._build_edge_properties(graph, source, target))
+
+        assert json.dumps(data.nodes) == json.dumps(network.nodes)
+        assert json.dumps(data.edges) == json.dumps(network.edges)
+
+    def test_options_are_resolved_once(self, graph: ModuleGraph, monkeypatch: pytest.MonkeyPatch) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter()
+        expected = converter.network_data(graph)
+        reads: List[None] = []
+        vis_options = PyVisConverter.vis_options
+        monkeypatch.setattr(
+            PyVisConverter, "vis_options", property(lambda self: reads.append(None) or vis_options.fget(self))
+        )
+
+        data = converter.network_data(graph)
+
+        assert len(reads) == 1
+        assert data == expected
+
+    def test_html_is_rendered_from_the_data(self, graph: ModuleGraph) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(network_kwargs={"cdn_resources": "in_line"})
+        data = converter.network_data(graph)
+
+        html = converter(graph, html=True)
+
+        assert _data_sets(html) == [data.nodes, data.edges]
+        assert "vis-network" in html and "cdnjs" not in html
+
+    def test_remote_resources(self, graph: ModuleGraph) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(network_kwargs={"cdn_resources": "remote"})
+
+        html = converter(graph, html=True)
+
+        assert "cdnjs.cloudflare.com/ajax/libs/vis-network" in html and len(html) < 100_000
+
+    def test_local_resources_are_inlined(self, graph: ModuleGraph) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(network_kwargs={"cdn_resources": "local"})
+
+        html = converter(graph, html=True)
+
+        assert "vis-network" in html and "cdnjs" not in html
+
+    def test_unknown_resources_rejected(self, graph: ModuleGraph) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(network_kwargs={"cdn_resources": "bundled"})
+
+        with pytest.raises(ValueError, match="Unsupported cdn_resources 'bundled'"):
+            converter(graph, html=True)
+
+    def test_pyvis_only_options_use_pyvis(self, graph: ModuleGraph) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(network_kwargs={"select_menu": True})
+
+        html = converter(graph, html=True)
+
+        assert 'id="select-node"' in html
+        assert isinstance(converter(graph), Network)
+
+    @pytest.mark.parametrize("select_menu", [False, True])
+    def test_background_style_in_head(self, graph: ModuleGraph, select_menu: bool) -> None:
+        converter: PyVisConverter[ModuleNode] = PyVisConverter(
+            network_kwargs={"bgcolor": "#123456", "select_menu": select_menu}
+        )
+
+        html = converter(graph, html=True)
+
+        head = html[: html.index("</head>")]
+        assert "background-color: #123456;" in head
+        assert "border: none !important;" in head
+
+    def test_data_cannot_close_the_script(self) -> None:
+        encoded = script_json({"title": "</script><script>alert(1)</script> & more"})
+
+        assert "<" not in encoded and ">" not in encoded and "&" not in encoded
+        assert json.loads(encoded) == {"title": "</script><script>alert(1)</script> & more"}
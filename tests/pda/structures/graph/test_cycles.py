@@ -0,0 +1,75 @@
+import itertools
+import random
+import time
+from typing import List
+
+import networkx as nx
+import pytest
+
+from pda.structures.graph import cycles
+from pda.structures.graph.cycles import feedback_arcs, shortest_cycles
+
+
+def _members(graph: nx.DiGraph) -> List[int]:
+    return sorted(graph)
+
+
+class TestShortestCycles:
+    def test_shortest_cycles_come_first(self) -> None:
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 3), (3, 0), (1, 0), (2, 1)])
+
+        cycles, complete = shortest_cycles(graph, _members(graph), length_bound=8, max_examples=5)
+
+        assert complete
+        assert cycles == [[0, 1], [1, 2], [0, 1, 2, 3]]
+
+    def test_length_bound_and_limit(self) -> None:
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 2)])
+
+        assert shortest_cycles(graph, _members(graph), length_bound=2, max_examples=5)[0] == [[2, 3]]
+        assert shortest_cycles(graph, _members(graph), length_bound=8, max_examples=1)[0] == [[2, 3]]
+
+    def test_expired_deadline_is_reported(self) -> None:
+        graph = nx.DiGraph([(0, 1), (1, 0)])
+
+        cycles, complete = shortest_cycles(
+            graph, _members(graph), length_bound=8, max_examples=5, deadline=time.monotonic() - 1
+        )
+
+        assert cycles == []
+        assert not complete
+
+    def test_deadline_during_last_search_is_reported(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+        clock = itertools.count()
+        monkeypatch.setattr(cycles, "_DEADLINE_CHECK_INTERVAL", 1)
+        monkeypatch.setattr(cycles.time, "monotonic", lambda: next(clock))
+
+        # Each member costs one check before its search and one per node it pops (three
+        # here), so the clock reads 8 before the last search and passes 9.5 inside it.
+        found, complete = shortest_cycles(graph, _members(graph), length_bound=8, max_examples=5, deadline=9.5)
+
+        assert found == [[0, 1, 2]]
+        assert not complete
+
+
+class TestFeedbackArcs:
+    def test_single_back_edge(self) -> None:
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 3), (3, 0)])
+
+        arcs = feedback_arcs(graph, _members(graph))
+
+        assert len(arcs) == 1
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_removal_makes_graph_acyclic(self, seed: int) -> None:
+        generator = random.Random(seed)
+        graph = nx.DiGraph()
+        graph.add_edges_from(tuple(generator.sample(range(40), 2)) for _ in range(160))
+
+        arcs = feedback_arcs(graph, _members(graph))
+
+        pruned = graph.copy()
+        pruned.remove_edges_from(arcs)
+        assert nx.is_directed_acyclic_graph(pruned)
+        assert len(arcs) <= graph.number_of_edges() // 2
@@ -0,0 +1,52 @@
+import random
+
+import networkx as nx
+import pytest
+
+from pda.structures.graph.incremental import IncrementalCycleDetector
+
+
+class TestIncrementalCycleDetector:
+    def test_acyclic_edges_are_accepted(self) -> None:
+        detector: IncrementalCycleDetector[str] = IncrementalCycleDetector()
+
+        for source, target in [("c", "d"), ("a", "b"), ("b", "c"), ("a", "d")]:
+            assert detector.add_edge(source, target) is None
+
+        assert len(detector) == 4
+
+    def test_closing_edge_reports_the_loop(self) -> None:
+        detector: IncrementalCycleDetector[str] = IncrementalCycleDetector()
+        detector.add_edge("a", "b")
+        detector.add_edge("b", "c")
+        detector.add_edge("x", "a")
+
+        assert detector.add_edge("c", "a") == ["a", "b", "c"]
+        assert detector.add_edge("c", "x") == ["x", "a", "b", "c"]
+
+    def test_rejected_edge_is_not_recorded(self) -> None:
+        detector: IncrementalCycleDetector[str] = IncrementalCycleDetector()
+        detector.add_edge("a", "b")
+
+        assert detector.add_edge("b", "a") == ["a", "b"]
+        assert detector.add_edge("a", "b") is None
+
+    def test_self_loop(self) -> None:
+        assert IncrementalCycleDetector[str]().add_edge("a", "a") == ["a"]
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_networkx(self, seed: int) -> None:
+        generator = random.Random(seed)
+        detector: IncrementalCycleDetector[int] = IncrementalCycleDetector()
+        graph = nx.DiGraph()
+        for _ in range(300):
+            source, target = generator.sample(range(60), 2)
+            cycle = detector.add_edge(source, target)
+            graph.add_edge(source, target)
+            if nx.is_directed_acyclic_graph(graph):
+                assert cycle is None
+                continue
+
+            assert cycle is not None and cycle[0] == target and cycle[-1] == source
+            assert all(graph.has_edge(a, b) for a, b in zip(cycle, cycle[1:]))
+            graph.remove_edge(source, target)
@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from pda.config import LayeredConfig, LayoutConfig
+from pda.models import ModuleGraph, ModuleNode, module_pyvis_converter
+from pda.specification import CategorizedModule, ModuleCategory, UnavailableModule
+from pda.structures.graph import LayeredLayout
+from pda.structures.graph.layout import Position
+
+
+def _graph(edges: List[Tuple[str, str]]) -> ModuleGraph:
+    graph = ModuleGraph()
+    nodes: Dict[str, ModuleNode] = {}
+    for source, target in edges:
+        for name in (source, target):
+            module = CategorizedModule(module=UnavailableModule(name=name), category=ModuleCategory.LOCAL)
+            nodes.setdefault(name, ModuleNode(module, qualified_name=True))
+
+        graph.add_edge(nodes[source], nodes[target])
+
+    graph.sort()
+    return graph
+
+
+def _positions(graph: ModuleGraph, **settings: Any) -> Dict[str, Position]:
+    layout: LayeredLayout[ModuleNode] = LayeredLayout(LayoutConfig(mode="layered", layered=LayeredConfig(**settings)))
+    result = layout.compute(graph)
+    assert result is not None
+    return {node.label: position for node, position in result.positions.items()}
+
+
+class TestLayeredLayout:
+    def test_levels_become_layers(self) -> None:
+        graph = _graph([("pkg", "pkg.a"), ("pkg", "pkg.b"), ("pkg.a", "pkg.c")])
+
+        positions = _positions(graph, level_separation=200.0, node_spacing=40.0)
+
+        assert {label: x for label, (x, _) in positions.items()} == {
+            "pkg": 0.0,
+            "pkg.a": 200.0,
+            "pkg.b": 200.0,
+            "pkg.c": 400.0,
+        }
+        assert sorted(y for label, (_, y) in positions.items() if label in ("pkg.a", "pkg.b")) == [-20.0, 20.0]
+
+    def test_sweeps_remove_crossings(self) -> None:
+        graph = _graph([("pkg.a", "pkg.d"), ("pkg.b", "pkg.c")])
+
+        crossed = _positions(graph, crossing_sweeps=0)
+        swept = _positions(graph)
+
+        assert crossed["pkg.c"][1] < crossed["pkg.d"][1]
+        assert swept["pkg.d"][1] < swept["pkg.c"][1]
+
+    @pytest.mark.parametrize(
+        ("direction", "expected"),
+        [("LR", (250.0, 0.0)), ("RL", (-250.0, 0.0)), ("UD", (0.0, 250.0)), ("DU", (0.0, -250.0))],
+    )
+    def test_direction(self, direction: str, expected: Position) -> None:
+        positions = _positions(_graph([("pkg", "pkg.a")]), direction=direction)
+
+        assert positions["pkg.a"] == expected
+
+    def test_empty_graph_returns_none(self) -> None:
+        layout: LayeredLayout[ModuleNode] = LayeredLayout(LayoutConfig(mode="layered"))
+
+        assert layout.compute(ModuleGraph()) is None
+
+    def test_browser_layout_is_off(self) -> None:
+        converter = module_pyvis_converter(layout="layered")
+        assert isinstance(converter.layout, LayeredLayout)
+        graph = _graph([("pkg", "pkg.a"), ("pkg.a", "pkg")])
+
+        data = converter.network_data(graph, converter.layout.compute(graph))
+
+        assert data.options["layout"]["hierarchical"]["enabled"] is False
+        assert data.options["physics"] == {"enabled": False, "stabilization": {"enabled": False}}
+        assert all("x" in node and "y" in node for node in data.nodes)
@@ -0,0 +1,51 @@
+import random
+from typing import Dict, List, Tuple
+
+import networkx as nx
+import pytest
+
+from pda.structures.graph.leveling import condensation_levels, graph_levels, longest_path_levels
+
+
+def _reference_levels(graph: nx.DiGraph) -> Dict[int, int]:
+    levels = dict.fromkeys(graph, 0)
+    for node in nx.topological_sort(graph):
+        for successor in graph.successors(node):
+            levels[successor] = max(levels[successor], levels[node] + 1)
+
+    return levels
+
+
+def _random_dag(count: int, edges: int, seed: int) -> List[Tuple[int, int]]:
+    generator = random.Random(seed)
+    pairs = (sorted(generator.sample(range(count), 2)) for _ in range(edges))
+    return [(source, target) for source, target in pairs]
+
+
+class TestLongestPathLevels:
+    def test_chain_and_shortcut(self) -> None:
+        levels = longest_path_levels(4, [(0, 1), (1, 2), (0, 2), (2, 3)])
+
+        assert list(levels) == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference(self, seed: int) -> None:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(200))
+        graph.add_edges_from(_random_dag(200, 600, seed))
+
+        assert graph_levels(graph) == _reference_levels(graph)
+
+    def test_isolated_nodes(self) -> None:
+        assert list(longest_path_levels(3, [])) == [0, 0, 0]
+
+    def test_cycle_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            longest_path_levels(2, [(0, 1), (1, 0)])
+
+    def test_condensation_levels(self) -> None:
+        graph = nx.DiGraph([("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("a", "d")])
+
+        levels = condensation_levels(nx.condensation(graph))
+
+        assert levels == {"a": 0, "b": 0, "c": 1, "d": 2}
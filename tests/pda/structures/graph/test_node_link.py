@@ -0,0 +1,105 @@
+import io
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from pda.structures.graph import node_link
+from pda.structures.graph.node_link import CHUNK_SIZE, NodeLinkWriter, read_node_link, write_node_link
+
+
+def _document(nodes: List[Dict[str, Any]], links: List[Dict[str, Any]], **attributes: Any) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"directed": True}
+    if attributes:
+        data["graph"] = attributes
+
+    data["nodes"] = nodes
+    data["links"] = links
+    return data
+
+
+def _write(nodes: List[Dict[str, Any]], links: List[Dict[str, Any]], indent: Optional[int], **attributes: Any) -> str:
+    file = io.StringIO()
+    write_node_link(file, nodes, links, attributes=attributes or None, indent=indent)
+    return file.getvalue()
+
+
+NODES = [
+    {"id": "a", "label": "a", "level": 0},
+    {"id": "b", "label": "b", "level": 1, "details": {"origin": "b.py", "tags": [1, 2]}},
+]
+LINKS = [{"source": "a", "target": "b"}]
+
+
+class TestNodeLinkWriter:
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_indented_matches_json_dump(self, indent: int) -> None:
+        expected = json.dumps(_document(NODES, LINKS, fingerprints={"x": "1"}), indent=indent)
+
+        assert _write(NODES, LINKS, indent, fingerprints={"x": "1"}) == expected
+
+    def test_compact_has_no_whitespace(self) -> None:
+        expected = json.dumps(_document(NODES, LINKS), separators=(",", ":"))
+
+        assert _write(NODES, LINKS, None) == expected
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_empty_arrays(self, indent: Optional[int]) -> None:
+        assert json.loads(_write([], [], indent)) == _document([], [])
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_items_span_chunks(self, indent: Optional[int]) -> None:
+        nodes = [{"id": str(index)} for index in range(2 * CHUNK_SIZE + 3)]
+
+        assert json.loads(_write(nodes, LINKS, indent)) == _document(nodes, LINKS)
+
+    def test_members_keep_given_order(self) -> None:
+        file = io.StringIO()
+        writer = NodeLinkWriter(file)
+        writer.array("nodes", NODES)
+        writer.begin("links")
+        writer.item(LINKS[0])
+        writer.flush()
+        assert file.getvalue().endswith(json.dumps(LINKS[0], separators=(",", ":")))
+
+        writer.end()
+        writer.field("graph", {"k": 1})
+        writer.close()
+
+        assert list(json.loads(file.getvalue())) == ["directed", "nodes", "links", "graph"]
+
+    def test_member_inside_open_array_is_rejected(self) -> None:
+        writer = NodeLinkWriter(io.StringIO())
+        writer.begin("nodes")
+
+        with pytest.raises(ValueError):
+            writer.field("graph", {})
+
+    def test_item_outside_array_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            NodeLinkWriter(io.StringIO()).item({})
+
+
+class TestReadNodeLink:
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_reads_what_the_writer_wrote(self, indent: Optional[int], monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(node_link, "READ_SIZE", 5)
+        text = _write(NODES, LINKS, indent, fingerprints={"x": 12345})
+
+        members = list(read_node_link(io.StringIO(text)))
+
+        assert members == [
+            ("directed", True),
+            ("graph", {"fingerprints": {"x": 12345}}),
+            *(("nodes", node) for node in NODES),
+            *(("links", link) for link in LINKS),
+        ]
+
+    def test_any_member_order_and_whitespace(self) -> None:
+        text = '{ "links" : [ ] ,\n "nodes": [ {"id": "a"} ], "multigraph": false }'
+
+        assert list(read_node_link(io.StringIO(text))) == [("nodes", {"id": "a"}), ("multigraph", False)]
+
+    def test_truncated_document_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            list(read_node_link(io.StringIO('{"nodes": [{"id": "a"}')))
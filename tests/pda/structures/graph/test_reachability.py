@@ -0,0 +1,87 @@
+import random
+from typing import List, Tuple
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from pda.structures.graph import Graph
+from pda.structures.graph.reachability import ReachabilityIndex
+
+
+def _index(edges: List[Tuple[str, str]]) -> ReachabilityIndex[str]:
+    return ReachabilityIndex(nx.DiGraph(edges))
+
+
+class TestReachabilityIndex:
+    def test_reaches_along_paths(self) -> None:
+        index = _index([("a", "b"), ("b", "c"), ("a", "d")])
+
+        assert index.reaches("a", "c")
+        assert index.reaches("a", "d")
+        assert not index.reaches("c", "a")
+        assert not index.reaches("b", "d")
+
+    def test_node_reaches_itself_only_on_a_cycle(self) -> None:
+        index = _index([("a", "b"), ("b", "c"), ("c", "b")])
+
+        assert not index.reaches("a", "a")
+        assert index.reaches("b", "b")
+        assert index.reaches("c", "b")
+
+    def test_self_loop_is_a_cycle(self) -> None:
+        index = _index([("a", "a"), ("a", "b")])
+
+        assert index.reaches("a", "a")
+        assert index.closure("a") == ["a", "b"]
+
+    def test_closure(self) -> None:
+        index = _index([("a", "b"), ("b", "c"), ("c", "b"), ("x", "c")])
+
+        assert index.closure("a") == ["b", "c"]
+        assert index.closure("b") == ["b", "c"]
+        assert index.closure_size("x") == 2
+        assert index.closure("c") == ["b", "c"]
+
+    def test_common(self) -> None:
+        index = _index([("a", "c"), ("b", "c"), ("c", "d"), ("a", "e")])
+
+        assert index.common("a", "b") == ["c", "d"]
+        assert index.common("a") == ["c", "d", "e"]
+        assert index.common() == []
+
+    def test_membership(self) -> None:
+        index = _index([("a", "b")])
+
+        assert "a" in index
+        assert "z" not in index
+        assert len(index) == 2
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_networkx(self, seed: int) -> None:
+        graph = nx.gnp_random_graph(60, 0.04, seed=seed, directed=True)
+        index: ReachabilityIndex[int] = ReachabilityIndex(graph)
+        cyclic = {
+            node for component in nx.strongly_connected_components(graph) if len(component) > 1 for node in component
+        }
+        cyclic |= {node for node in graph if graph.has_edge(node, node)}
+
+        for node in random.Random(seed).sample(list(graph), 20):
+            expected = nx.descendants(graph, node) | ({node} if node in cyclic else set())
+            assert set(index.closure(node)) == expected
+            assert index.closure_size(node) == len(expected)
+
+
+class TestGraphReachability:
+    def test_memoized_per_version(self) -> None:
+        graph: Graph[str] = Graph()
+        graph.add_edge("a", "b")
+
+        with patch("pda.structures.graph.base.ReachabilityIndex", wraps=ReachabilityIndex) as build:
+            first = graph.reachability()
+            assert graph.reachability() is first
+            assert build.call_count == 1
+
+            graph.add_edge("b", "c")
+            assert graph.reachability().reaches("a", "c")
+            assert build.call_count == 2
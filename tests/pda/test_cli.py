@@ -1,3 +1,4 @@
+import gzip
 import json
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
@@ -323,6 +324,10 @@ class TestFormatResolution:
         with pytest.raises(ValueError, match="Unsupported output extension"):
             output.resolve_format(Path("graph.txt"), "html")
 
+    def test_compression_suffix_is_skipped(self) -> None:
+        assert output.resolve_format(Path("graph.json.gz"), None) == "json"
+        assert output.resolve_format(Path("graph.html.xz"), None) == "html"
+
     def test_missing_extension_defaults_to_format_or_json(self) -> None:
         assert output.resolve_format(Path("graph"), None) == "json"
         assert output.resolve_format(Path("graph"), "html") == "html"
@@ -332,6 +337,20 @@ class TestFormatResolution:
         assert output.resolve_output(None, "html", "mypkg-imports") == (Path("mypkg-imports.html"), "html")
 
 
+class TestJsonOutput:
+    def test_compact_compressed_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = _graph([("mypkg.a", "mypkg.b")])
+        _patch(monkeypatch, "ModuleImportsAnalyzer", graph)
+        _write_package_root(tmp_path)
+        output = tmp_path / "graph.json.gz"
+
+        code = cli.main(["analyze", str(tmp_path), "mypkg", "--output", str(output), "--compact"])
+
+        assert code == 0
+        text = gzip.decompress(output.read_bytes()).decode("utf-8")
+        assert "\n" not in text and json.loads(text) == graph.to_dict()
+
+
 class TestHtmlOutput:
     def test_analyze_writes_self_contained_html(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         _patch(monkeypatch, "ModuleImportsAnalyzer", _graph([("mypkg.a", "mypkg.b")]))
@@ -378,3 +397,83 @@ class TestHtmlOutput:
 
         assert code == 0
         assert "<html" in output.read_text(encoding="utf-8").lower()
+
+
+class TestQuery:
+    @pytest.fixture
+    def graph_path(self, tmp_path: Path) -> Path:
+        path = tmp_path / "graph.json"
+        _graph([("app", "core"), ("core", "util"), ("app", "cli"), ("cli", "core")]).save(path)
+        return path
+
+    def test_reach(self, graph_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert cli.main(["query", "reach", str(graph_path), "app", "util"]) == 0
+        assert capsys.readouterr().out == "app imports util\n"
+
+        assert cli.main(["query", "reach", str(graph_path), "util", "app"]) == 1
+        assert capsys.readouterr().out == "util does not import app\n"
+
+    def test_closure(self, graph_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert cli.main(["query", "closure", str(graph_path), "cli"]) == 0
+        assert capsys.readouterr().out == "2\n"
+
+        assert cli.main(["query", "closure", str(graph_path), "app", "--list"]) == 0
+        assert capsys.readouterr().out.splitlines() == ["3", "cli", "core", "util"]
+
+    def test_unknown_module_returns_one(self, graph_path: Path) -> None:
+        assert cli.main(["query", "reach", str(graph_path), "app", "missing"]) == 1
+
+    def test_reads_binary_graph(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / "graph.pdagraph"
+        _graph([("app", "core"), ("core", "util")]).save_binary(path)
+
+        assert cli.main(["query", "closure", str(path), "app", "--list"]) == 0
+        assert capsys.readouterr().out.splitlines() == ["2", "core", "util"]
+
+    def test_reads_compressed_graph(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / "graph.json.xz"
+        _graph([("app", "core")]).save(path, indent=None)
+
+        assert cli.main(["query", "closure", str(path), "app"]) == 0
+        assert capsys.readouterr().out == "1\n"
+
+
+class TestRender:
+    def test_binary_round_trip(self, tmp_path: Path) -> None:
+        graph = _graph([("app", "core"), ("core", "util")])
+        graph.save(tmp_path / "graph.json")
+
+        assert cli.main(["render", str(tmp_path / "graph.json"), "-o", str(tmp_path / "graph.pdagraph")]) == 0
+        assert cli.main(["render", str(tmp_path / "graph.pdagraph"), "-o", str(tmp_path / "copy.json")]) == 0
+        assert json.loads((tmp_path / "copy.json").read_text(encoding="utf-8")) == graph.to_dict()
+
+    def test_layout_cache_keeps_positions(self, tmp_path: Path) -> None:
+        _graph([("app", "app.core"), ("app.core", "app.util")]).save(tmp_path / "graph.json")
+        cache = tmp_path / "positions.json"
+        arguments = ["render", str(tmp_path / "graph.json"), "--layout", "package_ring", "--layout-cache", str(cache)]
+
+        assert cli.main([*arguments, "-o", str(tmp_path / "first.html")]) == 0
+        placements = json.loads(cache.read_text(encoding="utf-8"))["placements"]
+        assert cli.main([*arguments, "-o", str(tmp_path / "second.html")]) == 0
+
+        assert set(placements) == {"app", "app.core", "app.util"}
+        assert (tmp_path / "first.html").read_text(encoding="utf-8") == (tmp_path / "second.html").read_text(
+            encoding="utf-8"
+        )
+
+    def test_defaults_to_html_next_to_stem(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _graph([("app", "core")]).save(tmp_path / "graph.json.gz")
+        monkeypatch.chdir(tmp_path)
+
+        assert cli.main(["render", str(tmp_path / "graph.json.gz")]) == 0
+        assert "<html" in (tmp_path / "graph.html").read_text(encoding="utf-8").lower()
+
+    def test_json_output_follows_extension(self, tmp_path: Path) -> None:
+        graph = _graph([("app", "core")])
+        graph.save(tmp_path / "graph.json")
+
+        assert cli.main(["render", str(tmp_path / "graph.json"), "-o", str(tmp_path / "copy.json"), "--compact"]) == 0
+        assert json.loads((tmp_path / "copy.json").read_text(encoding="utf-8")) == graph.to_dict()
+
+    def test_missing_graph_returns_one(self, tmp_path: Path) -> None:
+        assert cli.main(["render", str(tmp_path / "missing.json")]) == 1
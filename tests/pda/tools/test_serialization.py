@@ -0,0 +1,28 @@
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+from pda.tools.serialization import load_json, save_json, strip_compression
+
+
+class TestCompression:
+    @pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.xz", ".json.lzma"])
+    def test_round_trip(self, tmp_path: Path, suffix: str) -> None:
+        filepath = tmp_path / f"graph{suffix}"
+
+        save_json({"nodes": [1, 2]}, filepath)
+
+        assert load_json(filepath) == {"nodes": [1, 2]}
+
+    def test_suffix_selects_compression(self, tmp_path: Path) -> None:
+        save_json({"a": 1}, tmp_path / "a.json.gz", indent=None)
+        save_json({"a": 1}, tmp_path / "a.json.xz", indent=None)
+
+        assert gzip.decompress((tmp_path / "a.json.gz").read_bytes()) == b'{"a":1}'
+        assert lzma.decompress((tmp_path / "a.json.xz").read_bytes()) == b'{"a":1}'
+
+    def test_strip_compression(self) -> None:
+        assert strip_compression("out/graph.json.gz") == Path("out/graph.json")
+        assert strip_compression("graph.json") == Path("graph.json")
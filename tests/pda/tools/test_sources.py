@@ -0,0 +1,95 @@
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pda.parser import parse_python_file
+from pda.tools.sources import SourceProvider
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    filepath = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(filepath, "w") as bundle:
+        bundle.writestr("zipped/__init__.py", "")
+        bundle.writestr("zipped/nested/module.py", "import json\n")
+        bundle.writestr("zipped/data.txt", "text")
+
+    return filepath
+
+
+class TestSourceProvider:
+    def test_answers_membership_from_archive_index(self, archive: Path) -> None:
+        sources = SourceProvider()
+
+        assert sources.is_dir(archive)
+        assert sources.is_dir(archive / "zipped" / "nested")
+        assert sources.is_python_file(archive / "zipped" / "nested" / "module.py")
+        assert not sources.is_python_file(archive / "zipped" / "data.txt")
+        assert not sources.exists(archive / "zipped" / "missing.py")
+
+    def test_reads_archived_source_without_extracting(self, archive: Path) -> None:
+        filepath = archive / "zipped" / "nested" / "module.py"
+
+        tree = parse_python_file(filepath)
+
+        assert SourceProvider().read_text(filepath) == "import json\n"
+        assert len(tree.body) == 1
+        assert not (archive.parent / "zipped").exists()
+
+    def test_archive_is_opened_once(self, archive: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        sources = SourceProvider()
+        sources.is_file(archive / "zipped" / "__init__.py")
+        monkeypatch.setattr(zipfile, "ZipFile", None)
+
+        assert sources.is_file(archive / "zipped" / "nested" / "module.py")
+
+    def test_filesystem_paths_are_not_treated_as_archives(self, tmp_path: Path) -> None:
+        module = tmp_path / "module.py"
+        module.write_text("")
+        sources = SourceProvider()
+
+        assert sources.is_python_file(module)
+        assert not sources.is_dir(module)
+        assert not sources.is_archived(tmp_path / "missing.py")
+
+    def test_archive_handles_are_released(self, archive: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        opened = []
+
+        class RecordingZipFile(zipfile.ZipFile):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                opened.append(self)
+
+        monkeypatch.setattr(zipfile, "ZipFile", RecordingZipFile)
+        sources = SourceProvider()
+        sources.clear()
+
+        assert sources.read_text(archive / "zipped" / "nested" / "module.py") == "import json\n"
+        sources.clear()
+
+        assert opened
+        assert all(handle.fp is None for handle in opened)
+
+    def test_reads_reuse_one_handle(self, archive: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        opened = []
+
+        class RecordingZipFile(zipfile.ZipFile):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                opened.append(self)
+
+        monkeypatch.setattr(zipfile, "ZipFile", RecordingZipFile)
+        sources = SourceProvider()
+        sources.clear()
+        sources.is_file(archive / "zipped" / "__init__.py")
+        indexed = len(opened)
+
+        for _ in range(3):
+            assert sources.read_text(archive / "zipped" / "nested" / "module.py") == "import json\n"
+            assert sources.read_text(archive / "zipped" / "data.txt") == "text"
+
+        assert len(opened) == indexed + 1
+        sources.clear()
+        assert opened[-1].fp is None